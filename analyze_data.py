@@ -3,49 +3,196 @@ from collections import Counter
 from datetime import datetime
 import re
 
+from exporters import export_hackathons
+from geo import country_name, record_location
+from models import Hackathon, as_record, is_online
+from prizes import prize_distribution, prize_usd
+from result_cache import ResultCache
+
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = ' \t\n\r'
+
+
+class _JsonStream:
+    """Incrementally decode JSON values from a file object"""
+
+    def __init__(self, f, chunk_size=65536):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self):
+        """Read the next chunk, dropping the already consumed part of the buffer"""
+        chunk = self.f.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """Return the next non-whitespace character without consuming it"""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, char):
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} but found {found!r} in JSON stream")
+        self.pos += 1
+
+    def value(self):
+        """Decode the next complete JSON value"""
+        self.peek()
+        while True:
+            try:
+                obj, end = _decoder.raw_decode(self.buf, self.pos)
+                # A value ending exactly at the buffer edge may be truncated
+                if end < len(self.buf) or self.eof:
+                    self.pos = end
+                    return obj
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self._fill()
+
+    def array_items(self):
+        """Yield the elements of the JSON array starting at the current position"""
+        self.expect('[')
+        if self.peek() == ']':
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            sep = self.peek()
+            self.pos += 1
+            if sep == ']':
+                return
+            if sep != ',':
+                raise ValueError(f"Expected ',' or ']' but found {sep!r} in JSON array")
+
+
+def _iter_json_records(f, chunk_size):
+    """Yield records from a JSON array or a {theme: [records]} object"""
+    stream = _JsonStream(f, chunk_size)
+    first = stream.peek()
+
+    if first == '[':
+        yield from stream.array_items()
+    elif first == '{':
+        # Output of scrape_all_themes: every theme maps to a list of hackathons
+        stream.expect('{')
+        if stream.peek() == '}':
+            stream.pos += 1
+        else:
+            while True:
+                stream.value()
+                stream.expect(':')
+                yield from stream.array_items()
+                sep = stream.peek()
+                stream.pos += 1
+                if sep == '}':
+                    break
+                if sep != ',':
+                    raise ValueError(f"Expected ',' or '}}' but found {sep!r} in JSON object")
+    elif first:
+        raise ValueError(f"Unsupported JSON document starting with {first!r}")
+
+    extra = stream.peek()
+    if extra:
+        raise ValueError(f"Unexpected {extra!r} after the end of the JSON document")
+
+
+def iter_hackathons(filename='remote_hackathons.json', fields=None, chunk_size=65536):
+    """
+    Stream hackathons from a file one record at a time
+
+    Args:
+        filename: JSON array (scrape_theme), JSON object of theme lists
+                  (scrape_all_themes) or JSON Lines file (.jsonl / .ndjson)
+        fields: Optional iterable of keys to keep, dropping everything else
+        chunk_size: Number of characters read from the file at a time
+
+    Yields:
+        Hackathon records
+    """
+    keep = tuple(fields) if fields else None
+
+    with open(filename, 'r', encoding='utf-8') as f:
+        if filename.endswith(('.jsonl', '.ndjson')):
+            records = (json.loads(line) for line in f if line.strip())
+        else:
+            records = _iter_json_records(f, chunk_size)
+
+        for record in records:
+            if keep:
+                record = {k: record[k] for k in keep if k in record}
+            yield Hackathon.from_dict(record)
+
 
 def load_hackathons(filename='remote_hackathons.json'):
     """Load hackathons from JSON file"""
-    with open(filename, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return list(iter_hackathons(filename))
 
 
 def get_statistics(hackathons):
-    """Get statistics about the hackathons"""
+    """Get statistics about the hackathons (accepts any iterable, single pass)"""
+    prize_values = []
     stats = {
-        'total': len(hackathons),
+        'total': 0,
         'status': Counter(),
         'location_type': Counter(),
         'themes': Counter(),
+        'countries': Counter(),
         'with_prizes': 0,
         'with_organizer': 0,
         'with_website': 0,
     }
 
     for h in hackathons:
+        h = as_record(h)
+        stats['total'] += 1
+
         # Count by status
-        if 'status' in h:
-            stats['status'][h['status']] += 1
+        if h.status is not None:
+            stats['status'][h.status] += 1
 
         # Count by location type
-        if 'location_type' in h:
-            stats['location_type'][h['location_type']] += 1
+        if h.location_type is not None:
+            stats['location_type'][h.location_type] += 1
 
         # Count themes
-        if 'themes' in h:
-            for theme in h['themes']:
-                stats['themes'][theme] += 1
+        if h.themes:
+            stats['themes'].update(h.themes)
+
+        # Count by country, using the normalised location codes
+        country = record_location(h).get('country_code')
+        if country and country != 'ONLINE':
+            stats['countries'][country] += 1
 
         # Count optional fields
-        if h.get('prizes') and h['prizes'] != '$0':
+        if h.prizes and h.prizes != '$0':
             stats['with_prizes'] += 1
+            usd = prize_usd(h)
+            if usd:
+                prize_values.append(usd)
 
-        if h.get('organizer'):
+        if h.organizer:
             stats['with_organizer'] += 1
 
-        if h.get('website'):
+        if h.website:
             stats['with_website'] += 1
 
+    stats['prize_distribution'] = prize_distribution(prize_values)
     return stats
 
 
@@ -53,34 +200,71 @@ def filter_hackathons(hackathons, **filters):
     """
     Filter hackathons by various criteria
 
+    Accepts any iterable (e.g. iter_hackathons) and only keeps the matches.
+
     Args:
         status: 'Upcoming', 'Open', 'Ended'
         location_type: 'ONLINE', 'IN-PERSON'
         theme: specific theme to filter by
         has_prizes: True/False
         has_website: True/False
+        min_prize: minimum prize in USD (normalised from the prize text)
+        online: True for online events, False for in-person ones
+        country: ISO 3166-1 alpha-2 country code, e.g. 'US'
 
     Returns:
-        Filtered list of hackathons
+        Filtered list of Hackathon records
     """
-    filtered = hackathons
+    # Checks read the record's slots; dicts are converted once per record
+    checks = []
 
     if 'status' in filters:
-        filtered = [h for h in filtered if h.get('status') == filters['status']]
+        checks.append(lambda h: h.status == filters['status'])
 
     if 'location_type' in filters:
-        filtered = [h for h in filtered if h.get('location_type') == filters['location_type']]
+        checks.append(lambda h: h.location_type == filters['location_type'])
 
     if 'theme' in filters:
-        filtered = [h for h in filtered if filters['theme'] in h.get('themes', [])]
+        checks.append(lambda h: filters['theme'] in (h.themes or ()))
 
     if 'has_prizes' in filters and filters['has_prizes']:
-        filtered = [h for h in filtered if h.get('prizes') and h['prizes'] != '$0']
+        checks.append(lambda h: h.prizes and h.prizes != '$0')
 
     if 'has_website' in filters and filters['has_website']:
-        filtered = [h for h in filtered if h.get('website')]
+        checks.append(lambda h: h.website)
 
-    return filtered
+    if 'min_prize' in filters:
+        checks.append(lambda h: (prize_usd(h) or 0) >= filters['min_prize'])
+
+    if 'online' in filters:
+        checks.append(lambda h: is_online(h) == filters['online'])
+
+    if 'country' in filters:
+        checks.append(lambda h: record_location(h).get('country_code') == filters['country'])
+
+    matches = []
+    for h in hackathons:
+        record = as_record(h)
+        if all(check(record) for check in checks):
+            matches.append(h)
+    return matches
+
+
+def statistics_for(filename, cache=None):
+    """get_statistics for a file, served from a ResultCache while the file is unchanged"""
+    if cache is None:
+        return get_statistics(iter_hackathons(filename))
+    return cache.get_or_compute('get_statistics', filename,
+                                lambda: get_statistics(iter_hackathons(filename)))
+
+
+def filter_file(filename, cache=None, **filters):
+    """filter_hackathons for a file, served from a ResultCache while the file is unchanged"""
+    if cache is None:
+        return filter_hackathons(iter_hackathons(filename), **filters)
+    return cache.get_or_compute('filter_hackathons', filename,
+                                lambda: filter_hackathons(iter_hackathons(filename), **filters),
+                                **filters)
 
 
 def print_statistics(stats):
@@ -102,42 +286,45 @@ def print_statistics(stats):
     for theme, count in stats['themes'].most_common(10):
         print(f"  {theme}: {count}")
 
+    if stats.get('countries'):
+        print("\nTop 10 Countries:")
+        for code, count in stats['countries'].most_common(10):
+            print(f"  {country_name(code)}: {count}")
+
     print(f"\nHackathons with Prizes: {stats['with_prizes']}")
     print(f"Hackathons with Organizer Info: {stats['with_organizer']}")
     print(f"Hackathons with Website: {stats['with_website']}")
 
+    prizes = stats.get('prize_distribution')
+    if prizes and prizes['count']:
+        print("\nPrize Money (USD):")
+        print(f"  Total: ${prizes['total_usd']:,.0f} across {prizes['count']} hackathons")
+        print(f"  Median: ${prizes['median_usd']:,.0f}  Largest: ${prizes['max_usd']:,.0f}")
+        for bucket, count in prizes['buckets'].items():
+            print(f"  {bucket}: {count}")
 
-def export_to_csv(hackathons, filename='hackathons.csv'):
-    """Export hackathons to CSV format"""
-    import csv
-
-    fieldnames = [
-        'title', 'status', 'location_type', 'dates', 'location',
-        'organizer', 'prizes', 'themes', 'website', 'detail_url'
-    ]
 
-    with open(filename, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
-        writer.writeheader()
-
-        for h in hackathons:
-            # Convert themes list to string
-            row = h.copy()
-            if 'themes' in row:
-                row['themes'] = ', '.join(row['themes'])
-            writer.writerow(row)
+def export_to_csv(hackathons, filename='hackathons.csv', **options):
+    """
+    Export hackathons to CSV format
 
-    print(f"\nData exported to {filename}")
+    Streams the records; see exporters.export_hackathons for the options
+    (gzip via a .gz filename, jsonl/parquet formats, concurrent shards).
+    """
+    files = export_hackathons(hackathons, filename, **options)
+    print(f"\nData exported to {', '.join(files)}")
 
 
 def main():
     """Main function"""
-    # Load data
+    # Each pass streams the file instead of holding every record in memory;
+    # results are reused until the file changes
+    filename = 'remote_hackathons.json'
+    cache = ResultCache()
     print("Loading hackathons...")
-    hackathons = load_hackathons()
 
     # Show statistics
-    stats = get_statistics(hackathons)
+    stats = statistics_for(filename, cache)
     print_statistics(stats)
 
     # Example filters
@@ -146,8 +333,8 @@ def main():
     print("=" * 60)
 
     # Filter for upcoming online hackathons
-    upcoming_online = filter_hackathons(
-        hackathons,
+    upcoming_online = filter_file(
+        filename, cache,
         status='Upcoming',
         location_type='ONLINE'
     )
@@ -158,7 +345,7 @@ def main():
             print(f"  - {h['title']} ({h.get('dates', 'N/A')})")
 
     # Filter for AI-themed hackathons
-    ai_hackathons = filter_hackathons(hackathons, theme='ai')
+    ai_hackathons = filter_file(filename, cache, theme='ai')
     print(f"\nAI-themed Hackathons: {len(ai_hackathons)}")
     if ai_hackathons:
         print("Sample:")
@@ -166,7 +353,7 @@ def main():
             print(f"  - {h['title']}")
 
     # Filter for hackathons with prizes
-    with_prizes = filter_hackathons(hackathons, has_prizes=True)
+    with_prizes = filter_file(filename, cache, has_prizes=True)
     print(f"\nHackathons with Prizes: {len(with_prizes)}")
     if with_prizes:
         print("Sample:")
@@ -175,7 +362,7 @@ def main():
 
     # Export to CSV
     print("\n" + "=" * 60)
-    export_to_csv(hackathons)
+    export_to_csv(iter_hackathons(filename))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,282 @@
+"""
+Read-only HTTP API over a scraped hackathon dataset
+
+The dataset is loaded once and kept in memory together with posting sets
+for the common filters, the precomputed statistics, an in-memory full-text
+index and every record pre-serialised to JSON, so a request only selects
+and concatenates bytes. Responses carry an ETag derived from the dataset
+version and the query; matching If-None-Match requests get 304 without any
+work, and repeated queries are answered from a small per-version LRU.
+The file is polled and reloaded in the background when the scraper writes
+a new version; a half-written file is ignored until it parses.
+
+Endpoints (all GET, JSON):
+    /hackathons  filter_hackathons criteria + limit/offset
+    /stats       get_statistics for the whole dataset
+    /search      q + limit/offset, full-text search ranked by BM25
+    /health      dataset version and record count
+"""
+import asyncio
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
+
+from aiohttp import web
+
+from analyze_data import filter_hackathons, get_statistics, iter_hackathons
+from geo import country_code_for
+from models import to_json_default
+from result_cache import file_digest
+from search_index import SearchIndex
+
+
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 500
+
+# Filters answered from posting sets; the rest go through filter_hackathons
+INDEXED_FILTERS = ('status', 'location_type', 'theme')
+
+
+class BadRequest(ValueError):
+    pass
+
+
+def _dumps(value) -> bytes:
+    return json.dumps(value, ensure_ascii=False, default=to_json_default).encode('utf-8')
+
+
+def _flag(value: str) -> bool:
+    lowered = value.lower()
+    if lowered in ('1', 'true', 'yes'):
+        return True
+    if lowered in ('0', 'false', 'no'):
+        return False
+    raise BadRequest(f"expected yes/no, got {value!r}")
+
+
+def parse_filters(query) -> Dict:
+    """filter_hackathons keyword arguments from query parameters"""
+    filters = {}
+    for name in ('status', 'location_type', 'theme'):
+        if query.get(name):
+            filters[name] = query[name]
+    for name in ('has_prizes', 'has_website', 'online'):
+        if query.get(name):
+            filters[name] = _flag(query[name])
+    if query.get('min_prize'):
+        try:
+            filters['min_prize'] = float(query['min_prize'])
+        except ValueError:
+            raise BadRequest(f"min_prize must be a number, got {query['min_prize']!r}")
+    if query.get('country'):
+        filters['country'] = country_code_for(query['country'])
+    return filters
+
+
+def parse_page(query):
+    try:
+        limit = int(query.get('limit', DEFAULT_LIMIT))
+        offset = int(query.get('offset', 0))
+    except ValueError:
+        raise BadRequest("limit and offset must be integers")
+    if limit < 0 or offset < 0:
+        raise BadRequest("limit and offset must not be negative")
+    return min(limit, MAX_LIMIT), offset
+
+
+class Dataset:
+    """One loaded version of the dataset file with its indexes"""
+
+    def __init__(self, filename: str, version: str, search_index: SearchIndex):
+        self.filename = filename
+        self.version = version
+        self.search_index = search_index
+        self.records = list(iter_hackathons(filename))
+        self.encoded = [_dumps(h.to_dict()) for h in self.records]
+        self.stats_body = _dumps(get_statistics(self.records))
+
+        self.postings = {name: {} for name in INDEXED_FILTERS}
+        for position, h in enumerate(self.records):
+            for name in ('status', 'location_type'):
+                if h.get(name):
+                    self.postings[name].setdefault(h.get(name), set()).add(position)
+            for theme in h.get('themes', []):
+                self.postings['theme'].setdefault(theme, set()).add(position)
+
+        search_index.add_many(self.records)
+        self.positions = {id(h): position for position, h in enumerate(self.records)}
+
+    def select(self, filters: Dict):
+        """Positions of the records matching the filters, in file order"""
+        candidates = None
+        for name in INDEXED_FILTERS:
+            if name in filters:
+                matches = self.postings[name].get(filters[name], set())
+                candidates = matches if candidates is None else candidates & matches
+        if candidates is None:
+            candidates = range(len(self.records))
+        else:
+            candidates = sorted(candidates)
+
+        remaining = {k: v for k, v in filters.items() if k not in INDEXED_FILTERS}
+        if not remaining:
+            return list(candidates)
+        matched = filter_hackathons((self.records[p] for p in candidates), **remaining)
+        return [self.positions[id(h)] for h in matched]
+
+
+class HackathonAPI:
+    """
+    aiohttp application serving one dataset file
+
+    SQLite connections may only be used from the thread that opened them,
+    so loading and searching both run on a single dedicated worker thread.
+    """
+
+    def __init__(self, filename: str, reload_interval: float = 2.0, cache_size: int = 1024):
+        self.filename = filename
+        self.reload_interval = reload_interval
+        self.cache_size = cache_size
+        self.dataset: Optional[Dataset] = None
+        self.responses = OrderedDict()
+        self._stat = None
+        self._worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix='dataset')
+        self._reloader = None
+
+    # Loading
+
+    def _file_stat(self):
+        stat = os.stat(self.filename)
+        return stat.st_size, stat.st_mtime_ns
+
+    def _load(self) -> Optional[Dataset]:
+        version = file_digest(self.filename)
+        if self.dataset is not None and version == self.dataset.version:
+            return None
+        return Dataset(self.filename, version, SearchIndex(':memory:'))
+
+    async def reload(self) -> bool:
+        """Load the file if it changed; returns True when a new version is live"""
+        loop = asyncio.get_running_loop()
+        try:
+            stat = self._file_stat()
+            if stat == self._stat:
+                return False
+            dataset = await loop.run_in_executor(self._worker, self._load)
+        except (OSError, ValueError) as e:
+            # Usually the scraper is still writing the file; try again next tick
+            print(f"Error loading {self.filename}: {e}")
+            return False
+
+        self._stat = stat
+        if dataset is None:
+            return False
+        old, self.dataset = self.dataset, dataset
+        self.responses.clear()
+        if old is not None:
+            self._worker.submit(old.search_index.close)
+        print(f"Loaded {len(dataset.records)} hackathons from {self.filename} "
+              f"(version {dataset.version[:12]})")
+        return True
+
+    async def _watch(self):
+        while True:
+            await asyncio.sleep(self.reload_interval)
+            await self.reload()
+
+    async def _on_startup(self, app):
+        await self.reload()
+        if self.dataset is None:
+            raise RuntimeError(f"Could not load {self.filename}")
+        if self.reload_interval:
+            self._reloader = asyncio.create_task(self._watch())
+
+    async def _on_cleanup(self, app):
+        if self._reloader:
+            self._reloader.cancel()
+        self._worker.shutdown(wait=False)
+
+    # Responses
+
+    def _etag(self, request) -> str:
+        query = '&'.join(f"{k}={v}" for k, v in sorted(request.query.items()))
+        digest = hashlib.blake2b(f"{request.path}?{query}".encode('utf-8'), digest_size=8)
+        return f'"{self.dataset.version[:16]}-{digest.hexdigest()}"'
+
+    async def _respond(self, request, build) -> web.Response:
+        etag = self._etag(request)
+        headers = {'ETag': etag, 'Cache-Control': 'no-cache'}
+        if etag in request.headers.get('If-None-Match', ''):
+            return web.Response(status=304, headers=headers)
+
+        body = self.responses.get(etag)
+        if body is None:
+            try:
+                body = await build(self.dataset)
+            except BadRequest as e:
+                return web.json_response({'error': str(e)}, status=400)
+            self.responses[etag] = body
+            if len(self.responses) > self.cache_size:
+                self.responses.popitem(last=False)
+        else:
+            self.responses.move_to_end(etag)
+        return web.Response(body=body, headers=headers, content_type='application/json')
+
+    async def hackathons(self, request):
+        async def build(dataset):
+            filters = parse_filters(request.query)
+            limit, offset = parse_page(request.query)
+            positions = dataset.select(filters)
+            items = b','.join(dataset.encoded[p] for p in positions[offset:offset + limit])
+            return (b'{"total":%d,"offset":%d,"limit":%d,"items":[%s]}'
+                    % (len(positions), offset, limit, items))
+        return await self._respond(request, build)
+
+    async def stats(self, request):
+        async def build(dataset):
+            return dataset.stats_body
+        return await self._respond(request, build)
+
+    async def search(self, request):
+        async def build(dataset):
+            text = request.query.get('q', '').strip()
+            if not text:
+                raise BadRequest("q is required")
+            limit, offset = parse_page(request.query)
+            loop = asyncio.get_running_loop()
+            # One extra row tells whether another page exists
+            results = await loop.run_in_executor(
+                self._worker, dataset.search_index.search, text, limit + 1, offset)
+            items = [dict(h.to_dict(), score=round(score, 4)) for h, score in results[:limit]]
+            return _dumps({'query': text, 'offset': offset, 'limit': limit,
+                           'has_more': len(results) > limit, 'items': items})
+        return await self._respond(request, build)
+
+    async def health(self, request):
+        return web.json_response({'version': self.dataset.version,
+                                  'records': len(self.dataset.records)})
+
+    def make_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get('/hackathons', self.hackathons)
+        app.router.add_get('/stats', self.stats)
+        app.router.add_get('/search', self.search)
+        app.router.add_get('/health', self.health)
+        app.on_startup.append(self._on_startup)
+        app.on_cleanup.append(self._on_cleanup)
+        return app
+
+
+def serve(filename: str = 'remote_hackathons.json', host: str = '127.0.0.1', port: int = 8080,
+          reload_interval: float = 2.0):
+    """Run the API until interrupted"""
+    api = HackathonAPI(filename, reload_interval=reload_interval)
+    # Access logging costs more than answering a cached request
+    web.run_app(api.make_app(), host=host, port=port, access_log=None)
+
+
+if __name__ == "__main__":
+    serve()
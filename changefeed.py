@@ -0,0 +1,90 @@
+import hashlib
+import json
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from models import Hackathon
+
+
+def _as_dict(h) -> Dict:
+    return h.to_dict() if isinstance(h, Hackathon) else h
+
+
+def fingerprint(h) -> str:
+    """Stable hash of a record's content, independent of key order"""
+    canonical = json.dumps(_as_dict(h), sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.blake2b(canonical.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def diff_hackathons(previous: Iterable, current: Iterable,
+                    timestamp: Optional[str] = None) -> Iterator[Dict]:
+    """
+    Compare two crawls and yield change events keyed by detail_url
+
+    Records are compared by fingerprint first; fields are only diffed for
+    the records whose fingerprint changed.
+
+    Yields:
+        {'event': 'added', 'record': ...}
+        {'event': 'updated', 'changes': {field: {'old': ..., 'new': ...}}}
+        {'event': 'status_changed', 'from': ..., 'to': ...}  (after 'updated')
+        {'event': 'removed', 'record': ...}
+        Every event also carries 'detail_url', 'title' and 'timestamp'.
+    """
+    timestamp = timestamp or datetime.now(timezone.utc).isoformat()
+
+    old_records = {}
+    for h in previous:
+        data = _as_dict(h)
+        if data.get('detail_url'):
+            old_records[data['detail_url']] = (fingerprint(data), data)
+
+    seen = set()
+    for h in current:
+        new = _as_dict(h)
+        url = new.get('detail_url')
+        if not url or url in seen:
+            continue
+        seen.add(url)
+        base = {'detail_url': url, 'title': new.get('title'), 'timestamp': timestamp}
+
+        if url not in old_records:
+            yield {'event': 'added', **base, 'record': new}
+            continue
+
+        old_fingerprint, old = old_records[url]
+        new_fingerprint = fingerprint(new)
+        if new_fingerprint == old_fingerprint:
+            continue
+
+        changes = {
+            field: {'old': old.get(field), 'new': new.get(field)}
+            for field in list(new) + [name for name in old if name not in new]
+            if old.get(field) != new.get(field)
+        }
+        yield {'event': 'updated', **base, 'fingerprint': new_fingerprint, 'changes': changes}
+
+        if 'status' in changes:
+            yield {'event': 'status_changed', **base,
+                   'from': old.get('status'), 'to': new.get('status')}
+
+    for url, (_, old) in old_records.items():
+        if url not in seen:
+            yield {'event': 'removed', 'detail_url': url, 'title': old.get('title'),
+                   'timestamp': timestamp, 'record': old}
+
+
+def write_change_feed(events: Iterable[Dict], filename: str) -> List[str]:
+    """
+    Append change events to a JSON Lines feed
+
+    Returns:
+        The event types written, in order
+    """
+    written = []
+    with open(filename, 'a', encoding='utf-8') as f:
+        for event in events:
+            f.write(json.dumps(event, ensure_ascii=False))
+            f.write('\n')
+            written.append(event['event'])
+    return written
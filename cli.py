@@ -0,0 +1,537 @@
+"""
+Command line entry point for scraping, analysing and visualising hackathons
+
+Each subcommand imports only the modules it needs, so quick commands such as
+`stats` and `filter` never load requests, BeautifulSoup or the plotting stack.
+
+Examples:
+    python cli.py scrape --theme remote --output remote_hackathons.json
+    python cli.py stats
+    python cli.py filter --status Upcoming --theme ai
+    python cli.py export --output hackathons.csv.gz --shard-size 50000
+    python cli.py visualize --output-dir charts
+    python cli.py index && python cli.py search "climate hack"
+"""
+import argparse
+import contextlib
+import json
+import os
+import sys
+
+
+DEFAULT_INPUT = 'remote_hackathons.json'
+DEFAULT_SEARCH_INDEX = 'hackathons_search.db'
+DEFAULT_RESULT_CACHE = 'analytics_cache.db'
+
+
+def cmd_scrape(args):
+    from scraper import AllHackathonsScraper
+
+    search_index = None
+    if args.search_index:
+        from search_index import SearchIndex
+        search_index = SearchIndex(args.search_index)
+
+    history = None
+    if args.history:
+        from history import SnapshotStore
+        history = SnapshotStore(args.history)
+
+    scraper = AllHackathonsScraper()
+    if args.all:
+        scraper.scrape_all_themes(save_file=args.output, search_index=search_index,
+                                  history=history)
+    else:
+        scraper.scrape_theme(theme=args.theme, save_file=args.output,
+                             search_index=search_index, history=history,
+                             change_feed=args.change_feed)
+
+
+def _result_cache(args):
+    if args.no_cache:
+        return None
+    from result_cache import ResultCache
+    return ResultCache(args.cache)
+
+
+def cmd_stats(args):
+    from analyze_data import statistics_for, print_statistics
+
+    stats = statistics_for(args.input, _result_cache(args))
+    if args.json:
+        print(json.dumps(stats, indent=2, ensure_ascii=False))
+    else:
+        print_statistics(stats)
+
+
+def _filters_from_args(args):
+    filters = {}
+    if args.status:
+        filters['status'] = args.status
+    if args.location_type:
+        filters['location_type'] = args.location_type
+    if args.theme:
+        filters['theme'] = args.theme
+    if args.has_prizes:
+        filters['has_prizes'] = True
+    if args.has_website:
+        filters['has_website'] = True
+    if args.min_prize is not None:
+        filters['min_prize'] = args.min_prize
+    if args.online is not None:
+        filters['online'] = args.online == 'yes'
+    if args.country:
+        from geo import country_code_for
+        filters['country'] = country_code_for(args.country)
+    return filters
+
+
+def cmd_filter(args):
+    from analyze_data import filter_file
+
+    results = filter_file(args.input, _result_cache(args), **_filters_from_args(args))
+    if args.json:
+        for h in results:
+            print(json.dumps(h.to_dict(), ensure_ascii=False))
+    else:
+        for h in results:
+            print(f"{h.get('title', 'Unknown')} ({h.get('dates', 'N/A')})")
+        print(f"\n{len(results)} hackathons matched", file=sys.stderr)
+
+
+def cmd_export(args):
+    from analyze_data import iter_hackathons, export_to_csv
+
+    export_to_csv(
+        iter_hackathons(args.input),
+        args.output,
+        fmt=args.format,
+        compress=True if args.gzip else None,
+        shard_size=args.shard_size,
+        workers=args.workers,
+    )
+
+
+def cmd_visualize(args):
+    from visualize_data import HackathonVisualizer, cached_visualizations
+
+    insights = cached_visualizations(args.input, args.output_dir, _result_cache(args),
+                                     profile=args.profile)
+    report = HackathonVisualizer.generate_insights_report(insights)
+    print(report)
+    with open(f'{args.output_dir}/insights_report.txt', 'w', encoding='utf-8') as f:
+        f.write(report)
+
+
+def cmd_index(args):
+    from analyze_data import iter_hackathons
+    from search_index import SearchIndex
+
+    index = SearchIndex(args.index)
+    count = index.add_many(iter_hackathons(args.input))
+    print(f"Indexed {count} hackathons into {args.index} ({len(index)} total)")
+
+
+def cmd_search(args):
+    from search_index import SearchIndex
+
+    index = SearchIndex(args.index)
+    results = index.search(args.query, limit=args.limit, offset=args.offset)
+    for h, score in results:
+        if args.json:
+            print(json.dumps(dict(h.to_dict(), score=round(score, 4)), ensure_ascii=False))
+        else:
+            print(f"{score:7.2f}  {h.get('title', 'Unknown')}  {h.get('detail_url', '')}")
+
+
+def cmd_dedup(args):
+    from analyze_data import iter_hackathons
+    from dedup import dedupe_hackathons
+    from models import to_json_default
+
+    records = dedupe_hackathons(iter_hackathons(args.input), threshold=args.threshold)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(records, f, indent=2, ensure_ascii=False, default=to_json_default)
+    print(f"Wrote {len(records)} unique hackathons to {args.output}")
+
+
+def cmd_history(args):
+    from history import SnapshotStore
+
+    store = SnapshotStore(args.db)
+    if args.record:
+        from analyze_data import iter_hackathons
+        snapshot_id = store.record(iter_hackathons(args.record), scope=args.scope)
+        if snapshot_id is not None:
+            print(f"Recorded snapshot {snapshot_id} for scope '{args.scope}'")
+    elif args.as_of:
+        for h in store.state_as_of(args.as_of, scope=args.scope):
+            print(json.dumps(h.to_dict(), ensure_ascii=False))
+    elif args.url:
+        for event in store.history(args.url, scope=args.scope):
+            print(json.dumps(event, ensure_ascii=False))
+    else:
+        for snapshot in store.snapshots(args.scope):
+            print(f"{snapshot['id']:>6}  {snapshot['taken_at']}  {snapshot['scope']}  "
+                  f"{snapshot['record_count']} hackathons, {snapshot['changed_fields']} field changes")
+
+
+def cmd_changes(args):
+    from analyze_data import iter_hackathons
+    from changefeed import diff_hackathons, write_change_feed
+
+    events = diff_hackathons(iter_hackathons(args.previous), iter_hackathons(args.current))
+    if args.output:
+        written = write_change_feed(events, args.output)
+        print(f"Appended {len(written)} change events to {args.output}")
+    else:
+        for event in events:
+            print(json.dumps(event, ensure_ascii=False))
+
+
+def cmd_crawl(args):
+    from crawl_queue import CrawlQueue, enqueue_themes, run_worker
+
+    if args.action == 'enqueue':
+        from scraper import THEMES
+        themes = args.themes or THEMES
+        added = enqueue_themes(CrawlQueue(args.queue, shared_fs=args.shared_fs), themes)
+        print(f"Enqueued {added} theme listings ({len(themes)} requested)")
+    elif args.action == 'work':
+        worker_args = dict(db_path=args.queue, request_interval=args.interval,
+                           shared_fs=args.shared_fs)
+        if args.processes > 1:
+            from multiprocessing import Process
+            workers = [Process(target=run_worker, kwargs=worker_args) for _ in range(args.processes)]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+        else:
+            completed = run_worker(**worker_args)
+            print(f"Worker finished after {completed} tasks")
+    elif args.action == 'status':
+        for state, count in sorted(CrawlQueue(args.queue, shared_fs=args.shared_fs).counts().items()):
+            print(f"  {state}: {count}")
+    elif args.action == 'collect':
+        from models import to_json_default
+        records = CrawlQueue(args.queue, shared_fs=args.shared_fs).results()
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(records, f, indent=2, ensure_ascii=False, default=to_json_default)
+        print(f"Wrote {len(records)} hackathons to {args.output}")
+
+
+def cmd_check_links(args):
+    from analyze_data import iter_hackathons
+    from link_checker import LinkChecker, broken_links
+    from models import to_json_default
+
+    checker = LinkChecker(concurrency=args.concurrency, per_host=args.per_host,
+                          ttl=args.ttl, error_ttl=args.error_ttl, cache_file=args.cache)
+    records = checker.check_hackathons(iter_hackathons(args.input))
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(records, f, indent=2, ensure_ascii=False, default=to_json_default)
+
+    broken = broken_links(records)
+    for link in broken:
+        print(f"  {link['status'] or link['error']}  {link['field']}  {link['url']}  ({link['title']})")
+    print(f"Checked {len(records)} hackathons, {len(broken)} broken links; wrote {args.output}")
+
+
+def cmd_cache_images(args):
+    from analyze_data import iter_hackathons
+    from image_cache import ImageCache
+    from models import to_json_default
+
+    cache = ImageCache(args.cache_dir, concurrency=args.concurrency,
+                       thumbnail_size=(args.width, args.height), processes=args.processes)
+    records = cache.cache_hackathons(iter_hackathons(args.input))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(records, f, indent=2, ensure_ascii=False, default=to_json_default)
+        print(f"Wrote {len(records)} hackathons to {args.output}")
+
+
+def cmd_prizes(args):
+    from analyze_data import iter_hackathons
+    from prizes import PrizeIndex, prize_usd
+
+    index = PrizeIndex(iter_hackathons(args.input))
+    online = None if args.online is None else args.online == 'yes'
+    for h in index.query(min_usd=args.min_prize, theme=args.theme, online=online, limit=args.limit):
+        print(f"${prize_usd(h):>12,.0f}  {h.get('title', 'Unknown')}  ({h.get('prizes', '')})")
+
+
+def cmd_geocode(args):
+    from analyze_data import iter_hackathons
+    from geo import LocationNormalizer
+    from models import to_json_default
+
+    normalizer = LocationNormalizer(args.cache)
+    records = [normalizer.annotate(h) for h in iter_hackathons(args.input)]
+    normalizer.save()
+
+    output = args.output or args.input
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(records, f, indent=2, ensure_ascii=False, default=to_json_default)
+    resolved = sum(1 for h in records if h.get('country_code'))
+    print(f"Resolved {resolved}/{len(records)} locations, wrote {output}")
+
+
+def cmd_serve(args):
+    from api_server import serve
+
+    serve(args.input, host=args.host, port=args.port, reload_interval=args.reload_interval)
+
+
+def _add_cache_arguments(parser):
+    parser.add_argument('--cache', default=DEFAULT_RESULT_CACHE,
+                        help="Results cache, reused while the input file is unchanged")
+    parser.add_argument('--no-cache', action='store_true', help="Always recompute")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="allhackathons.com scraper and analysis tools")
+    parser.add_argument('--profile-report', metavar='FILE',
+                        help="Profile the command's stages and write a JSON report")
+    parser.add_argument('--cprofile-dir', metavar='DIR',
+                        help="With --profile-report, also write a cProfile dump per top-level stage")
+    parser.add_argument('--no-trace-memory', action='store_true',
+                        help="With --profile-report, skip tracemalloc (faster, no memory peaks)")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    scrape = subparsers.add_parser('scrape', help="Scrape hackathons from allhackathons.com")
+    scrape.add_argument('--theme', default='remote', help="Theme to scrape (default: remote)")
+    scrape.add_argument('--all', action='store_true', help="Scrape every known theme")
+    scrape.add_argument('--output', default=DEFAULT_INPUT, help="JSON file to write")
+    scrape.add_argument('--search-index', help="SQLite search index to update while scraping")
+    scrape.add_argument('--history', help="SQLite snapshot store to append this crawl to")
+    scrape.add_argument('--change-feed', help="JSON Lines file to append change events to "
+                                              "(compared with --output; not with --all)")
+    scrape.set_defaults(func=cmd_scrape)
+
+    stats = subparsers.add_parser('stats', help="Print dataset statistics")
+    stats.add_argument('--input', default=DEFAULT_INPUT)
+    stats.add_argument('--json', action='store_true', help="Print statistics as JSON")
+    _add_cache_arguments(stats)
+    stats.set_defaults(func=cmd_stats)
+
+    filt = subparsers.add_parser('filter', help="List hackathons matching the given criteria")
+    filt.add_argument('--input', default=DEFAULT_INPUT)
+    filt.add_argument('--status', choices=['Upcoming', 'Open', 'Ended'])
+    filt.add_argument('--location-type', choices=['ONLINE', 'IN-PERSON'])
+    filt.add_argument('--theme')
+    filt.add_argument('--has-prizes', action='store_true')
+    filt.add_argument('--has-website', action='store_true')
+    filt.add_argument('--min-prize', type=float, help="Minimum prize in USD")
+    filt.add_argument('--online', choices=['yes', 'no'], help="Only online / in-person events")
+    filt.add_argument('--country', help="Country code or name, e.g. US or Germany")
+    filt.add_argument('--json', action='store_true', help="Print matches as JSON Lines")
+    _add_cache_arguments(filt)
+    filt.set_defaults(func=cmd_filter)
+
+    export = subparsers.add_parser('export', help="Export hackathons to CSV, JSONL or Parquet")
+    export.add_argument('--input', default=DEFAULT_INPUT)
+    export.add_argument('--output', default='hackathons.csv')
+    export.add_argument('--format', choices=['csv', 'jsonl', 'parquet'])
+    export.add_argument('--gzip', action='store_true', help="Compress the output with gzip")
+    export.add_argument('--shard-size', type=int, help="Records per output file")
+    export.add_argument('--workers', type=int, default=4, help="Shards written concurrently")
+    export.set_defaults(func=cmd_export)
+
+    visualize = subparsers.add_parser('visualize', help="Generate charts and the insights report")
+    visualize.add_argument('--input', default=DEFAULT_INPUT)
+    visualize.add_argument('--output-dir', default='charts')
+    visualize.add_argument('--profile', choices=['full', 'draft', 'svg', 'html'], default='full',
+                           help="300 dpi PNG, quick 72 dpi PNG, vector SVG, or an HTML dashboard "
+                                "over pre-aggregated JSON")
+    _add_cache_arguments(visualize)
+    visualize.set_defaults(func=cmd_visualize)
+
+    index = subparsers.add_parser('index', help="Add a JSON dataset to the full-text search index")
+    index.add_argument('--input', default=DEFAULT_INPUT)
+    index.add_argument('--index', default=DEFAULT_SEARCH_INDEX)
+    index.set_defaults(func=cmd_index)
+
+    search = subparsers.add_parser('search', help="Full-text search over indexed hackathons")
+    search.add_argument('query')
+    search.add_argument('--index', default=DEFAULT_SEARCH_INDEX)
+    search.add_argument('--limit', type=int, default=20)
+    search.add_argument('--offset', type=int, default=0)
+    search.add_argument('--json', action='store_true', help="Print results as JSON Lines")
+    search.set_defaults(func=cmd_search)
+
+    dedup = subparsers.add_parser('dedup', help="Merge duplicate hackathons across themes and crawls")
+    dedup.add_argument('--input', default=DEFAULT_INPUT, help="JSON, all-themes JSON or JSON Lines file")
+    dedup.add_argument('--output', default='unique_hackathons.json')
+    dedup.add_argument('--threshold', type=float, default=0.8,
+                       help="Minimum estimated Jaccard similarity of title + description")
+    dedup.set_defaults(func=cmd_dedup)
+
+    history = subparsers.add_parser('history', help="Record or query crawl snapshots")
+    history.add_argument('--db', default='hackathons_history.db')
+    history.add_argument('--scope', default='remote', help="Theme the snapshots belong to")
+    action = history.add_mutually_exclusive_group()
+    action.add_argument('--record', metavar='INPUT', help="Append a scraped JSON file as a snapshot")
+    action.add_argument('--as-of', metavar='DATE', help="Print the catalogue as of an ISO date/time")
+    action.add_argument('--url', help="Print the change history of one detail_url")
+    history.set_defaults(func=cmd_history)
+
+    changes = subparsers.add_parser('changes', help="Emit change events between two crawls")
+    changes.add_argument('previous')
+    changes.add_argument('current')
+    changes.add_argument('--output', help="Append events to this JSON Lines file instead of stdout")
+    changes.set_defaults(func=cmd_changes)
+
+    crawl = subparsers.add_parser('crawl', help="Distributed crawl through a shared SQLite work queue")
+    crawl.add_argument('action', choices=['enqueue', 'work', 'status', 'collect'])
+    crawl.add_argument('--queue', default='crawl_queue.db', help="Queue database shared by all workers")
+    crawl.add_argument('--shared-fs', action='store_true',
+                       help="Queue on a network file system shared by workers on several machines "
+                            "(rollback journal instead of WAL; needs working POSIX locks)")
+    crawl.add_argument('--themes', nargs='+', help="Themes to enqueue (default: all)")
+    crawl.add_argument('--processes', type=int, default=1, help="Worker processes to start")
+    crawl.add_argument('--interval', type=float, default=1.0,
+                       help="Minimum seconds between requests, shared by all workers")
+    crawl.add_argument('--output', default='all_hackathons.json', help="File written by collect")
+    crawl.set_defaults(func=cmd_crawl)
+
+    links = subparsers.add_parser('check-links', help="Check website and image links concurrently")
+    links.add_argument('--input', default=DEFAULT_INPUT)
+    links.add_argument('--output', default='hackathons_links.json')
+    links.add_argument('--concurrency', type=int, default=200, help="Open connections in total")
+    links.add_argument('--per-host', type=int, default=4, help="Open connections per host")
+    links.add_argument('--ttl', type=float, default=24 * 3600, help="Seconds a cached result stays valid")
+    links.add_argument('--error-ttl', type=float, default=0,
+                       help="Seconds a cached error or 5xx result stays valid (default: recheck every run)")
+    links.add_argument('--cache', default='link_cache.json')
+    links.set_defaults(func=cmd_check_links)
+
+    images = subparsers.add_parser('cache-images', help="Download card images and render thumbnails")
+    images.add_argument('--input', default=DEFAULT_INPUT)
+    images.add_argument('--output', help="Write records annotated with image_sha256 to this file")
+    images.add_argument('--cache-dir', default='image_cache')
+    images.add_argument('--concurrency', type=int, default=32)
+    images.add_argument('--width', type=int, default=400)
+    images.add_argument('--height', type=int, default=300)
+    images.add_argument('--processes', type=int, help="Thumbnail worker processes (default: CPU count)")
+    images.set_defaults(func=cmd_cache_images)
+
+    prizes = subparsers.add_parser('prizes', help="Rank hackathons by prize money (USD)")
+    prizes.add_argument('--input', default=DEFAULT_INPUT)
+    prizes.add_argument('--min-prize', type=float, default=0)
+    prizes.add_argument('--theme')
+    prizes.add_argument('--online', choices=['yes', 'no'])
+    prizes.add_argument('--limit', type=int, default=20)
+    prizes.set_defaults(func=cmd_prizes)
+
+    geocode = subparsers.add_parser('geocode', help="Store normalised country/region/city codes on records")
+    geocode.add_argument('--input', default=DEFAULT_INPUT)
+    geocode.add_argument('--output', help="JSON file to write (default: overwrite --input)")
+    geocode.add_argument('--cache', default='geo_cache.json', help="Cache of resolved location strings")
+    geocode.set_defaults(func=cmd_geocode)
+
+    api = subparsers.add_parser('serve', help="Serve the dataset over a read-only HTTP API")
+    api.add_argument('--input', default=DEFAULT_INPUT)
+    api.add_argument('--host', default='127.0.0.1')
+    api.add_argument('--port', type=int, default=8080)
+    api.add_argument('--reload-interval', type=float, default=2.0,
+                     help="Seconds between checks for a new dataset file (0 disables)")
+    api.set_defaults(func=cmd_serve)
+
+    pipeline = subparsers.add_parser('pipeline', help="Scrape, analyse, export and visualise in one run")
+    pipeline.add_argument('--theme', default='remote')
+    pipeline.add_argument('--input', default=DEFAULT_INPUT, help="JSON file scraped to and analysed")
+    pipeline.add_argument('--skip-scrape', action='store_true', help="Analyse the existing --input")
+    pipeline.add_argument('--csv', default='hackathons.csv')
+    pipeline.add_argument('--output-dir', default='charts')
+    pipeline.add_argument('--render-profile', choices=['full', 'draft', 'svg', 'html'], default='full')
+    pipeline.set_defaults(func=cmd_pipeline)
+
+    profile_diff = subparsers.add_parser('profile-diff', help="Compare two --profile-report files")
+    profile_diff.add_argument('before')
+    profile_diff.add_argument('after')
+    profile_diff.set_defaults(func=cmd_profile_diff)
+
+    return parser
+
+
+def _stage(args, name):
+    profiler = getattr(args, 'profiler', None)
+    return profiler.stage(name) if profiler else contextlib.nullcontext()
+
+
+def cmd_pipeline(args):
+    from analyze_data import export_to_csv, get_statistics, iter_hackathons, print_statistics
+    from visualize_data import HackathonVisualizer
+
+    if not args.skip_scrape:
+        from scraper import AllHackathonsScraper
+        with _stage(args, 'scrape'):
+            AllHackathonsScraper().scrape_theme(theme=args.theme, save_file=args.input)
+
+    with _stage(args, 'analyze'):
+        with _stage(args, 'get_statistics'):
+            stats = get_statistics(iter_hackathons(args.input))
+        print_statistics(stats)
+        with _stage(args, 'export_to_csv'):
+            export_to_csv(iter_hackathons(args.input), args.csv)
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    with _stage(args, 'visualize'):
+        viz = HackathonVisualizer(args.input, args.render_profile)
+        insights = viz.generate_all_visualizations(args.output_dir)
+        with open(f'{args.output_dir}/insights_report.txt', 'w', encoding='utf-8') as f:
+            f.write(HackathonVisualizer.generate_insights_report(insights))
+
+
+def cmd_profile_diff(args):
+    from profiler import compare_reports
+
+    with open(args.before, 'r', encoding='utf-8') as f:
+        before = json.load(f)
+    with open(args.after, 'r', encoding='utf-8') as f:
+        after = json.load(f)
+    print(f"{'Stage':<56} {'Before s':>9} {'After s':>9} {'Change':>8}")
+    for row in compare_reports(before, after):
+        change = f"{row['wall_change_pct']:+.1f}%" if row['wall_change_pct'] is not None else 'n/a'
+        print(f"{row['stage'][:56]:<56} {row['wall_s_before']:>9.3f} {row['wall_s_after']:>9.3f} {change:>8}")
+
+
+def _run_profiled(args):
+    from profiler import StageProfiler, print_report
+    from scraper import AllHackathonsScraper
+    from visualize_data import HackathonVisualizer
+
+    # The command itself is the outermost stage; the pipeline dumps one
+    # cProfile per scrape / analyze / visualize stage instead
+    profiler = StageProfiler(memory=not args.no_trace_memory, cprofile_dir=args.cprofile_dir,
+                             cprofile_depth=1 if args.command == 'pipeline' else 0)
+    args.profiler = profiler
+    try:
+        with profiler.instrumented(AllHackathonsScraper, 'get_page', 'extract_*'), \
+                profiler.instrumented(HackathonVisualizer, '__init__', '_plot_*',
+                                      'generate_html_dashboard'), \
+                profiler.stage(args.command):
+            args.func(args)
+    finally:
+        report = profiler.write_report(args.profile_report)
+        profiler.close()
+        print()
+        print_report(report)
+        print(f"Profile report written to {args.profile_report}")
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command == 'scrape' and args.all and args.change_feed:
+        parser.error("--change-feed compares one theme with --output and cannot be used with --all")
+    if args.profile_report:
+        _run_profiled(args)
+    else:
+        args.func(args)
+
+
+if __name__ == "__main__":
+    main()
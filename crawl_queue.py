@@ -0,0 +1,327 @@
+"""
+Durable work queue for crawling with any number of worker processes
+
+Listing pages and detail pages are tasks in a SQLite database. Workers
+lease a task, fetch and parse it, and commit the result together with any
+new tasks it discovered in one transaction. A worker that crashes simply
+lets its lease expire and the task is picked up again; finished tasks are
+never redone. Request pacing is shared through the same database, so the
+configured interval holds across all workers.
+
+By default the queue uses WAL mode, whose shared-memory index only works
+between processes on the host that holds the database file. For workers on
+several machines, create the queue with shared_fs=True (`--shared-fs`): it
+uses a rollback journal (journal_mode=DELETE), which needs nothing but file
+locks. The network file system must then implement POSIX byte-range
+locking correctly (NFSv4 or NFSv3 with lockd; not mounts with `nolock` or
+client-side lock emulation), otherwise workers can corrupt the database.
+Every claim and commit takes the database-wide write lock, so lock round
+trips over the network bound the throughput; a few dozen workers are fine
+for page fetches that take seconds.
+
+The mode is fixed when the queue is created, and opening it with the other
+setting raises ValueError.
+"""
+import json
+import os
+import socket
+import sqlite3
+import time
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import urlparse
+
+from models import Hackathon
+
+
+class CrawlQueue:
+    """Lease-based task queue stored in SQLite"""
+
+    def __init__(self, db_path: str = 'crawl_queue.db', max_attempts: int = 5,
+                 shared_fs: bool = False):
+        """
+        Args:
+            db_path: Queue database shared by all workers
+            max_attempts: Tries per task before it is marked failed
+            shared_fs: Use a rollback journal so workers on other machines can
+                       share the file over a network file system
+        """
+        self.db_path = db_path
+        self.max_attempts = max_attempts
+        self.conn = sqlite3.connect(db_path, timeout=60, isolation_level=None)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS settings (
+                name TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS tasks (
+                id INTEGER PRIMARY KEY,
+                kind TEXT NOT NULL,
+                url TEXT NOT NULL,
+                theme TEXT,
+                payload TEXT,
+                state TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                available_at REAL NOT NULL DEFAULT 0,
+                lease_owner TEXT,
+                lease_expires REAL,
+                result TEXT,
+                error TEXT,
+                UNIQUE (kind, url)
+            );
+            CREATE INDEX IF NOT EXISTS tasks_claim ON tasks (state, available_at);
+
+            CREATE TABLE IF NOT EXISTS rate_limits (
+                host TEXT PRIMARY KEY,
+                next_slot REAL NOT NULL
+            );
+        """)
+
+        wanted = 'delete' if shared_fs else 'wal'
+        self.conn.execute("INSERT OR IGNORE INTO settings (name, value) VALUES ('journal_mode', ?)",
+                          (wanted,))
+        mode = self.conn.execute("SELECT value FROM settings WHERE name = 'journal_mode'").fetchone()[0]
+        if mode != wanted:
+            self.conn.close()
+            raise ValueError(f"Queue {db_path} was created with journal_mode={mode}; "
+                             f"open it with shared_fs={mode == 'delete'}")
+        self.conn.execute(f"PRAGMA journal_mode={mode}")
+
+    def _transaction(self):
+        # BEGIN IMMEDIATE takes the write lock up front so two workers can
+        # never claim the same task
+        self.conn.execute("BEGIN IMMEDIATE")
+
+    def enqueue(self, tasks: Iterable[Dict]) -> int:
+        """Add tasks ({kind, url, theme, payload}); already known URLs are ignored"""
+        self._transaction()
+        try:
+            count = self._insert(tasks)
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        return count
+
+    def _insert(self, tasks: Iterable[Dict]) -> int:
+        before = self.conn.total_changes
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO tasks (kind, url, theme, payload) VALUES (?, ?, ?, ?)",
+            [(t['kind'], t['url'], t.get('theme'), json.dumps(t.get('payload'), ensure_ascii=False))
+             for t in tasks]
+        )
+        return self.conn.total_changes - before
+
+    def claim(self, worker_id: str, lease_seconds: float = 300) -> Optional[Dict]:
+        """Lease the next available task, or return None when there is none"""
+        now = time.time()
+        self._transaction()
+        try:
+            # A task whose worker crashed on every attempt is not handed out again
+            self.conn.execute(
+                "UPDATE tasks SET state = 'failed', error = 'lease expired', lease_owner = NULL "
+                "WHERE state = 'leased' AND lease_expires < ? AND attempts >= ?",
+                (now, self.max_attempts)
+            )
+            row = self.conn.execute(
+                "SELECT id, kind, url, theme, payload, attempts FROM tasks "
+                "WHERE (state = 'pending' AND available_at <= ?) "
+                "   OR (state = 'leased' AND lease_expires < ?) "
+                "ORDER BY kind = 'listing' DESC, id LIMIT 1", (now, now)
+            ).fetchone()
+            if row:
+                self.conn.execute(
+                    "UPDATE tasks SET state = 'leased', lease_owner = ?, lease_expires = ?, "
+                    "attempts = attempts + 1 WHERE id = ?",
+                    (worker_id, now + lease_seconds, row[0])
+                )
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+
+        if not row:
+            return None
+        task_id, kind, url, theme, payload, attempts = row
+        return {'id': task_id, 'kind': kind, 'url': url, 'theme': theme,
+                'payload': json.loads(payload) if payload else None, 'attempts': attempts + 1}
+
+    def complete(self, task: Dict, worker_id: str, result, new_tasks: Iterable[Dict] = ()) -> bool:
+        """
+        Store a task's result and the tasks it discovered atomically
+
+        Returns:
+            False if the lease was lost to another worker, in which case
+            nothing is written
+        """
+        self._transaction()
+        try:
+            updated = self.conn.execute(
+                "UPDATE tasks SET state = 'done', result = ?, error = NULL, lease_owner = NULL "
+                "WHERE id = ? AND state = 'leased' AND lease_owner = ?",
+                (json.dumps(result, ensure_ascii=False), task['id'], worker_id)
+            ).rowcount
+            if updated:
+                self._insert(new_tasks)
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        return bool(updated)
+
+    def fail(self, task: Dict, worker_id: str, error: str):
+        """Release a task for retry with exponential backoff, or mark it failed"""
+        if task['attempts'] >= self.max_attempts:
+            state, available_at = 'failed', 0
+        else:
+            state, available_at = 'pending', time.time() + 2 ** task['attempts']
+        self._transaction()
+        try:
+            self.conn.execute(
+                "UPDATE tasks SET state = ?, available_at = ?, error = ?, lease_owner = NULL "
+                "WHERE id = ? AND lease_owner = ?",
+                (state, available_at, error, task['id'], worker_id)
+            )
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+
+    def wait_for_slot(self, url: str, interval: float):
+        """Sleep until this host may be requested again, across all workers"""
+        host = urlparse(url).netloc
+        self._transaction()
+        try:
+            row = self.conn.execute("SELECT next_slot FROM rate_limits WHERE host = ?",
+                                    (host,)).fetchone()
+            slot = max(time.time(), row[0] if row else 0)
+            self.conn.execute("INSERT OR REPLACE INTO rate_limits (host, next_slot) VALUES (?, ?)",
+                              (host, slot + interval))
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        delay = slot - time.time()
+        if delay > 0:
+            time.sleep(delay)
+
+    def counts(self) -> Dict[str, int]:
+        """Number of tasks per state"""
+        return dict(self.conn.execute("SELECT state, COUNT(*) FROM tasks GROUP BY state"))
+
+    def is_finished(self) -> bool:
+        counts = self.counts()
+        return not counts.get('pending') and not counts.get('leased')
+
+    def results(self) -> List[Hackathon]:
+        """
+        Hackathons from finished detail tasks, in discovery order
+
+        Detail pages that failed every attempt still contribute the data
+        from their listing card.
+        """
+        records = []
+        rows = self.conn.execute(
+            "SELECT state, payload, result FROM tasks "
+            "WHERE kind = 'detail' AND state IN ('done', 'failed') ORDER BY id")
+        for state, payload, result in rows:
+            data = json.loads(result if state == 'done' else payload)
+            records.append(Hackathon.from_dict(data))
+        return records
+
+    def close(self):
+        self.conn.close()
+
+
+def enqueue_themes(queue: CrawlQueue, themes: Iterable[str],
+                   base_url: str = "https://allhackathons.com") -> int:
+    """Seed the queue with the first listing page of each theme"""
+    return queue.enqueue(
+        {'kind': 'listing', 'url': f"{base_url}/themes/{theme}/", 'theme': theme,
+         'payload': {'page': 1}}
+        for theme in themes
+    )
+
+
+def _process_listing(scraper, task: Dict):
+    soup = scraper.get_page(task['url'])
+    if not soup:
+        raise RuntimeError(f"Failed to fetch listing page {task['url']}")
+
+    new_tasks = []
+    if task['payload']['page'] == 1:
+        for page in range(2, scraper.total_pages_from_soup(soup) + 1):
+            new_tasks.append({'kind': 'listing', 'url': f"{task['url']}?page={page}",
+                              'theme': task['theme'], 'payload': {'page': page}})
+
+    cards = scraper.extract_hackathon_cards(soup)
+    for card in cards:
+        if 'detail_url' in card:
+            new_tasks.append({'kind': 'detail', 'url': card['detail_url'],
+                              'theme': task['theme'], 'payload': card.to_dict()})
+
+    return {'cards': len(cards)}, new_tasks
+
+
+def _process_detail(scraper, task: Dict):
+    details = scraper.extract_hackathon_details(task['url'])
+    if not details:
+        raise RuntimeError(f"No details extracted from {task['url']}")
+    hackathon = Hackathon.from_dict(task['payload'])
+    hackathon.update(details)
+    return hackathon.to_dict(), ()
+
+
+def run_worker(db_path: str = 'crawl_queue.db', worker_id: Optional[str] = None,
+               request_interval: float = 1.0, lease_seconds: float = 300,
+               poll_interval: float = 5.0, max_tasks: Optional[int] = None,
+               shared_fs: bool = False) -> int:
+    """
+    Process tasks until the queue is drained
+
+    Args:
+        db_path: Shared queue database
+        worker_id: Unique name of this worker (defaults to host:pid)
+        request_interval: Minimum seconds between requests to a host, shared
+                          by every worker using the same database
+        lease_seconds: How long a claimed task is reserved for this worker
+        poll_interval: Wait between checks while other workers hold leases
+        max_tasks: Stop after this many tasks
+        shared_fs: The queue was created for a network file system
+
+    Returns:
+        Number of tasks this worker completed
+    """
+    from scraper import AllHackathonsScraper
+
+    worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+    queue = CrawlQueue(db_path, shared_fs=shared_fs)
+    scraper = AllHackathonsScraper()
+    handlers = {'listing': _process_listing, 'detail': _process_detail}
+    completed = 0
+
+    while max_tasks is None or completed < max_tasks:
+        task = queue.claim(worker_id, lease_seconds)
+        if task is None:
+            if queue.is_finished():
+                break
+            # Other workers still hold leases or tasks are backing off
+            time.sleep(poll_interval)
+            continue
+
+        queue.wait_for_slot(task['url'], request_interval)
+        try:
+            result, new_tasks = handlers[task['kind']](scraper, task)
+        except Exception as e:
+            print(f"[{worker_id}] {task['kind']} {task['url']} failed "
+                  f"(attempt {task['attempts']}): {e}")
+            queue.fail(task, worker_id, str(e))
+            continue
+
+        if queue.complete(task, worker_id, result, new_tasks):
+            completed += 1
+            print(f"[{worker_id}] {task['kind']} {task['url']} done")
+        else:
+            print(f"[{worker_id}] lease on {task['url']} expired, result discarded")
+
+    queue.close()
+    return completed
@@ -0,0 +1,160 @@
+import hashlib
+import random
+import re
+from collections import defaultdict
+from typing import Iterable, List, Optional, Set, Tuple
+
+from models import Hackathon, as_record
+
+
+_WORD_RE = re.compile(r'\w+', re.UNICODE)
+_PRIME = (1 << 61) - 1
+
+
+def shingles(text: str, k: int = 3) -> Set[str]:
+    """Set of k-word shingles of the normalised text"""
+    words = _WORD_RE.findall(text.lower())
+    if len(words) < k:
+        return {' '.join(words)} if words else set()
+    return {' '.join(words[i:i + k]) for i in range(len(words) - k + 1)}
+
+
+def _hash_shingle(shingle: str) -> int:
+    return int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+class MinHasher:
+    """MinHash signatures using num_perm universal hash functions"""
+
+    def __init__(self, num_perm: int = 64, seed: int = 1):
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self.params = [(rng.randrange(1, _PRIME), rng.randrange(0, _PRIME)) for _ in range(num_perm)]
+
+    def signature(self, shingle_set: Set[str]) -> Optional[Tuple[int, ...]]:
+        if not shingle_set:
+            return None
+        hashes = [_hash_shingle(s) for s in shingle_set]
+        return tuple(min((a * h + b) % _PRIME for h in hashes) for a, b in self.params)
+
+
+def estimated_similarity(sig_a: Tuple[int, ...], sig_b: Tuple[int, ...]) -> float:
+    """Estimated Jaccard similarity of two MinHash signatures"""
+    return sum(1 for a, b in zip(sig_a, sig_b) if a == b) / len(sig_a)
+
+
+def _dedup_text(h: Hackathon) -> str:
+    return f"{h.title or ''} {h.short_description or ''}"
+
+
+class _UnionFind:
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+
+    def find(self, i: int) -> int:
+        while self.parent[i] != i:
+            self.parent[i] = self.parent[self.parent[i]]
+            i = self.parent[i]
+        return i
+
+    def union(self, a: int, b: int):
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a != root_b:
+            self.parent[max(root_a, root_b)] = min(root_a, root_b)
+
+
+def find_duplicate_groups(hackathons: List, threshold: float = 0.8,
+                          num_perm: int = 64, bands: int = 16) -> List[List[int]]:
+    """
+    Group indexes of records describing the same event
+
+    Records sharing a detail_url are always grouped. Other records are
+    grouped when the MinHash estimate of the Jaccard similarity of their
+    title + description shingles reaches `threshold`. Candidates come from
+    locality-sensitive hashing over `bands` bands of the signature. Each
+    member of a bucket is checked against one representative of every group
+    already formed in that bucket, so a dissimilar first member cannot hide
+    a duplicate pair behind it. Buckets hold few distinct groups, so the
+    work stays close to linear in the number of records.
+
+    Returns:
+        Groups of indexes into `hackathons`, in first-seen order
+    """
+    if num_perm % bands:
+        raise ValueError("num_perm must be a multiple of bands")
+    rows = num_perm // bands
+    hasher = MinHasher(num_perm)
+    groups = _UnionFind(len(hackathons))
+
+    first_by_url = {}
+    buckets = defaultdict(list)
+    signatures = []
+
+    for i, h in enumerate(hackathons):
+        h = as_record(h)
+        url = h.detail_url
+        if url:
+            if url in first_by_url:
+                groups.union(first_by_url[url], i)
+            else:
+                first_by_url[url] = i
+
+        sig = hasher.signature(shingles(_dedup_text(h)))
+        signatures.append(sig)
+        if sig is None:
+            continue
+        for band in range(bands):
+            buckets[(band, sig[band * rows:(band + 1) * rows])].append(i)
+
+    for members in buckets.values():
+        representatives = []
+        for i in members:
+            matched = False
+            for rep in representatives:
+                if (groups.find(rep) == groups.find(i)
+                        or estimated_similarity(signatures[rep], signatures[i]) >= threshold):
+                    groups.union(rep, i)
+                    matched = True
+            if not matched:
+                representatives.append(i)
+
+    grouped = defaultdict(list)
+    for i in range(len(hackathons)):
+        grouped[groups.find(i)].append(i)
+    return list(grouped.values())
+
+
+def merge_duplicates(records: List) -> Hackathon:
+    """
+    Build the canonical record for one event
+
+    The most complete record wins, themes from every copy are merged in
+    first-seen order and other detail URLs are kept in `duplicate_urls`.
+    """
+    records = [as_record(h) for h in records]
+    best = max(records, key=lambda h: sum(1 for name in Hackathon.FIELDS if getattr(h, name)))
+    canonical = Hackathon.from_dict(best.to_dict())
+
+    themes = []
+    urls = []
+    for h in records:
+        for theme in h.themes or ():
+            if theme not in themes:
+                themes.append(theme)
+        url = h.detail_url
+        if url and url != canonical.detail_url and url not in urls:
+            urls.append(url)
+
+    if themes:
+        canonical['themes'] = themes
+    if urls:
+        canonical['duplicate_urls'] = urls
+    return canonical
+
+
+def dedupe_hackathons(hackathons: Iterable, threshold: float = 0.8,
+                      num_perm: int = 64, bands: int = 16) -> List[Hackathon]:
+    """Collapse duplicate and near-duplicate hackathons into one record per event"""
+    records = list(hackathons)
+    groups = find_duplicate_groups(records, threshold, num_perm, bands)
+    return [merge_duplicates([records[i] for i in group]) for group in groups]
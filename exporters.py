@@ -0,0 +1,164 @@
+import csv
+import gzip
+import json
+import os
+from collections import deque
+from itertools import islice
+from operator import attrgetter
+from typing import Iterable, List, Optional
+
+from models import Hackathon, as_record
+
+
+CSV_FIELDS = (
+    'title', 'status', 'location_type', 'dates', 'location',
+    'organizer', 'prizes', 'themes', 'website', 'detail_url'
+)
+FORMATS = ('csv', 'jsonl', 'parquet')
+
+_csv_values = attrgetter(*CSV_FIELDS)
+_THEMES_INDEX = CSV_FIELDS.index('themes')
+
+
+def _csv_row(h) -> list:
+    """Build a CSV row straight from the record's fields, without copying it"""
+    if isinstance(h, Hackathon):
+        row = list(_csv_values(h))
+    else:
+        row = [h.get(name) for name in CSV_FIELDS]
+    themes = row[_THEMES_INDEX]
+    if themes is not None:
+        row[_THEMES_INDEX] = ', '.join(themes)
+    return row
+
+
+def _to_dict(h) -> dict:
+    return h.to_dict() if isinstance(h, Hackathon) else h
+
+
+def _open_text(filename: str, compress: bool):
+    if compress:
+        return gzip.open(filename, 'wt', encoding='utf-8', newline='')
+    return open(filename, 'w', encoding='utf-8', newline='')
+
+
+def _write_csv(hackathons: Iterable, filename: str, compress: bool) -> int:
+    count = 0
+    with _open_text(filename, compress) as f:
+        writer = csv.writer(f)
+        writer.writerow(CSV_FIELDS)
+        for h in hackathons:
+            writer.writerow(_csv_row(h))
+            count += 1
+    return count
+
+
+def _write_jsonl(hackathons: Iterable, filename: str, compress: bool) -> int:
+    count = 0
+    with _open_text(filename, compress) as f:
+        for h in hackathons:
+            f.write(json.dumps(_to_dict(h), ensure_ascii=False))
+            f.write('\n')
+            count += 1
+    return count
+
+
+def _write_parquet(hackathons: Iterable, filename: str, compress: bool,
+                   batch_size: int = 10000) -> int:
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("Parquet export requires pyarrow (pip install pyarrow)")
+
+    types = {'themes': pa.list_(pa.string()), 'prize_amount': pa.float64(), 'prize_usd': pa.float64()}
+    schema = pa.schema([(name, types.get(name, pa.string())) for name in Hackathon.FIELDS])
+    count = 0
+    iterator = iter(hackathons)
+    with pq.ParquetWriter(filename, schema, compression='gzip' if compress else 'snappy') as writer:
+        while True:
+            batch = list(islice(iterator, batch_size))
+            if not batch:
+                break
+            columns = {name: [] for name in Hackathon.FIELDS}
+            for h in map(as_record, batch):
+                for name in Hackathon.FIELDS:
+                    value = getattr(h, name)
+                    columns[name].append(list(value) if name == 'themes' and value is not None else value)
+            writer.write_table(pa.Table.from_pydict(columns, schema=schema))
+            count += len(batch)
+    return count
+
+
+_WRITERS = {
+    'csv': _write_csv,
+    'jsonl': _write_jsonl,
+    'parquet': _write_parquet,
+}
+
+
+def _split_extension(filename: str):
+    """Split 'out/hackathons.csv.gz' into ('out/hackathons', '.csv.gz')"""
+    directory, base = os.path.split(filename)
+    stem, dot, ext = base.partition('.')
+    return os.path.join(directory, stem), dot + ext
+
+
+def shard_filename(filename: str, index: int) -> str:
+    """Name of the index-th shard, e.g. hackathons-00003.csv.gz"""
+    stem, ext = _split_extension(filename)
+    return f"{stem}-{index:05d}{ext}"
+
+
+def export_hackathons(hackathons: Iterable, filename: str, fmt: Optional[str] = None,
+                      compress: Optional[bool] = None, shard_size: Optional[int] = None,
+                      workers: int = 4) -> List[str]:
+    """
+    Stream hackathons into one or more export files
+
+    Args:
+        hackathons: Any iterable of Hackathon records (or dicts); consumed once
+        filename: Output path; the format and gzip compression are inferred
+                  from the extension (.csv, .jsonl, .parquet, optional .gz)
+        fmt: 'csv', 'jsonl' or 'parquet' to override the extension
+        compress: Force gzip compression on or off
+        shard_size: Records per file; shards are written concurrently
+        workers: Number of shards written at the same time
+
+    Returns:
+        List of files written
+    """
+    _, ext = _split_extension(filename)
+    parts = ext.lower().split('.')
+    if compress is None:
+        compress = parts[-1] == 'gz'
+    if fmt is None:
+        fmt = next((part for part in parts if part in FORMATS), 'csv')
+    if fmt not in _WRITERS:
+        raise ValueError(f"Unknown export format {fmt!r}, expected one of {FORMATS}")
+    write = _WRITERS[fmt]
+
+    if not shard_size:
+        write(hackathons, filename, compress)
+        return [filename]
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    files = []
+    iterator = iter(hackathons)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        while True:
+            batch = list(islice(iterator, shard_size))
+            if not batch:
+                break
+            # Keep at most `workers` shards in memory at once
+            if len(pending) >= workers:
+                pending.popleft().result()
+            shard = shard_filename(filename, len(files) + 1)
+            pending.append(pool.submit(write, batch, shard, compress))
+            files.append(shard)
+        for future in pending:
+            future.result()
+
+    return files
@@ -0,0 +1,175 @@
+import json
+import os
+import re
+from functools import lru_cache
+from typing import Dict, Optional
+
+from models import as_record
+
+
+GAZETTEER_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'gazetteer.json')
+
+# Bump when _resolve changes its answers, so persisted caches are rebuilt
+RESOLVER_VERSION = 2
+
+_SPACE_RE = re.compile(r'\s+')
+
+
+@lru_cache(maxsize=1)
+def _gazetteer():
+    """Alias lookup tables built once from the bundled gazetteer"""
+    with open(GAZETTEER_FILE, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    countries = {}
+    country_names = {}
+    for code, names in data['countries'].items():
+        country_names[code] = names[0]
+        for name in names:
+            countries[name.lower()] = code
+        countries.setdefault(code.lower(), code)
+
+    regions = {}
+    region_names = {}
+    for country, subdivisions in data['regions'].items():
+        lookup = regions.setdefault(country, {})
+        for code, names in subdivisions.items():
+            region_names[(country, code)] = names[0]
+            for name in names:
+                lookup[name.lower()] = code
+            lookup.setdefault(code.lower(), code)
+
+    return countries, country_names, regions, region_names
+
+
+def country_name(code: Optional[str]) -> Optional[str]:
+    """Canonical country name for an ISO code, e.g. 'US' -> 'United States'"""
+    return _gazetteer()[1].get(code, code) if code else None
+
+
+def region_name(country_code: Optional[str], region_code: Optional[str]) -> Optional[str]:
+    if not region_code:
+        return None
+    return _gazetteer()[3].get((country_code, region_code), region_code)
+
+
+def _resolve(location: str) -> Dict:
+    countries, _, regions, _ = _gazetteer()
+    text = _SPACE_RE.sub(' ', location).strip()
+    lowered = text.lower()
+
+    if not text or lowered == 'in-person':
+        return {}
+    # Scraped locations sometimes carry leftover theme text before "Online"
+    if lowered == 'online' or lowered.endswith(' online'):
+        return {'country_code': 'ONLINE'}
+
+    parts = [part.strip() for part in text.split(',') if part.strip()]
+    last = parts[-1].lower()
+    named_country = False
+    if len(parts) > 1 and len(last) == 2 and last in regions['US']:
+        # "Boston, MA": after a city, two letters are a state code, even
+        # where they are also a country code (MA is Morocco)
+        country = 'US'
+    else:
+        country = countries.get(last)
+        if country:
+            parts = parts[:-1]
+            named_country = True
+        elif last in regions['US']:
+            # "Austin, Texas" without a country
+            country = 'US'
+
+    result = {}
+    if country:
+        result['country_code'] = country
+
+    lookup = regions.get(country, {})
+    if parts:
+        last = parts[-1]
+        region = lookup.get(last.lower())
+        if region or len(parts) > 1:
+            result['region_code'] = region or last
+            # "Berlin, Germany" names a city that is also a state
+            if len(parts) > 1 or not named_country:
+                parts = parts[:-1]
+    if parts:
+        result['city'] = parts[0]
+    return result
+
+
+class LocationNormalizer:
+    """
+    Resolve free-text locations to country / region / city codes
+
+    Results are memoised per distinct string and can be persisted to a
+    JSON cache file, so each location is only ever parsed once. A cache
+    written by another RESOLVER_VERSION is ignored.
+    """
+
+    def __init__(self, cache_file: Optional[str] = None):
+        self.cache_file = cache_file
+        self.cache = {}
+        self.dirty = False
+        if cache_file and os.path.exists(cache_file):
+            try:
+                with open(cache_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('version') == RESOLVER_VERSION:
+                    self.cache = data['locations']
+            except Exception as e:
+                print(f"Error loading location cache {cache_file}: {e}")
+
+    def resolve(self, location: Optional[str]) -> Dict:
+        """
+        Returns:
+            Dict with any of country_code ('ONLINE' for online events),
+            region_code (ISO 3166-2 suffix when known, else the region name)
+            and city
+        """
+        if not location:
+            return {}
+        result = self.cache.get(location)
+        if result is None:
+            result = _resolve(location)
+            self.cache[location] = result
+            self.dirty = True
+        return result
+
+    def annotate(self, h):
+        """Store the resolved codes on a record"""
+        h.update(self.resolve(h.get('location')))
+        return h
+
+    def save(self):
+        if not self.cache_file or not self.dirty:
+            return
+        try:
+            with open(self.cache_file, 'w', encoding='utf-8') as f:
+                json.dump({'version': RESOLVER_VERSION, 'locations': self.cache}, f,
+                          ensure_ascii=False)
+            self.dirty = False
+        except Exception as e:
+            print(f"Error saving location cache {self.cache_file}: {e}")
+
+
+_default_normalizer = LocationNormalizer()
+
+
+def location_fields(location: Optional[str]) -> Dict:
+    """country_code / region_code / city for a location text, empty if unknown"""
+    return dict(_default_normalizer.resolve(location))
+
+
+def country_code_for(text: str) -> str:
+    """Country code for a code, name or alias given as a filter, e.g. 'usa' -> 'US'"""
+    return location_fields(text).get('country_code', text.upper())
+
+
+def record_location(h) -> Dict:
+    """Location codes of a record, resolving the text for records scraped before normalisation"""
+    h = as_record(h)
+    if h.country_code or h.city:
+        codes = (('country_code', h.country_code), ('region_code', h.region_code), ('city', h.city))
+        return {key: value for key, value in codes if value}
+    return _default_normalizer.resolve(h.location)
@@ -0,0 +1,205 @@
+import json
+import sqlite3
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional
+
+from models import Hackathon
+
+
+class SnapshotStore:
+    """
+    Append-only history of crawls stored in SQLite
+
+    Every field value is kept once per run of identical values: a snapshot
+    only writes rows for fields that were added, changed or removed since
+    the previous snapshot of the same scope (usually the theme). Each row
+    carries the snapshot it became valid in and the snapshot that replaced
+    it, so "state as of" and per-event history are single indexed queries
+    instead of a replay of every snapshot.
+    """
+
+    def __init__(self, db_path: str = 'hackathons_history.db'):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS snapshots (
+                id INTEGER PRIMARY KEY,
+                scope TEXT NOT NULL,
+                taken_at TEXT NOT NULL,
+                record_count INTEGER NOT NULL,
+                changed_fields INTEGER NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS snapshots_scope_time ON snapshots (scope, taken_at);
+
+            CREATE TABLE IF NOT EXISTS field_versions (
+                scope TEXT NOT NULL,
+                detail_url TEXT NOT NULL,
+                field TEXT NOT NULL,
+                value TEXT NOT NULL,
+                valid_from INTEGER NOT NULL REFERENCES snapshots (id),
+                valid_to INTEGER REFERENCES snapshots (id)
+            );
+            CREATE INDEX IF NOT EXISTS field_versions_open
+                ON field_versions (scope, valid_to, detail_url, field);
+            CREATE INDEX IF NOT EXISTS field_versions_from
+                ON field_versions (scope, valid_from);
+            CREATE INDEX IF NOT EXISTS field_versions_url
+                ON field_versions (detail_url, valid_from);
+        """)
+
+    def _open_versions(self, scope: str) -> Dict[str, Dict[str, str]]:
+        current = defaultdict(dict)
+        rows = self.conn.execute(
+            "SELECT detail_url, field, value FROM field_versions "
+            "WHERE scope = ? AND valid_to IS NULL", (scope,))
+        for url, field, value in rows:
+            current[url][field] = value
+        return current
+
+    def record(self, hackathons: Iterable, scope: str = 'remote',
+               taken_at: Optional[datetime] = None) -> Optional[int]:
+        """
+        Append a crawl as a delta against the previous snapshot of the scope
+
+        Records without a detail_url are skipped. An empty crawl is not
+        recorded, since it almost always means the scrape failed rather
+        than every hackathon disappearing.
+
+        Returns:
+            The new snapshot id, or None when nothing was recorded
+        """
+        records = {}
+        for h in hackathons:
+            data = h.to_dict() if isinstance(h, Hackathon) else h
+            if data.get('detail_url'):
+                records[data['detail_url']] = {
+                    field: json.dumps(value, ensure_ascii=False, sort_keys=True)
+                    for field, value in data.items()
+                }
+        if not records:
+            print(f"No hackathons to record for scope '{scope}', snapshot skipped")
+            return None
+
+        taken_at = _to_utc(taken_at or datetime.now(timezone.utc))
+        previous = self._open_versions(scope)
+
+        with self.conn:
+            snapshot_id = self.conn.execute(
+                "INSERT INTO snapshots (scope, taken_at, record_count, changed_fields) "
+                "VALUES (?, ?, ?, 0)", (scope, taken_at, len(records))
+            ).lastrowid
+
+            closed = []
+            opened = []
+            for url, fields in records.items():
+                old = previous.get(url, {})
+                for field, value in fields.items():
+                    if old.get(field) != value:
+                        if field in old:
+                            closed.append((url, field))
+                        opened.append((scope, url, field, value, snapshot_id))
+                for field in old.keys() - fields.keys():
+                    closed.append((url, field))
+
+            for url in previous.keys() - records.keys():
+                closed.extend((url, field) for field in previous[url])
+
+            self.conn.executemany(
+                "UPDATE field_versions SET valid_to = ? "
+                "WHERE scope = ? AND valid_to IS NULL AND detail_url = ? AND field = ?",
+                [(snapshot_id, scope, url, field) for url, field in closed]
+            )
+            self.conn.executemany(
+                "INSERT INTO field_versions (scope, detail_url, field, value, valid_from) "
+                "VALUES (?, ?, ?, ?, ?)", opened
+            )
+            self.conn.execute("UPDATE snapshots SET changed_fields = ? WHERE id = ?",
+                              (len(opened) + len(closed), snapshot_id))
+
+        return snapshot_id
+
+    def snapshot_as_of(self, when: str, scope: str = 'remote') -> Optional[int]:
+        """Id of the last snapshot of the scope taken at or before `when` (ISO date/time)"""
+        row = self.conn.execute(
+            "SELECT id FROM snapshots WHERE scope = ? AND taken_at <= ? "
+            "ORDER BY taken_at DESC, id DESC LIMIT 1", (scope, _as_upper_bound(when))
+        ).fetchone()
+        return row[0] if row else None
+
+    def state_as_of(self, when: str, scope: str = 'remote') -> List[Hackathon]:
+        """Hackathons as they were listed at `when` (ISO date or date/time)"""
+        snapshot_id = self.snapshot_as_of(when, scope)
+        if snapshot_id is None:
+            return []
+
+        records = {}
+        rows = self.conn.execute(
+            "SELECT detail_url, field, value FROM field_versions "
+            "WHERE scope = ? AND valid_from <= ? AND (valid_to IS NULL OR valid_to > ?) "
+            "ORDER BY rowid", (scope, snapshot_id, snapshot_id))
+        for url, field, value in rows:
+            records.setdefault(url, Hackathon())[field] = json.loads(value)
+        return list(records.values())
+
+    def history(self, detail_url: str, scope: Optional[str] = None) -> List[Dict]:
+        """
+        Changes to one hackathon, oldest first
+
+        Returns:
+            List of {'snapshot', 'scope', 'taken_at', 'changes'} where
+            `changes` maps each field to its new value (None when removed)
+        """
+        query = ("SELECT f.scope, f.field, f.value, f.valid_from, f.valid_to "
+                 "FROM field_versions f WHERE f.detail_url = ?")
+        params = [detail_url]
+        if scope is not None:
+            query += " AND f.scope = ?"
+            params.append(scope)
+
+        events = defaultdict(dict)
+        scopes = {}
+        for row_scope, field, value, valid_from, valid_to in self.conn.execute(query, params):
+            events[valid_from][field] = json.loads(value)
+            scopes[valid_from] = row_scope
+            if valid_to is not None:
+                events[valid_to].setdefault(field, None)
+                scopes[valid_to] = row_scope
+
+        if not events:
+            return []
+        ids = sorted(events)
+        taken = dict(self.conn.execute(
+            f"SELECT id, taken_at FROM snapshots WHERE id IN ({', '.join('?' * len(ids))})", ids))
+        return [
+            {'snapshot': i, 'scope': scopes[i], 'taken_at': taken.get(i), 'changes': events[i]}
+            for i in ids
+        ]
+
+    def snapshots(self, scope: Optional[str] = None) -> List[Dict]:
+        """Summary of the recorded snapshots, oldest first"""
+        query = "SELECT id, scope, taken_at, record_count, changed_fields FROM snapshots"
+        params = ()
+        if scope is not None:
+            query += " WHERE scope = ?"
+            params = (scope,)
+        columns = ('id', 'scope', 'taken_at', 'record_count', 'changed_fields')
+        return [dict(zip(columns, row)) for row in self.conn.execute(query + " ORDER BY id", params)]
+
+    def close(self):
+        self.conn.close()
+
+
+def _to_utc(moment: datetime) -> str:
+    """ISO timestamp in UTC so stored times compare correctly as strings"""
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc).isoformat(timespec='microseconds')
+
+
+def _as_upper_bound(when: str) -> str:
+    """Normalise a user supplied time; a bare date covers the whole day"""
+    moment = datetime.fromisoformat(when)
+    if len(when) == 10:
+        moment = moment.replace(hour=23, minute=59, second=59, microsecond=999999)
+    return _to_utc(moment)
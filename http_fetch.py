@@ -0,0 +1,64 @@
+"""
+Bounded concurrent HTTP fetching shared by the link checker and image cache
+
+Requests are limited by a global and a per-host semaphore taken before the
+request is made, rather than by the connector's own queue. A request that
+waits for a slot is therefore not yet running against its timeout, so a
+busy host cannot make the requests queued behind it time out, and timings
+taken inside the slot measure only the request itself.
+"""
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Awaitable, Callable, Iterable, List
+from urllib.parse import urlparse
+
+
+class RequestLimiter:
+    """Global and per-host concurrency limits for one batch of requests"""
+
+    def __init__(self, concurrency: int, per_host: int):
+        self.total = asyncio.Semaphore(concurrency)
+        self.per_host = per_host
+        self.hosts = {}
+
+    @asynccontextmanager
+    async def slot(self, url: str):
+        host = urlparse(url).netloc
+        if host not in self.hosts:
+            self.hosts[host] = asyncio.Semaphore(self.per_host)
+        # Host first: a request waiting for a busy host must not hold a global slot
+        async with self.hosts[host], self.total:
+            yield
+
+
+def make_session(concurrency: int, timeout: float, agent: str):
+    """
+    aiohttp session for use with RequestLimiter
+
+    The connector limit is only a cap, and the timeout covers connecting
+    and each read; a total timeout would also count time spent queued.
+    """
+    import aiohttp
+
+    connector = aiohttp.TCPConnector(limit=concurrency, limit_per_host=0, ttl_dns_cache=300)
+    client_timeout = aiohttp.ClientTimeout(total=None, sock_connect=timeout, sock_read=timeout)
+    headers = {'User-Agent': f'Mozilla/5.0 (compatible; {agent})'}
+    return aiohttp.ClientSession(connector=connector, timeout=client_timeout, headers=headers)
+
+
+async def fetch_all(urls: Iterable[str], fetch: Callable[..., Awaitable], concurrency: int,
+                    per_host: int, timeout: float, agent: str) -> List:
+    """
+    Run `fetch(session, url)` for every URL within the limits
+
+    Returns:
+        The results of `fetch`, in the order of `urls`
+    """
+    limiter = RequestLimiter(concurrency, per_host)
+
+    async with make_session(concurrency, timeout, agent) as session:
+        async def bounded(url):
+            async with limiter.slot(url):
+                return await fetch(session, url)
+
+        return await asyncio.gather(*(bounded(url) for url in urls))
@@ -0,0 +1,198 @@
+import asyncio
+import hashlib
+import json
+import mimetypes
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from http_fetch import fetch_all
+
+
+THUMBNAIL_SIZE = (400, 300)
+
+_CONTENT_TYPE_EXTENSIONS = {
+    'image/jpeg': '.jpg',
+    'image/png': '.png',
+    'image/gif': '.gif',
+    'image/webp': '.webp',
+    'image/svg+xml': '.svg',
+}
+
+
+def _extension(url: str, content_type: Optional[str]) -> str:
+    if content_type:
+        ext = _CONTENT_TYPE_EXTENSIONS.get(content_type.split(';')[0].strip().lower())
+        if ext:
+            return ext
+    ext = os.path.splitext(urlparse(url).path)[1].lower()
+    return ext if ext in mimetypes.types_map else '.img'
+
+
+def _write_atomic(path: str, data: bytes):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def make_thumbnail(source: str, target: str, size: Tuple[int, int] = THUMBNAIL_SIZE) -> Optional[str]:
+    """
+    Render a fixed-size JPEG thumbnail, padding with white to keep the aspect ratio
+
+    Runs in worker processes, so it only takes and returns plain values.
+
+    Returns:
+        None on success, otherwise the error message
+    """
+    from PIL import Image, ImageOps
+
+    try:
+        with Image.open(source) as image:
+            image = ImageOps.exif_transpose(image)
+            if image.mode in ('RGBA', 'LA', 'P'):
+                image = image.convert('RGBA')
+                background = Image.new('RGB', image.size, (255, 255, 255))
+                background.paste(image, mask=image.getchannel('A'))
+                image = background
+            else:
+                image = image.convert('RGB')
+            thumbnail = ImageOps.pad(image, size, color=(255, 255, 255))
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            tmp_path = f"{target}.{os.getpid()}.tmp"
+            thumbnail.save(tmp_path, 'JPEG', quality=85, optimize=True)
+            os.replace(tmp_path, target)
+        return None
+    except Exception as e:
+        return f"{type(e).__name__}: {e}"
+
+
+class ImageCache:
+    """
+    Content-addressed store of hackathon card images and their thumbnails
+
+    Originals are saved once per distinct content under
+    originals/<2 hex>/<sha256><ext>, so the many identical placeholder
+    images collapse into one file. index.json remembers which URL produced
+    which hash, so known URLs are never downloaded again. Thumbnails live in
+    thumbnails/<W>x<H>/<2 hex>/<sha256>.jpg and are only rendered when
+    missing.
+    """
+
+    def __init__(self, root: str = 'image_cache', concurrency: int = 32, per_host: int = 8,
+                 timeout: float = 30, thumbnail_size: Tuple[int, int] = THUMBNAIL_SIZE,
+                 processes: Optional[int] = None):
+        self.root = root
+        self.concurrency = concurrency
+        self.per_host = per_host
+        self.timeout = timeout
+        self.thumbnail_size = tuple(thumbnail_size)
+        self.processes = processes
+        self.index_file = os.path.join(root, 'index.json')
+        self.index = self._load_index()
+
+    def _load_index(self) -> Dict[str, Dict]:
+        if not os.path.exists(self.index_file):
+            return {}
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"Error loading image index {self.index_file}: {e}")
+            return {}
+
+    def save_index(self):
+        os.makedirs(self.root, exist_ok=True)
+        tmp_path = f"{self.index_file}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.index, f, ensure_ascii=False)
+        os.replace(tmp_path, self.index_file)
+
+    def original_path(self, sha256: str, ext: str) -> str:
+        return os.path.join(self.root, 'originals', sha256[:2], sha256 + ext)
+
+    def thumbnail_path(self, sha256: str) -> str:
+        width, height = self.thumbnail_size
+        return os.path.join(self.root, 'thumbnails', f"{width}x{height}", sha256[:2], sha256 + '.jpg')
+
+    def _is_cached(self, url: str) -> bool:
+        entry = self.index.get(url)
+        return entry is not None and os.path.exists(self.original_path(entry['sha256'], entry['ext']))
+
+    async def _download(self, session, url: str) -> bool:
+        import aiohttp
+
+        try:
+            async with session.get(url) as response:
+                response.raise_for_status()
+                data = await response.read()
+                content_type = response.headers.get('Content-Type')
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            print(f"Error downloading {url}: {e}")
+            return False
+
+        sha256 = hashlib.sha256(data).hexdigest()
+        ext = _extension(url, content_type)
+        path = self.original_path(sha256, ext)
+        if not os.path.exists(path):
+            _write_atomic(path, data)
+        self.index[url] = {'sha256': sha256, 'ext': ext, 'bytes': len(data)}
+        return True
+
+    async def download(self, urls: Iterable[str]) -> int:
+        """Download every URL not already in the store; returns the number downloaded"""
+        pending = sorted({url for url in urls if url and not self._is_cached(url)})
+        if not pending:
+            return 0
+
+        results = await fetch_all(pending, self._download, self.concurrency, self.per_host,
+                                  self.timeout, 'hackathon-image-cache')
+        return sum(results)
+
+    def make_thumbnails(self, hashes: Iterable[Tuple[str, str]]) -> int:
+        """Render missing thumbnails for (sha256, ext) pairs in a process pool"""
+        jobs = {}
+        for sha256, ext in hashes:
+            target = self.thumbnail_path(sha256)
+            if sha256 not in jobs and not os.path.exists(target):
+                jobs[sha256] = (self.original_path(sha256, ext), target)
+        if not jobs:
+            return 0
+
+        sources, targets = zip(*jobs.values())
+        sizes = [self.thumbnail_size] * len(jobs)
+        with ProcessPoolExecutor(max_workers=self.processes) as pool:
+            errors = list(pool.map(make_thumbnail, sources, targets, sizes, chunksize=16))
+
+        for source, error in zip(sources, errors):
+            if error:
+                print(f"Error creating thumbnail for {source}: {error}")
+        return sum(1 for error in errors if error is None)
+
+    def cache_hackathons(self, hackathons: Iterable) -> List:
+        """
+        Download card images and render thumbnails for the given records
+
+        Each record with a cached image gets `image_sha256`, which locates
+        both the original and the thumbnail.
+
+        Returns:
+            The records
+        """
+        records = list(hackathons)
+        downloaded = asyncio.run(self.download(h.get('image_url') for h in records))
+        self.save_index()
+
+        hashes = []
+        for h in records:
+            entry = self.index.get(h.get('image_url'))
+            if entry:
+                h['image_sha256'] = entry['sha256']
+                hashes.append((entry['sha256'], entry['ext']))
+
+        rendered = self.make_thumbnails(hashes)
+        unique = len({sha256 for sha256, _ in hashes})
+        print(f"Images: {downloaded} fetched, {unique} unique, {rendered} thumbnails rendered")
+        return records
@@ -0,0 +1,123 @@
+import asyncio
+import json
+import os
+import time
+from typing import Dict, Iterable, List, Optional
+
+from http_fetch import fetch_all
+
+
+LINK_FIELDS = ('website', 'image_url')
+
+
+class LinkChecker:
+    """
+    Check hackathon website and image links concurrently
+
+    Requests are made through http_fetch, limited overall and per host so
+    that thousands of distinct hosts can be checked at once without
+    hammering any single one. Results are cached on disk and
+    reused until they are older than `ttl` seconds; failures (errors and 5xx
+    responses) are usually transient and are only reused for `error_ttl`.
+    """
+
+    def __init__(self, concurrency: int = 200, per_host: int = 4, timeout: float = 15,
+                 ttl: float = 24 * 3600, error_ttl: float = 0,
+                 cache_file: Optional[str] = 'link_cache.json'):
+        self.concurrency = concurrency
+        self.per_host = per_host
+        self.timeout = timeout
+        self.ttl = ttl
+        self.error_ttl = error_ttl
+        self.cache_file = cache_file
+        self.cache = self._load_cache()
+
+    def _load_cache(self) -> Dict[str, Dict]:
+        if not self.cache_file or not os.path.exists(self.cache_file):
+            return {}
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"Error loading link cache {self.cache_file}: {e}")
+            return {}
+
+    def save_cache(self):
+        if not self.cache_file:
+            return
+        try:
+            with open(self.cache_file, 'w', encoding='utf-8') as f:
+                json.dump(self.cache, f, ensure_ascii=False)
+        except Exception as e:
+            print(f"Error saving link cache {self.cache_file}: {e}")
+
+    def _is_fresh(self, url: str, now: float) -> bool:
+        entry = self.cache.get(url)
+        if entry is None:
+            return False
+        failed = entry['error'] is not None or entry['status'] >= 500
+        return now - entry['checked_at'] < (self.error_ttl if failed else self.ttl)
+
+    async def _check(self, session, url: str) -> Dict:
+        import aiohttp
+
+        started = time.perf_counter()
+        result = {'status': None, 'final_url': None, 'redirects': 0,
+                  'latency_ms': None, 'error': None, 'checked_at': time.time()}
+        try:
+            async with session.head(url, allow_redirects=True) as response:
+                status, final_url, history = response.status, str(response.url), response.history
+            # Plenty of servers reject HEAD; confirm failures with a GET
+            if status >= 400:
+                async with session.get(url, allow_redirects=True) as response:
+                    status, final_url, history = response.status, str(response.url), response.history
+            result['status'] = status
+            result['redirects'] = len(history)
+            if final_url != url:
+                result['final_url'] = final_url
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            result['error'] = f"{type(e).__name__}: {e}" if str(e) else type(e).__name__
+        result['latency_ms'] = round((time.perf_counter() - started) * 1000, 1)
+        return result
+
+    async def check_urls(self, urls: Iterable[str]) -> Dict[str, Dict]:
+        """Check every distinct URL not already in the cache"""
+        now = time.time()
+        pending = sorted({url for url in urls if url and not self._is_fresh(url, now)})
+
+        if pending:
+            results = await fetch_all(pending, self._check, self.concurrency, self.per_host,
+                                      self.timeout, 'hackathon-link-checker')
+            self.cache.update(zip(pending, results))
+
+        return self.cache
+
+    def check_hackathons(self, hackathons: Iterable) -> List:
+        """
+        Annotate each record with a `link_health` entry per checked field
+
+        Returns:
+            The records, each with link_health = {field: {status, final_url,
+            redirects, latency_ms, error, checked_at}}
+        """
+        records = list(hackathons)
+        urls = [h.get(field) for h in records for field in LINK_FIELDS]
+        results = asyncio.run(self.check_urls(urls))
+        self.save_cache()
+
+        for h in records:
+            health = {field: results[h.get(field)] for field in LINK_FIELDS if h.get(field)}
+            if health:
+                h['link_health'] = health
+        return records
+
+
+def broken_links(hackathons: Iterable) -> List[Dict]:
+    """List (title, field, url, status/error) for every link that did not resolve"""
+    broken = []
+    for h in hackathons:
+        for field, result in h.get('link_health', {}).items():
+            if result['error'] or result['status'] >= 400:
+                broken.append({'title': h.get('title'), 'field': field, 'url': h.get(field),
+                               'status': result['status'], 'error': result['error']})
+    return broken
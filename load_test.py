@@ -0,0 +1,111 @@
+"""
+Load test for api_server.py
+
+Keeps a fixed number of requests in flight against a list of API paths for
+a set duration and reports throughput, latency percentiles and status codes.
+
+Examples:
+    python load_test.py --url http://127.0.0.1:8080
+    python load_test.py --concurrency 128 --duration 30 --etag
+    python load_test.py --path "/hackathons?theme=ai&limit=50" --path /stats
+"""
+import argparse
+import asyncio
+import itertools
+import time
+from collections import Counter
+from typing import Dict, List
+
+
+DEFAULT_PATHS = (
+    '/stats',
+    '/hackathons',
+    '/hackathons?status=Ended&limit=50',
+    '/hackathons?theme=ai',
+    '/hackathons?online=yes&offset=20',
+    '/hackathons?has_prizes=yes&min_prize=1000',
+    '/hackathons?country=US',
+    '/search?q=hack',
+    '/search?q=ai&limit=5',
+)
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+async def run_load_test(base_url: str, paths, concurrency: int = 64, duration: float = 10,
+                        use_etag: bool = False) -> Dict:
+    """
+    Args:
+        use_etag: Send If-None-Match with the last ETag seen for each path,
+            like a polling client would
+
+    Returns:
+        Dict with requests, requests_per_second, latency_ms percentiles and
+        status counts
+    """
+    import aiohttp
+
+    latencies = []
+    statuses = Counter()
+    etags = {}
+    cycle = itertools.cycle(paths)
+    deadline = time.perf_counter() + duration
+
+    connector = aiohttp.TCPConnector(limit=concurrency)
+    async with aiohttp.ClientSession(base_url, connector=connector) as session:
+        async def client():
+            while time.perf_counter() < deadline:
+                path = next(cycle)
+                headers = {'If-None-Match': etags[path]} if use_etag and path in etags else None
+                started = time.perf_counter()
+                try:
+                    async with session.get(path, headers=headers) as response:
+                        await response.read()
+                        statuses[response.status] += 1
+                        if 'ETag' in response.headers:
+                            etags[path] = response.headers['ETag']
+                except aiohttp.ClientError as e:
+                    statuses[type(e).__name__] += 1
+                latencies.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(client() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        'requests': len(latencies),
+        'seconds': round(elapsed, 2),
+        'requests_per_second': round(len(latencies) / elapsed, 1),
+        'latency_ms': {name: round(percentile(latencies, fraction) * 1000, 2)
+                       for name, fraction in (('p50', 0.5), ('p95', 0.95), ('p99', 0.99), ('max', 1.0))},
+        'statuses': dict(statuses),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load test the hackathon HTTP API")
+    parser.add_argument('--url', default='http://127.0.0.1:8080', help="Base URL of the API")
+    parser.add_argument('--path', action='append', help="Path to request (repeatable, default: a mix)")
+    parser.add_argument('--concurrency', type=int, default=64, help="Requests kept in flight")
+    parser.add_argument('--duration', type=float, default=10, help="Seconds to run")
+    parser.add_argument('--etag', action='store_true', help="Revalidate with If-None-Match")
+    args = parser.parse_args(argv)
+
+    result = asyncio.run(run_load_test(args.url, args.path or DEFAULT_PATHS,
+                                       args.concurrency, args.duration, args.etag))
+    latency = result['latency_ms']
+    print(f"{result['requests']} requests in {result['seconds']}s "
+          f"= {result['requests_per_second']} req/s")
+    print(f"Latency ms: p50 {latency['p50']}  p95 {latency['p95']}  "
+          f"p99 {latency['p99']}  max {latency['max']}")
+    print(f"Statuses: {result['statuses']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+import sys
+from typing import Dict
+
+
+# Known values for the enum-like fields; anything else is still accepted
+STATUSES = ('Upcoming', 'Open', 'Ended')
+LOCATION_TYPES = ('ONLINE', 'IN-PERSON')
+
+_MISSING = object()
+
+
+def _intern(value):
+    """Share one string object between all records using the same value"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class Hackathon:
+    """
+    Compact record for a single hackathon
+
+    Fields match the keys produced by the scraper. Unset fields are None and
+    are left out of to_dict(); fields set to an explicit None are remembered
+    and written back as null, so records round-trip to the JSON shape
+    unchanged. Unknown keys are kept in `extra`.
+
+    Code that loops over many records should read the slots directly
+    (`h.status`, `h.themes or ()`). The dict-style accessors (get, [], in,
+    update) are a slower compatibility layer for dict-based code; like a
+    missing key, a null field is absent from them.
+    """
+
+    __slots__ = (
+        'title', 'detail_url', 'image_url', 'location_type', 'dates', 'status',
+        'short_description', 'themes', 'location', 'full_description',
+        'start_date', 'end_date', 'organizer', 'prizes', 'website',
+        'prize_amount', 'prize_currency', 'prize_usd',
+        'country_code', 'region_code', 'city', 'extra', '_nulls',
+    )
+
+    FIELDS = __slots__[:-2]
+    _FIELD_SET = frozenset(FIELDS)
+    _INTERNED = frozenset(('status', 'location_type', 'prize_currency', 'country_code', 'region_code'))
+
+    def __init__(self, **fields):
+        for name in self.__slots__:
+            object.__setattr__(self, name, None)
+        self.update(fields)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Hackathon':
+        """Build a record from the scraper's JSON shape"""
+        record = cls()
+        record.update(data)
+        return record
+
+    def to_dict(self) -> Dict:
+        """Convert back to the scraper's JSON shape"""
+        data = {}
+        for name in self.FIELDS:
+            value = getattr(self, name)
+            if value is not None:
+                data[name] = list(value) if name == 'themes' else value
+            elif self._nulls and name in self._nulls:
+                data[name] = None
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    def update(self, data: Dict):
+        for key, value in data.items():
+            self[key] = value
+
+    def get(self, key: str, default=None):
+        if key in self._FIELD_SET:
+            value = getattr(self, key)
+            return default if value is None else value
+        if self.extra:
+            return self.extra.get(key, default)
+        return default
+
+    def __setitem__(self, key: str, value):
+        if key not in self._FIELD_SET:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
+            return
+
+        if value is None:
+            if self._nulls is None:
+                self._nulls = set()
+            self._nulls.add(key)
+        elif self._nulls:
+            self._nulls.discard(key)
+
+        if key == 'themes' and value is not None:
+            value = tuple(_intern(theme) for theme in value)
+        elif key in self._INTERNED:
+            value = _intern(value)
+        setattr(self, key, value)
+
+    def __getitem__(self, key: str):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Hackathon):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        return f"Hackathon(title={self.title!r}, detail_url={self.detail_url!r})"
+
+
+def as_record(h) -> Hackathon:
+    """`h` itself if it is a Hackathon, otherwise a record built from the dict"""
+    return h if isinstance(h, Hackathon) else Hackathon.from_dict(h)
+
+
+def is_online(h) -> bool:
+    """Whether a hackathon is held online, from its badge or its location"""
+    h = as_record(h)
+    if h.location_type:
+        return h.location_type.upper() == 'ONLINE'
+    if h.country_code:
+        return h.country_code == 'ONLINE'
+    return (h.location or '').strip().lower() == 'online'
+
+
+def to_json_default(obj) -> Dict:
+    """`default` hook for json.dump so records serialise like dicts"""
+    if isinstance(obj, Hackathon):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
@@ -0,0 +1,213 @@
+import json
+import os
+import re
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from models import as_record, is_online
+
+
+FX_RATES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fx_rates.json')
+
+# Symbols and words that mark an amount as money, mapped to ISO codes
+_SYMBOLS = {
+    'US$': 'USD', 'AU$': 'AUD', 'A$': 'AUD', 'CA$': 'CAD', 'C$': 'CAD', 'NZ$': 'NZD',
+    'HK$': 'HKD', 'S$': 'SGD', 'R$': 'BRL', '$': 'USD', '€': 'EUR', '£': 'GBP',
+    '₹': 'INR', 'Rs.': 'INR', 'Rs': 'INR', '¥': 'JPY', '₦': 'NGN', '₩': 'KRW', '₺': 'TRY',
+}
+_SYMBOLS_LOWER = {symbol.lower(): code for symbol, code in _SYMBOLS.items()}
+_WORDS = {
+    'dollars': 'USD', 'dollar': 'USD', 'euros': 'EUR', 'euro': 'EUR',
+    'pounds': 'GBP', 'rupees': 'INR', 'zł': 'PLN',
+}
+_MULTIPLIERS = {
+    'k': 1e3, 'thousand': 1e3, 'm': 1e6, 'mm': 1e6, 'million': 1e6,
+    'lakh': 1e5, 'lakhs': 1e5, 'crore': 1e7, 'crores': 1e7,
+}
+
+
+@lru_cache(maxsize=1)
+def load_fx_rates(filename: str = FX_RATES_FILE) -> Dict[str, float]:
+    """USD value of one unit of each currency, from the bundled table"""
+    with open(filename, 'r', encoding='utf-8') as f:
+        return json.load(f)['rates']
+
+
+def _alternation(options: Iterable[str]) -> str:
+    return '|'.join(re.escape(option) for option in sorted(options, key=len, reverse=True))
+
+
+def _build_patterns():
+    codes = _alternation(load_fx_rates())
+    # Symbols spelt with letters (Rs, US$) must be a word of their own, not
+    # the tail of "Winners 100" or "Partners 5k", and match case-sensitively
+    lettered = _alternation(symbol for symbol in _SYMBOLS if symbol[0].isalpha())
+    signs = _alternation(symbol for symbol in _SYMBOLS if not symbol[0].isalpha())
+    not_letter = r'[^\W\d_]'
+    symbols = rf'{signs}|(?-i:(?<!{not_letter})(?:{lettered})(?!{not_letter}))'
+    words = _alternation(_WORDS)
+    multipliers = _alternation(_MULTIPLIERS)
+    # Indian (1,00,000), grouped (10,000 / 7 000), dot-grouped with an
+    # optional decimal comma (5.000 / 5.000,50) or plain (4000.00) numbers
+    number = (r'(?P<num>\d{1,2}(?:,\d{2})+,\d{3}(?:\.\d+)?'
+              r'|\d{1,3}(?:[,\u00a0\u202f ]\d{3})+(?:\.\d+)?'
+              r'|(?P<dotted>\d{1,3}(?:\.\d{3})+(?:,\d{1,2})?)(?![.,]?\d)'
+              r'|\d+(?:\.\d+)?)')
+    multiplier = rf'(?:\s?(?P<mult>{multipliers})\b)?'
+    prefixed = re.compile(
+        rf'(?:(?P<sym>{symbols})|(?-i:\b(?P<code>{codes})\b))\s?{number}{multiplier}',
+        re.IGNORECASE)
+    suffixed = re.compile(
+        rf'(?<![\d.,]){number}{multiplier}\s?(?:(?P<sym>{symbols})|(?-i:\b(?P<code>{codes})\b)|(?P<word>(?:{words})\b))',
+        re.IGNORECASE)
+    return prefixed, suffixed
+
+
+_PATTERNS = None
+
+
+def _currency(match) -> str:
+    if match.group('sym'):
+        return _SYMBOLS_LOWER[match.group('sym').lower()]
+    if match.group('code'):
+        return match.group('code').upper()
+    return _WORDS[match.group('word').lower()]
+
+
+def _amount(match) -> float:
+    num = match.group('num')
+    if match.group('dotted'):
+        num = num.replace('.', '').replace(',', '.')
+    value = float(re.sub(r'[,\u00a0\u202f ]', '', num))
+    if match.group('mult'):
+        value *= _MULTIPLIERS[match.group('mult').lower()]
+    return value
+
+
+def parse_prize(text: Optional[str]) -> Optional[Tuple[float, str]]:
+    """
+    Extract the headline prize from free text as (amount, currency)
+
+    Only amounts tagged with a currency symbol, code or word count. When
+    several are mentioned the one worth the most in USD is taken, since
+    prize texts usually state the total pool next to the individual places.
+    """
+    global _PATTERNS
+    if not text:
+        return None
+    if _PATTERNS is None:
+        _PATTERNS = _build_patterns()
+
+    rates = load_fx_rates()
+    best = None
+    for pattern in _PATTERNS:
+        for match in pattern.finditer(text):
+            currency = _currency(match)
+            amount = _amount(match)
+            usd = amount * rates.get(currency, 0)
+            if best is None or usd > best[2]:
+                best = (amount, currency, usd)
+    return (best[0], best[1]) if best else None
+
+
+def to_usd(amount: float, currency: str) -> Optional[float]:
+    rate = load_fx_rates().get(currency)
+    return round(amount * rate, 2) if rate is not None else None
+
+
+def prize_fields(text: Optional[str]) -> Dict:
+    """prize_amount / prize_currency / prize_usd for a prizes text, empty if none found"""
+    parsed = parse_prize(text)
+    if not parsed:
+        return {}
+    amount, currency = parsed
+    return {'prize_amount': amount, 'prize_currency': currency, 'prize_usd': to_usd(amount, currency)}
+
+
+def prize_usd(h) -> Optional[float]:
+    """USD prize of a record, parsing the text for records scraped before normalisation"""
+    h = as_record(h)
+    value = h.prize_usd
+    if value is None and h.prizes:
+        value = prize_fields(h.prizes).get('prize_usd')
+    return value
+
+
+PRIZE_BUCKETS = (
+    ('< $1k', 1_000),
+    ('$1k - $10k', 10_000),
+    ('$10k - $50k', 50_000),
+    ('$50k - $100k', 100_000),
+    ('$100k+', float('inf')),
+)
+
+
+def prize_distribution(values: Iterable[float]) -> Dict:
+    """Aggregate USD prize amounts into totals, median and buckets"""
+    values = sorted(values)
+    buckets = {label: 0 for label, _ in PRIZE_BUCKETS}
+    for value in values:
+        label = next(label for label, upper in PRIZE_BUCKETS if value < upper)
+        buckets[label] += 1
+
+    count = len(values)
+    if count:
+        middle = count // 2
+        median = values[middle] if count % 2 else (values[middle - 1] + values[middle]) / 2
+    else:
+        median = 0
+    return {
+        'count': count,
+        'total_usd': round(sum(values), 2),
+        'median_usd': round(median, 2),
+        'max_usd': values[-1] if values else 0,
+        'buckets': buckets,
+    }
+
+
+class PrizeIndex:
+    """
+    Hackathons sorted by USD prize with posting sets per theme and format
+
+    Answers "prize >= X, online, theme Y" with a binary search plus set
+    lookups instead of re-parsing every prize text.
+    """
+
+    def __init__(self, hackathons: Iterable):
+        ranked = []
+        for h in hackathons:
+            h = as_record(h)
+            usd = prize_usd(h)
+            if usd is not None:
+                ranked.append((usd, h))
+        ranked.sort(key=lambda item: item[0])
+
+        self.amounts = [usd for usd, _ in ranked]
+        self.records = [h for _, h in ranked]
+        self.by_theme = {}
+        self.online = set()
+        for position, h in enumerate(self.records):
+            for theme in h.themes or ():
+                self.by_theme.setdefault(theme, set()).add(position)
+            if is_online(h):
+                self.online.add(position)
+
+    def query(self, min_usd: float = 0, max_usd: Optional[float] = None,
+              theme: Optional[str] = None, online: Optional[bool] = None,
+              limit: Optional[int] = None) -> List:
+        """Matching hackathons, highest prize first"""
+        low = bisect_left(self.amounts, min_usd)
+        high = len(self.amounts) if max_usd is None else bisect_right(self.amounts, max_usd)
+
+        theme_positions = self.by_theme.get(theme, set()) if theme else None
+        results = []
+        for position in range(high - 1, low - 1, -1):
+            if theme_positions is not None and position not in theme_positions:
+                continue
+            if online is not None and (position in self.online) != online:
+                continue
+            results.append(self.records[position])
+            if limit and len(results) >= limit:
+                break
+        return results
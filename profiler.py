@@ -0,0 +1,218 @@
+"""
+Opt-in profiling of pipeline stages
+
+Wrap work in `profiler.stage(name)` (nested stages are recorded as
+"outer/inner") and instrument methods of a class for the duration of a
+run with `profiler.instrumented(cls, '_plot_')`. Each stage records its
+wall and CPU time and, when memory tracking is on, the tracemalloc peak
+above the memory in use when it started. The stages at one nesting level
+can also be written out as cProfile dumps. The JSON report has the same
+shape for every run, so two runs can be diffed with compare_reports().
+
+Memory tracking makes Python code noticeably slower; compare timings
+only between runs made with the same settings.
+"""
+import cProfile
+import fnmatch
+import functools
+import json
+import os
+import platform
+import re
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+
+REPORT_VERSION = 1
+
+
+class _Frame:
+    __slots__ = ('name', 'start_memory', 'peak_memory')
+
+    def __init__(self, name: str, start_memory: int):
+        self.name = name
+        self.start_memory = start_memory
+        self.peak_memory = start_memory
+
+
+class StageProfiler:
+    """Collects per-stage timings and memory peaks for one run"""
+
+    def __init__(self, memory: bool = True, cprofile_dir: Optional[str] = None,
+                 cprofile_depth: int = 0):
+        """
+        Args:
+            memory: Track peak memory per stage with tracemalloc
+            cprofile_dir: Write a cProfile dump for every stage at `cprofile_depth`
+            cprofile_depth: Nesting level of the dumped stages (0 = outermost);
+                cProfile cannot nest, so only one level can be dumped
+        """
+        self.memory = memory
+        self.cprofile_dir = cprofile_dir
+        self.cprofile_depth = cprofile_depth
+        self.stages: Dict[str, Dict] = {}
+        self._stack: List[_Frame] = []
+        self._started = time.perf_counter()
+        self._started_at = datetime.now(timezone.utc).isoformat(timespec='seconds')
+        self._owns_tracemalloc = False
+        if memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._owns_tracemalloc = True
+        if cprofile_dir:
+            os.makedirs(cprofile_dir, exist_ok=True)
+
+    def _enter_memory(self, name: str) -> _Frame:
+        if not self.memory:
+            return _Frame(name, 0)
+        current, peak = tracemalloc.get_traced_memory()
+        # reset_peak() is global, so fold the peak so far into every open stage first
+        for frame in self._stack:
+            frame.peak_memory = max(frame.peak_memory, peak)
+        tracemalloc.reset_peak()
+        return _Frame(name, current)
+
+    def _exit_memory(self, frame: _Frame) -> int:
+        if not self.memory:
+            return 0
+        _, peak = tracemalloc.get_traced_memory()
+        frame.peak_memory = max(frame.peak_memory, peak)
+        for parent in self._stack:
+            parent.peak_memory = max(parent.peak_memory, frame.peak_memory)
+        return frame.peak_memory - frame.start_memory
+
+    @contextmanager
+    def stage(self, name: str):
+        """Time the enclosed block as one call of stage `name`"""
+        path = '/'.join([frame.name for frame in self._stack] + [name])
+        if path not in self.stages:
+            # Registered on entry so the report lists parents before children
+            self.stages[path] = {'calls': 0, 'wall_s': 0.0, 'cpu_s': 0.0,
+                                 'max_wall_s': 0.0, 'peak_memory_mb': 0.0}
+        dump = self.cprofile_dir and len(self._stack) == self.cprofile_depth
+        profile = cProfile.Profile() if dump else None
+
+        frame = self._enter_memory(name)
+        self._stack.append(frame)
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        if profile:
+            profile.enable()
+        try:
+            yield
+        finally:
+            if profile:
+                profile.disable()
+            wall = time.perf_counter() - wall
+            cpu = time.process_time() - cpu
+            self._stack.pop()
+            peak = self._exit_memory(frame)
+            self._record(path, wall, cpu, peak)
+            if profile:
+                filename = re.sub(r'[^\w.-]+', '_', path) + '.prof'
+                profile.dump_stats(os.path.join(self.cprofile_dir, filename))
+
+    def _record(self, path: str, wall: float, cpu: float, peak: int):
+        entry = self.stages[path]
+        entry['calls'] += 1
+        entry['wall_s'] += wall
+        entry['cpu_s'] += cpu
+        entry['max_wall_s'] = max(entry['max_wall_s'], wall)
+        entry['peak_memory_mb'] = max(entry['peak_memory_mb'], peak / 2 ** 20)
+
+    def wrap(self, name: str, func):
+        """`func` recorded as stage `name` on every call"""
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with self.stage(name):
+                return func(*args, **kwargs)
+        return wrapper
+
+    @contextmanager
+    def instrumented(self, cls, *patterns: str):
+        """
+        Record every method of `cls` matching the glob patterns as a stage
+
+        The methods are restored when the block exits.
+        """
+        originals = {}
+        for attr, value in list(vars(cls).items()):
+            if callable(value) and any(fnmatch.fnmatchcase(attr, p) for p in patterns):
+                originals[attr] = value
+                setattr(cls, attr, self.wrap(attr, value))
+        try:
+            yield
+        finally:
+            for attr, value in originals.items():
+                setattr(cls, attr, value)
+
+    def report(self, command: Optional[str] = None) -> Dict:
+        stages = []
+        for path, entry in self.stages.items():
+            stages.append({
+                'stage': path,
+                'depth': path.count('/'),
+                'calls': entry['calls'],
+                'wall_s': round(entry['wall_s'], 4),
+                'cpu_s': round(entry['cpu_s'], 4),
+                'max_wall_s': round(entry['max_wall_s'], 4),
+                'peak_memory_mb': round(entry['peak_memory_mb'], 2) if self.memory else None,
+            })
+        return {
+            'version': REPORT_VERSION,
+            'started_at': self._started_at,
+            'command': command if command is not None else ' '.join(sys.argv),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'memory_tracking': self.memory,
+            'total_wall_s': round(time.perf_counter() - self._started, 4),
+            'stages': stages,
+        }
+
+    def write_report(self, filename: str, command: Optional[str] = None) -> Dict:
+        report = self.report(command)
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        return report
+
+    def close(self):
+        if self._owns_tracemalloc:
+            tracemalloc.stop()
+            self._owns_tracemalloc = False
+
+
+def print_report(report: Dict):
+    """Print the stages of a report as an indented table"""
+    memory = report.get('memory_tracking')
+    print(f"{'Stage':<48} {'Calls':>6} {'Wall s':>9} {'CPU s':>9}" + (f" {'Peak MB':>9}" if memory else ''))
+    for stage in report['stages']:
+        name = '  ' * stage['depth'] + stage['stage'].rsplit('/', 1)[-1]
+        line = f"{name[:48]:<48} {stage['calls']:>6} {stage['wall_s']:>9.3f} {stage['cpu_s']:>9.3f}"
+        if memory:
+            line += f" {stage['peak_memory_mb']:>9.2f}"
+        print(line)
+    print(f"Total: {report['total_wall_s']:.3f}s")
+
+
+def compare_reports(before: Dict, after: Dict) -> List[Dict]:
+    """Per-stage wall time and memory change between two reports, biggest slowdown first"""
+    previous = {stage['stage']: stage for stage in before['stages']}
+    rows = []
+    for stage in after['stages']:
+        old = previous.get(stage['stage'])
+        if old is None:
+            continue
+        rows.append({
+            'stage': stage['stage'],
+            'wall_s_before': old['wall_s'],
+            'wall_s_after': stage['wall_s'],
+            'wall_change_pct': round((stage['wall_s'] - old['wall_s']) / old['wall_s'] * 100, 1)
+            if old['wall_s'] else None,
+            'peak_memory_mb_before': old.get('peak_memory_mb'),
+            'peak_memory_mb_after': stage.get('peak_memory_mb'),
+        })
+    rows.sort(key=lambda row: row['wall_s_after'] - row['wall_s_before'], reverse=True)
+    return rows
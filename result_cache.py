@@ -0,0 +1,146 @@
+"""
+On-disk cache of analytics results keyed by the dataset they were computed from
+
+Results are stored per (function, arguments, dataset content hash), so an
+unchanged file is answered from the cache and a file rewritten by the
+scraper gets fresh results without any explicit invalidation. Results
+also depend on the bundled gazetteer and exchange rates and on how
+locations are resolved, so editing those invalidates them too. The least
+recently used entries are evicted once the cache holds `max_entries`.
+
+Values are pickled; only point the cache at databases you wrote yourself.
+"""
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+import time
+from typing import Callable, Optional
+
+from geo import GAZETTEER_FILE, RESOLVER_VERSION
+from prizes import FX_RATES_FILE
+
+
+_MISSING = object()
+
+# Bump when the shape of cached values changes (e.g. new Hackathon slots),
+# so results pickled by older code are not loaded
+CACHE_VERSION = 2
+
+
+def file_digest(filename: str, chunk_size: int = 1 << 20) -> str:
+    """blake2b of a file's contents"""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(filename, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """Memoised analytics results stored in SQLite with LRU eviction"""
+
+    def __init__(self, db_path: str = 'analytics_cache.db', max_entries: int = 256):
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.reference = ([CACHE_VERSION, RESOLVER_VERSION]
+                          + [file_digest(f) for f in (GAZETTEER_FILE, FX_RATES_FILE)])
+        self.conn = sqlite3.connect(db_path, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS results (
+                key TEXT PRIMARY KEY,
+                function TEXT NOT NULL,
+                dataset TEXT NOT NULL,
+                value BLOB NOT NULL,
+                created_at REAL NOT NULL,
+                last_used REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used);
+
+            CREATE TABLE IF NOT EXISTS datasets (
+                path TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                digest TEXT NOT NULL
+            );
+        """)
+
+    def dataset_hash(self, filename: str) -> str:
+        """
+        Content hash of a dataset file
+
+        The hash is remembered per (path, size, mtime), so a file is only
+        read again after it has been rewritten.
+        """
+        path = os.path.abspath(filename)
+        stat = os.stat(path)
+        row = self.conn.execute(
+            "SELECT digest FROM datasets WHERE path = ? AND size = ? AND mtime_ns = ?",
+            (path, stat.st_size, stat.st_mtime_ns)).fetchone()
+        if row:
+            return row[0]
+
+        digest = file_digest(path)
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO datasets (path, size, mtime_ns, digest) VALUES (?, ?, ?, ?)",
+                (path, stat.st_size, stat.st_mtime_ns, digest))
+        return digest
+
+    def _key(self, function: str, dataset: str, params: dict) -> str:
+        raw = json.dumps([function, dataset, params, self.reference], sort_keys=True, default=str)
+        return hashlib.blake2b(raw.encode('utf-8'), digest_size=16).hexdigest()
+
+    def get(self, function: str, filename: str, default=None, **params):
+        """Cached result for `function(filename, **params)`, or `default`"""
+        key = self._key(function, self.dataset_hash(filename), params)
+        row = self.conn.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+        if not row:
+            return default
+        with self.conn:
+            self.conn.execute("UPDATE results SET last_used = ? WHERE key = ?", (time.time(), key))
+        return pickle.loads(row[0])
+
+    def put(self, function: str, filename: str, value, **params):
+        dataset = self.dataset_hash(filename)
+        key = self._key(function, dataset, params)
+        now = time.time()
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO results (key, function, dataset, value, created_at, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?)", (key, function, dataset, blob, now, now))
+            self.conn.execute(
+                "DELETE FROM results WHERE key NOT IN "
+                "(SELECT key FROM results ORDER BY last_used DESC LIMIT ?)", (self.max_entries,))
+
+    def get_or_compute(self, function: str, filename: str, compute: Callable, **params):
+        """
+        Return the cached result, or call `compute()` and cache what it returns
+
+        Args:
+            function: Name identifying the computation
+            filename: Dataset the result is derived from
+            compute: Zero-argument callable producing the result
+            params: Arguments that distinguish results of the same function
+        """
+        value = self.get(function, filename, _MISSING, **params)
+        if value is _MISSING:
+            value = compute()
+            self.put(function, filename, value, **params)
+        return value
+
+    def clear(self, function: Optional[str] = None):
+        with self.conn:
+            if function:
+                self.conn.execute("DELETE FROM results WHERE function = ?", (function,))
+            else:
+                self.conn.execute("DELETE FROM results")
+
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def close(self):
+        self.conn.close()
@@ -1,24 +1,47 @@
-import requests
-from bs4 import BeautifulSoup
 import json
+import os
 import time
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, TYPE_CHECKING
 import re
 
+from geo import location_fields
+from models import Hackathon, to_json_default
+from prizes import prize_fields
+
+# requests and BeautifulSoup are imported on first use so that loading and
+# saving data does not pay for the HTTP/HTML stack
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+
+# Common themes based on the HTML
+THEMES = [
+    'ai', 'api', 'art', 'ar-vr', 'audio', 'beginner', 'big-data',
+    'blockchain', 'databases', 'design', 'devops', 'education',
+    'energy', 'enterprise', 'fintech', 'friendly', 'games', 'health',
+    'industry', 'iot', 'low-no-code', 'machine-learning', 'media',
+    'metaverse', 'mobile', 'nft', 'non-profit', 'quantum', 'retail',
+    'robotics', 'science', 'security', 'social', 'transport', 'video',
+    'wearables', 'web', 'remote'
+]
+
 
 class AllHackathonsScraper:
     """Scraper for allhackathons.com website"""
 
     def __init__(self, base_url: str = "https://allhackathons.com"):
+        import requests
+
         self.base_url = base_url
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
 
-    def get_page(self, url: str, retries: int = 3) -> Optional[BeautifulSoup]:
+    def get_page(self, url: str, retries: int = 3) -> Optional['BeautifulSoup']:
         """Fetch a page and return BeautifulSoup object"""
+        from bs4 import BeautifulSoup
+
         for attempt in range(retries):
             try:
                 response = self.session.get(url, timeout=30)
@@ -32,14 +55,14 @@ class AllHackathonsScraper:
                     return None
         return None
 
-    def extract_hackathon_cards(self, soup: BeautifulSoup) -> List[Dict]:
+    def extract_hackathon_cards(self, soup: 'BeautifulSoup') -> List[Hackathon]:
         """Extract hackathon cards from a listing page"""
         hackathons = []
         cards = soup.find_all('div', class_='row align-items-center bg-white mb-4 py-5 px-4')
 
         for card in cards:
             try:
-                hackathon = {}
+                hackathon = Hackathon()
 
                 # Extract title and URL
                 title_link = card.find('a', class_='h5 text-darkblue d-block mt-3')
@@ -132,6 +155,7 @@ class AllHackathonsScraper:
                     location_p = location_body.find('p')
                     if location_p:
                         details['location'] = location_p.text.strip()
+                        details.update(location_fields(details['location']))
 
             # Extract organizer
             org_card = soup.find('h5', string=re.compile('Organizer'))
@@ -150,6 +174,7 @@ class AllHackathonsScraper:
                     prizes_p = prizes_body.find('p')
                     if prizes_p:
                         details['prizes'] = prizes_p.text.strip()
+                        details.update(prize_fields(details['prizes']))
 
             # Extract website link
             website_card = soup.find('h5', string=re.compile('Website'))
@@ -171,6 +196,10 @@ class AllHackathonsScraper:
         if not soup:
             return 1
 
+        return self.total_pages_from_soup(soup)
+
+    def total_pages_from_soup(self, soup: 'BeautifulSoup') -> int:
+        """Read the number of pages from an already fetched listing page"""
         pagination = soup.find('div', class_='pagination')
         if not pagination:
             return 1
@@ -187,17 +216,28 @@ class AllHackathonsScraper:
 
         return max_page
 
-    def scrape_theme(self, theme: str = "remote", save_file: str = None) -> List[Dict]:
+    def scrape_theme(self, theme: str = "remote", save_file: str = None,
+                     search_index=None, history=None,
+                     change_feed: str = None) -> List[Hackathon]:
         """
         Scrape all hackathons for a specific theme
 
         Args:
             theme: The theme to scrape (e.g., 'remote', 'ai', 'blockchain')
             save_file: Optional file path to save results as JSON
+            search_index: Optional SearchIndex updated as each hackathon is scraped
+            history: Optional SnapshotStore that receives this crawl as a snapshot
+            change_feed: Optional JSON Lines file to append added/updated/removed
+                         events to, computed against the previous save_file;
+                         requires save_file, since without a baseline every
+                         record would be reported as added on every run
 
         Returns:
-            List of hackathon dictionaries with full details
+            List of Hackathon records with full details
         """
+        if change_feed and not save_file:
+            raise ValueError("change_feed needs save_file: the previous save is the baseline")
+
         theme_url = f"{self.base_url}/themes/{theme}/"
         print(f"Starting scrape for theme: {theme}")
         print(f"Base URL: {theme_url}")
@@ -236,6 +276,9 @@ class AllHackathonsScraper:
 
                 all_hackathons.append(hackathon)
 
+                if search_index is not None:
+                    search_index.add(hackathon)
+
                 # Be polite - add a small delay between requests
                 time.sleep(1)
 
@@ -246,33 +289,31 @@ class AllHackathonsScraper:
         print(f"Scraping complete! Total hackathons found: {len(all_hackathons)}")
         print(f"{'='*60}")
 
+        # The previous save_file is the baseline for the change feed, so the
+        # feed has to be computed before it is overwritten
+        if change_feed:
+            self.emit_change_feed(all_hackathons, save_file, change_feed)
+
         # Save to file if specified
         if save_file:
             self.save_to_json(all_hackathons, save_file)
 
+        if history is not None:
+            history.record(all_hackathons, scope=theme)
+
         return all_hackathons
 
-    def scrape_all_themes(self, save_file: str = None) -> Dict[str, List[Dict]]:
+    def scrape_all_themes(self, save_file: str = None, search_index=None,
+                          history=None) -> Dict[str, List[Hackathon]]:
         """Scrape hackathons from all available themes"""
-        # Common themes based on the HTML
-        themes = [
-            'ai', 'api', 'art', 'ar-vr', 'audio', 'beginner', 'big-data',
-            'blockchain', 'databases', 'design', 'devops', 'education',
-            'energy', 'enterprise', 'fintech', 'friendly', 'games', 'health',
-            'industry', 'iot', 'low-no-code', 'machine-learning', 'media',
-            'metaverse', 'mobile', 'nft', 'non-profit', 'quantum', 'retail',
-            'robotics', 'science', 'security', 'social', 'transport', 'video',
-            'wearables', 'web', 'remote'
-        ]
-
         all_themes_data = {}
 
-        for theme in themes:
+        for theme in THEMES:
             print(f"\n{'='*60}")
             print(f"Scraping theme: {theme}")
             print(f"{'='*60}")
 
-            hackathons = self.scrape_theme(theme)
+            hackathons = self.scrape_theme(theme, search_index=search_index, history=history)
             all_themes_data[theme] = hackathons
 
             # Longer delay between themes
@@ -284,11 +325,35 @@ class AllHackathonsScraper:
 
         return all_themes_data
 
+    def emit_change_feed(self, hackathons: List[Hackathon], previous_file: str, feed_file: str):
+        """
+        Append change events between previous_file and this crawl to feed_file
+
+        When previous_file does not exist yet (the first crawl), every record
+        is reported as added.
+        """
+        from analyze_data import iter_hackathons
+        from changefeed import diff_hackathons, write_change_feed
+
+        if not hackathons:
+            print("No hackathons scraped, change feed skipped")
+            return
+
+        previous = []
+        if os.path.exists(previous_file):
+            previous = iter_hackathons(previous_file)
+
+        try:
+            written = write_change_feed(diff_hackathons(previous, hackathons), feed_file)
+            print(f"Appended {len(written)} change events to {feed_file}")
+        except Exception as e:
+            print(f"Error writing change feed {feed_file}: {e}")
+
     def save_to_json(self, data: any, filename: str):
         """Save data to a JSON file"""
         try:
             with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+                json.dump(data, f, indent=2, ensure_ascii=False, default=to_json_default)
             print(f"\nData saved to {filename}")
         except Exception as e:
             print(f"Error saving to {filename}: {e}")
@@ -313,7 +378,7 @@ def main():
 
     if remote_hackathons:
         print(f"\nSample hackathon:")
-        print(json.dumps(remote_hackathons[0], indent=2))
+        print(json.dumps(remote_hackathons[0].to_dict(), indent=2))
 
     # Option 2: Uncomment to scrape all themes (this will take a long time)
     # print("\n\nScraping ALL themes...")
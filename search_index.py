@@ -0,0 +1,127 @@
+import json
+import re
+import sqlite3
+from typing import Iterable, List, Tuple
+
+from models import Hackathon
+
+
+SEARCH_COLUMNS = ('title', 'short_description', 'full_description', 'organizer', 'location')
+
+# BM25 column weights, in SEARCH_COLUMNS order: a hit in the title counts
+# far more than one buried in the full description
+COLUMN_WEIGHTS = (10.0, 4.0, 1.0, 2.0, 2.0)
+
+_TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+
+def build_match_query(text: str) -> str:
+    """
+    Turn free text from a search box into an FTS5 MATCH expression
+
+    Every word must match; the last one is treated as a prefix so results
+    update while the user is still typing.
+    """
+    tokens = _TOKEN_RE.findall(text.lower())
+    if not tokens:
+        return ''
+    terms = [f'"{token}"' for token in tokens]
+    terms[-1] += '*'
+    return ' '.join(terms)
+
+
+class SearchIndex:
+    """Full-text index over hackathons backed by SQLite FTS5 with BM25 ranking"""
+
+    def __init__(self, db_path: str = 'hackathons_search.db'):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.executescript(f"""
+            CREATE TABLE IF NOT EXISTS hackathons (
+                id INTEGER PRIMARY KEY,
+                key TEXT UNIQUE NOT NULL,
+                record TEXT NOT NULL
+            );
+            CREATE VIRTUAL TABLE IF NOT EXISTS hackathons_fts USING fts5(
+                {', '.join(SEARCH_COLUMNS)},
+                tokenize = 'unicode61 remove_diacritics 2'
+            );
+        """)
+
+    @staticmethod
+    def _key(h) -> str:
+        return h.get('detail_url') or h.get('title', '')
+
+    def add(self, h, commit: bool = True):
+        """Insert or replace one hackathon in the index"""
+        record = h.to_dict() if isinstance(h, Hackathon) else h
+        key = self._key(h)
+        text = [h.get(column) or '' for column in SEARCH_COLUMNS]
+
+        row = self.conn.execute("SELECT id FROM hackathons WHERE key = ?", (key,)).fetchone()
+        if row:
+            doc_id = row[0]
+            self.conn.execute("UPDATE hackathons SET record = ? WHERE id = ?",
+                              (json.dumps(record, ensure_ascii=False), doc_id))
+            self.conn.execute("DELETE FROM hackathons_fts WHERE rowid = ?", (doc_id,))
+        else:
+            doc_id = self.conn.execute(
+                "INSERT INTO hackathons (key, record) VALUES (?, ?)",
+                (key, json.dumps(record, ensure_ascii=False))
+            ).lastrowid
+
+        self.conn.execute(
+            f"INSERT INTO hackathons_fts (rowid, {', '.join(SEARCH_COLUMNS)}) "
+            f"VALUES (?, {', '.join('?' * len(SEARCH_COLUMNS))})",
+            (doc_id, *text)
+        )
+        if commit:
+            self.conn.commit()
+
+    def add_many(self, hackathons: Iterable) -> int:
+        """Index many hackathons in a single transaction"""
+        count = 0
+        with self.conn:
+            for h in hackathons:
+                self.add(h, commit=False)
+                count += 1
+        return count
+
+    def remove(self, key: str):
+        """Drop a hackathon (by detail_url) from the index"""
+        with self.conn:
+            row = self.conn.execute("SELECT id FROM hackathons WHERE key = ?", (key,)).fetchone()
+            if row:
+                self.conn.execute("DELETE FROM hackathons_fts WHERE rowid = ?", (row[0],))
+                self.conn.execute("DELETE FROM hackathons WHERE id = ?", (row[0],))
+
+    def search(self, query: str, limit: int = 20, offset: int = 0) -> List[Tuple[Hackathon, float]]:
+        """
+        Search titles, descriptions, organizer and location
+
+        Returns:
+            List of (Hackathon, score) pairs, best match first. Higher scores
+            are better.
+        """
+        match = build_match_query(query)
+        if not match:
+            return []
+
+        weights = ', '.join(str(w) for w in COLUMN_WEIGHTS)
+        rows = self.conn.execute(f"""
+            SELECT h.record, bm25(hackathons_fts, {weights}) AS rank
+            FROM hackathons_fts
+            JOIN hackathons h ON h.id = hackathons_fts.rowid
+            WHERE hackathons_fts MATCH ?
+            ORDER BY rank
+            LIMIT ? OFFSET ?
+        """, (match, limit, offset)).fetchall()
+
+        # SQLite's bm25() is negative, lower meaning more relevant
+        return [(Hackathon.from_dict(json.loads(record)), -rank) for record, rank in rows]
+
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM hackathons").fetchone()[0]
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,63 @@
+import io
+import json
+
+import pytest
+
+from analyze_data import _iter_json_records, iter_hackathons
+
+
+RECORDS = [
+    {'title': 'Robot Jam', 'themes': ['iot', 'robotics'], 'prize_usd': 5000.0, 'online': True},
+    {'title': 'Ünïcode "Hack"', 'themes': [], 'location': 'Berlin, Germany', 'website': None},
+    {'title': 'Numbers', 'prize_amount': 1e5, 'nested': {'a': [1, 2, {'b': False}]}},
+]
+
+
+def _decode(text, chunk_size):
+    return list(_iter_json_records(io.StringIO(text), chunk_size))
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 7, 65536])
+def test_array_matches_json_load(chunk_size):
+    text = json.dumps(RECORDS, indent=2, ensure_ascii=False)
+    assert _decode(text, chunk_size) == json.loads(text)
+
+
+@pytest.mark.parametrize('chunk_size', [1, 3, 65536])
+def test_theme_map_is_flattened(chunk_size):
+    text = json.dumps({'ai': RECORDS[:2], 'web3': [], 'iot': RECORDS[2:]})
+    assert _decode(text, chunk_size) == RECORDS
+
+
+@pytest.mark.parametrize('text', ['', '  \n', '[]', ' [ ] ', '{}', '{ }\n'])
+def test_empty_documents(text):
+    assert _decode(text, 2) == []
+
+
+@pytest.mark.parametrize('text', [
+    '[{"a":1}] trailing',
+    '[{"a":1}][{"b":2}]',
+    '{"ai": []} x',
+    '[{"a":1} {"b":2}]',
+    '[{"a":1},',
+    '[{"a":',
+    '{"ai" []}',
+    '"just a string"',
+])
+@pytest.mark.parametrize('chunk_size', [1, 4, 65536])
+def test_malformed_input_is_rejected(text, chunk_size):
+    with pytest.raises(ValueError):
+        _decode(text, chunk_size)
+
+
+def test_json_lines(tmp_path):
+    path = tmp_path / 'hackathons.jsonl'
+    path.write_text('\n'.join(json.dumps(r) for r in RECORDS) + '\n\n', encoding='utf-8')
+    assert [h.get('title') for h in iter_hackathons(str(path))] == [r['title'] for r in RECORDS]
+
+
+def test_fields_are_pruned(tmp_path):
+    path = tmp_path / 'hackathons.json'
+    path.write_text(json.dumps(RECORDS), encoding='utf-8')
+    records = list(iter_hackathons(str(path), fields=('title',), chunk_size=5))
+    assert [h.to_dict() for h in records] == [{'title': r['title']} for r in RECORDS]
@@ -0,0 +1,107 @@
+import asyncio
+import json
+
+from aiohttp.test_utils import TestClient, TestServer
+
+from api_server import HackathonAPI
+
+
+RECORDS = [
+    {'title': 'Robot Jam', 'status': 'Open', 'location_type': 'IN_PERSON', 'location': 'Boston, MA',
+     'themes': ['robotics'], 'detail_url': 'https://example.com/robot-jam/'},
+    {'title': 'Open City Hack', 'status': 'Open', 'location_type': 'IN_PERSON',
+     'location': 'Berlin, Germany', 'themes': ['civic'], 'detail_url': 'https://example.com/open-city/'},
+    {'title': 'Cloud Sprint', 'status': 'Ended', 'location_type': 'ONLINE', 'location': 'Online',
+     'themes': ['robotics', 'cloud'], 'detail_url': 'https://example.com/cloud-sprint/'},
+]
+
+
+def _write(path, records):
+    path.write_text(json.dumps(records), encoding='utf-8')
+
+
+def _run(path, check):
+    """Run `check(client, api)` against the API serving `path`, without background reloads"""
+    api = HackathonAPI(str(path), reload_interval=0)
+
+    async def main():
+        async with TestClient(TestServer(api.make_app())) as client:
+            return await check(client, api)
+
+    return asyncio.run(main())
+
+
+def test_filters_and_paging(tmp_path):
+    path = tmp_path / 'hackathons.json'
+    _write(path, RECORDS)
+
+    async def check(client, api):
+        by_status = await (await client.get('/hackathons', params={'status': 'Open', 'limit': 1})).json()
+        by_country = await (await client.get('/hackathons', params={'country': 'usa'})).json()
+        by_theme = await (await client.get('/hackathons', params={'theme': 'robotics', 'offset': 1})).json()
+        return by_status, by_country, by_theme
+
+    by_status, by_country, by_theme = _run(path, check)
+
+    assert by_status['total'] == 2
+    assert [h['title'] for h in by_status['items']] == ['Robot Jam']
+    assert [h['title'] for h in by_country['items']] == ['Robot Jam']
+    assert by_theme['total'] == 2 and [h['title'] for h in by_theme['items']] == ['Cloud Sprint']
+
+
+def test_matching_etag_gets_304(tmp_path):
+    path = tmp_path / 'hackathons.json'
+    _write(path, RECORDS)
+
+    async def check(client, api):
+        first = await client.get('/hackathons', params={'status': 'Open'})
+        etag = first.headers['ETag']
+        again = await client.get('/hackathons', params={'status': 'Open'},
+                                 headers={'If-None-Match': etag})
+        other = await client.get('/hackathons', params={'status': 'Ended'},
+                                 headers={'If-None-Match': etag})
+        return first.status, again.status, await again.read(), other.status
+
+    assert _run(path, check) == (200, 304, b'', 200)
+
+
+def test_bad_requests(tmp_path):
+    path = tmp_path / 'hackathons.json'
+    _write(path, RECORDS)
+    bad = [
+        ('/hackathons', {'limit': 'ten'}),
+        ('/hackathons', {'offset': '-1'}),
+        ('/hackathons', {'min_prize': 'lots'}),
+        ('/hackathons', {'has_prizes': 'maybe'}),
+        ('/search', {}),
+        ('/search', {'q': '  '}),
+    ]
+
+    async def check(client, api):
+        responses = [await client.get(url, params=params) for url, params in bad]
+        return [(r.status, 'error' in await r.json()) for r in responses]
+
+    assert _run(path, check) == [(400, True)] * len(bad)
+
+
+def test_reload_serves_the_new_version(tmp_path):
+    path = tmp_path / 'hackathons.json'
+    _write(path, RECORDS)
+
+    async def check(client, api):
+        before = await (await client.get('/health')).json()
+        stale = (await client.get('/stats')).headers['ETag']
+
+        assert not await api.reload()
+        _write(path, RECORDS[:1])
+        assert await api.reload()
+
+        after = await (await client.get('/health')).json()
+        stats = await client.get('/stats', headers={'If-None-Match': stale})
+        return before, after, stats.status, stats.headers['ETag'] != stale
+
+    before, after, status, new_etag = _run(path, check)
+
+    assert before['records'] == 3 and after['records'] == 1
+    assert before['version'] != after['version']
+    assert status == 200 and new_etag
@@ -0,0 +1,87 @@
+import json
+
+import pytest
+
+from changefeed import diff_hackathons, fingerprint, write_change_feed
+from models import Hackathon
+from scraper import AllHackathonsScraper
+
+
+STAMP = '2025-01-01T00:00:00+00:00'
+A = {'title': 'A', 'detail_url': 'https://example.com/a/', 'status': 'Open', 'prizes': '$1,000'}
+B = {'title': 'B', 'detail_url': 'https://example.com/b/', 'status': 'Open'}
+C = {'title': 'C', 'detail_url': 'https://example.com/c/', 'status': 'Upcoming'}
+
+
+def _events(previous, current):
+    return list(diff_hackathons(previous, current, timestamp=STAMP))
+
+
+def test_unchanged_crawl_has_no_events():
+    assert _events([A, B], [Hackathon.from_dict(B), Hackathon.from_dict(A)]) == []
+    assert fingerprint(A) == fingerprint(dict(reversed(list(A.items()))))
+
+
+def test_added_and_removed():
+    events = _events([A, B], [A, C])
+    assert events == [
+        {'event': 'added', 'detail_url': C['detail_url'], 'title': 'C', 'timestamp': STAMP, 'record': C},
+        {'event': 'removed', 'detail_url': B['detail_url'], 'title': 'B', 'timestamp': STAMP, 'record': B},
+    ]
+
+
+def test_updated_and_status_changed():
+    new = {'title': 'A', 'detail_url': A['detail_url'], 'status': 'Ended', 'website': 'https://a.example'}
+    updated, status = _events([A], [new])
+
+    assert updated['event'] == 'updated'
+    assert updated['fingerprint'] == fingerprint(new)
+    assert updated['changes'] == {
+        'status': {'old': 'Open', 'new': 'Ended'},
+        'website': {'old': None, 'new': 'https://a.example'},
+        'prizes': {'old': '$1,000', 'new': None},
+    }
+    assert status == {'event': 'status_changed', 'detail_url': A['detail_url'], 'title': 'A',
+                      'timestamp': STAMP, 'from': 'Open', 'to': 'Ended'}
+
+
+def test_update_without_status_change():
+    events = _events([A], [dict(A, prizes='$2,000')])
+    assert [e['event'] for e in events] == ['updated']
+
+
+def test_duplicate_urls_and_records_without_url_are_skipped():
+    events = _events([], [B, dict(B, status='Ended'), {'title': 'No URL'}])
+    assert [(e['event'], e['record']) for e in events] == [('added', B)]
+
+
+def test_write_change_feed_appends(tmp_path):
+    feed = tmp_path / 'changes.jsonl'
+    assert write_change_feed(_events([A], [B]), str(feed)) == ['added', 'removed']
+    assert write_change_feed(_events([B], [B]), str(feed)) == []
+    lines = [json.loads(line) for line in feed.read_text(encoding='utf-8').splitlines()]
+    assert [line['event'] for line in lines] == ['added', 'removed']
+
+
+def _scraper():
+    # Skip __init__, which opens an HTTP session; these paths never fetch
+    return AllHackathonsScraper.__new__(AllHackathonsScraper)
+
+
+def test_change_feed_requires_save_file(tmp_path):
+    with pytest.raises(ValueError):
+        _scraper().scrape_theme('remote', change_feed=str(tmp_path / 'changes.jsonl'))
+
+
+def test_emit_change_feed_against_previous_save(tmp_path):
+    previous = tmp_path / 'hackathons.json'
+    feed = tmp_path / 'changes.jsonl'
+    scraper = _scraper()
+
+    # First crawl: no previous save, so everything is new
+    scraper.emit_change_feed([Hackathon.from_dict(A)], str(previous), str(feed))
+    previous.write_text(json.dumps([A]), encoding='utf-8')
+    scraper.emit_change_feed([Hackathon.from_dict(dict(A, status='Ended'))], str(previous), str(feed))
+
+    events = [json.loads(line)['event'] for line in feed.read_text(encoding='utf-8').splitlines()]
+    assert events == ['added', 'updated', 'status_changed']
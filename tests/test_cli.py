@@ -0,0 +1,80 @@
+import json
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+import cli
+from conftest import ROOT
+
+
+HEAVY_MODULES = ('requests', 'bs4', 'pandas', 'matplotlib')
+
+# Generous enough for a slow CI machine, far below what loading the
+# scraping or plotting stack costs
+STARTUP_LIMIT_SECONDS = 2.0
+
+SAMPLE = [
+    {'title': 'Robot Jam', 'detail_url': 'https://example.com/robot-jam/', 'status': 'Open',
+     'location_type': 'ONLINE', 'themes': ['iot', 'robotics'], 'location': 'Online'},
+    {'title': 'City Hack', 'detail_url': 'https://example.com/city-hack/', 'status': 'Ended',
+     'themes': ['social'], 'location': 'Berlin, State of Berlin, Germany'},
+]
+
+PROBE = """
+import json, sys
+sys.path.insert(0, {root!r})
+import cli
+cli.main(['filter', '--input', {input!r}, '--theme', 'iot', '--no-cache'])
+print('LOADED=' + json.dumps(sorted(m for m in {heavy!r} if m in sys.modules)))
+"""
+
+
+def test_filter_starts_fast_without_heavy_imports(tmp_path):
+    dataset = tmp_path / 'hackathons.json'
+    dataset.write_text(json.dumps(SAMPLE), encoding='utf-8')
+    code = PROBE.format(root=ROOT, input=str(dataset), heavy=HEAVY_MODULES)
+
+    started = time.perf_counter()
+    result = subprocess.run([sys.executable, '-c', code], cwd=tmp_path,
+                            capture_output=True, text=True, timeout=60)
+    elapsed = time.perf_counter() - started
+
+    assert result.returncode == 0, result.stderr
+    assert 'Robot Jam' in result.stdout
+    loaded = json.loads(result.stdout.rsplit('LOADED=', 1)[1])
+    assert loaded == []
+    assert elapsed < STARTUP_LIMIT_SECONDS, f"cli.py filter took {elapsed:.2f}s"
+
+
+def test_filter_script_entry_point(tmp_path):
+    dataset = tmp_path / 'hackathons.json'
+    dataset.write_text(json.dumps(SAMPLE), encoding='utf-8')
+    result = subprocess.run([sys.executable, os.path.join(ROOT, 'cli.py'), 'filter',
+                             '--input', str(dataset), '--country', 'Germany', '--no-cache'],
+                            cwd=tmp_path, capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    assert 'City Hack' in result.stdout
+    assert 'Robot Jam' not in result.stdout
+
+
+def test_scrape_all_rejects_change_feed(capsys):
+    with pytest.raises(SystemExit) as excinfo:
+        cli.main(['scrape', '--all', '--change-feed', 'changes.jsonl'])
+    assert excinfo.value.code == 2
+    assert '--change-feed' in capsys.readouterr().err
+
+
+@pytest.mark.parametrize('profile', ['svg', 'html'])
+def test_visualize_creates_output_dir(tmp_path, profile):
+    dataset = tmp_path / 'hackathons.json'
+    dataset.write_text(json.dumps([dict(h, dates='Oct. 18, 2025 - Oct. 19, 2025') for h in SAMPLE]), encoding='utf-8')
+    output_dir = tmp_path / 'reports' / 'charts'
+    result = subprocess.run([sys.executable, os.path.join(ROOT, 'cli.py'), 'visualize',
+                             '--input', str(dataset), '--output-dir', str(output_dir),
+                             '--profile', profile, '--no-cache'],
+                            cwd=tmp_path, capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stderr
+    assert (output_dir / 'insights_report.txt').exists()
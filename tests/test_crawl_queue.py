@@ -0,0 +1,54 @@
+import pytest
+
+from crawl_queue import CrawlQueue
+
+
+def test_expired_lease_fails_after_max_attempts(tmp_path):
+    queue = CrawlQueue(str(tmp_path / 'queue.db'), max_attempts=2)
+    queue.enqueue([{'kind': 'detail', 'url': 'https://example.com/a/', 'payload': {'title': 'A'}}])
+
+    # Both workers crash and let their lease run out
+    assert queue.claim('worker-1', lease_seconds=-1)['attempts'] == 1
+    assert queue.claim('worker-2', lease_seconds=-1)['attempts'] == 2
+
+    assert queue.claim('worker-3') is None
+    assert queue.counts() == {'failed': 1}
+    assert queue.is_finished()
+    assert [h['title'] for h in queue.results()] == ['A']
+    queue.close()
+
+
+def test_expired_lease_is_retried_below_max_attempts(tmp_path):
+    queue = CrawlQueue(str(tmp_path / 'queue.db'), max_attempts=3)
+    queue.enqueue([{'kind': 'listing', 'url': 'https://example.com/', 'payload': {'page': 1}}])
+
+    queue.claim('worker-1', lease_seconds=-1)
+    task = queue.claim('worker-2')
+    assert task['attempts'] == 2
+    assert queue.complete(task, 'worker-2', {'cards': 0})
+    assert queue.counts() == {'done': 1}
+    queue.close()
+
+
+def _journal_mode(queue):
+    return queue.conn.execute("PRAGMA journal_mode").fetchone()[0]
+
+
+def test_journal_mode_is_fixed_at_creation(tmp_path):
+    local = CrawlQueue(str(tmp_path / 'local.db'))
+    assert _journal_mode(local) == 'wal'
+    local.close()
+
+    shared_path = str(tmp_path / 'shared.db')
+    shared = CrawlQueue(shared_path, shared_fs=True)
+    assert _journal_mode(shared) == 'delete'
+    shared.enqueue([{'kind': 'listing', 'url': 'https://example.com/', 'payload': {'page': 1}}])
+
+    # A second worker on the shared queue sees the same tasks
+    other = CrawlQueue(shared_path, shared_fs=True)
+    assert other.claim('worker-2')['url'] == 'https://example.com/'
+    other.close()
+    shared.close()
+
+    with pytest.raises(ValueError):
+        CrawlQueue(shared_path)
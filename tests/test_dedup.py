@@ -0,0 +1,61 @@
+import dedup
+from dedup import dedupe_hackathons, find_duplicate_groups, merge_duplicates
+from models import Hackathon
+
+
+DESCRIPTION = ("Build tools that help city councils publish open data, map public services "
+               "and make transport timetables accessible to everyone in the region")
+
+
+def test_detail_url_duplicates_are_grouped():
+    records = [
+        {'title': 'Robot Jam', 'detail_url': 'https://example.com/robot-jam/'},
+        {'title': 'Something else entirely', 'detail_url': 'https://example.com/other/'},
+        {'title': 'Robot Jam 2025', 'detail_url': 'https://example.com/robot-jam/'},
+    ]
+    assert find_duplicate_groups(records) == [[0, 2], [1]]
+
+
+def test_near_duplicate_descriptions_are_grouped():
+    records = [
+        {'title': 'Open City Hack', 'short_description': DESCRIPTION},
+        {'title': 'Robot Jam', 'short_description': 'Program robot arms to sort recycling faster'},
+        {'title': 'Open City Hack', 'short_description': DESCRIPTION + ' too'},
+    ]
+    assert find_duplicate_groups(records, threshold=0.7) == [[0, 2], [1]]
+
+
+def test_dissimilar_first_member_does_not_hide_a_pair(monkeypatch):
+    # A, B and C share the first band, so they land in one bucket with A
+    # first; B and C match on 3 of 4 hashes but never meet in another bucket
+    signatures = {'A': (1, 2, 3, 4), 'B': (1, 2, 7, 8), 'C': (1, 2, 7, 9)}
+    monkeypatch.setattr(dedup, 'shingles', lambda text: {text.strip()})
+    monkeypatch.setattr(dedup.MinHasher, 'signature',
+                        lambda self, shingle_set: signatures[next(iter(shingle_set))])
+
+    records = [{'title': name} for name in 'ABC']
+    assert find_duplicate_groups(records, threshold=0.7, num_perm=4, bands=2) == [[0], [1, 2]]
+
+
+def test_merge_keeps_most_complete_record_and_all_themes():
+    records = [
+        Hackathon.from_dict({'title': 'Open City Hack', 'detail_url': 'https://a.example/1/',
+                             'themes': ['civic']}),
+        {'title': 'Open City Hack', 'detail_url': 'https://b.example/1/', 'themes': ['open data', 'civic'],
+         'website': 'https://opencity.example', 'organizer': 'City Council'},
+    ]
+    merged = merge_duplicates(records)
+    assert merged.detail_url == 'https://b.example/1/'
+    assert merged.themes == ('civic', 'open data')
+    assert merged['duplicate_urls'] == ['https://a.example/1/']
+
+
+def test_dedupe_hackathons():
+    records = [
+        {'title': 'Open City Hack', 'short_description': DESCRIPTION, 'themes': ['civic']},
+        {'title': 'Open City Hack', 'short_description': DESCRIPTION, 'themes': ['data']},
+        {'title': 'Robot Jam', 'short_description': 'Program robot arms to sort recycling faster'},
+    ]
+    merged = dedupe_hackathons(records)
+    assert [h.title for h in merged] == ['Open City Hack', 'Robot Jam']
+    assert merged[0].themes == ('civic', 'data')
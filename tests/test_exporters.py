@@ -0,0 +1,99 @@
+import csv
+import gzip
+import json
+
+import pytest
+
+from exporters import CSV_FIELDS, export_hackathons, shard_filename
+from models import Hackathon
+from prizes import prize_fields
+
+
+RECORDS = [
+    {'title': f"Hack {n}", 'status': 'Ended', 'location_type': 'ONLINE', 'dates': 'Mar 01, 2024',
+     'location': 'Online', 'themes': ['ai', 'web'] if n % 2 else [], 'detail_url': f"https://example.com/{n}/"}
+    for n in range(7)
+]
+
+
+def _records():
+    return [Hackathon.from_dict(r) for r in RECORDS]
+
+
+def _read_csv(path, opener=open):
+    with opener(path, 'rt', encoding='utf-8', newline='') as f:
+        return list(csv.reader(f))
+
+
+def _read_jsonl(path, opener=open):
+    with opener(path, 'rt', encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+
+def _expected_row(record):
+    row = []
+    for name in CSV_FIELDS:
+        value = record.get(name)
+        row.append(', '.join(value) if name == 'themes' else value or '')
+    return row
+
+
+@pytest.mark.parametrize('filename, opener', [('out.csv', open), ('out.csv.gz', gzip.open)])
+def test_csv_round_trip(tmp_path, filename, opener):
+    path = str(tmp_path / filename)
+    assert export_hackathons(_records(), path) == [path]
+
+    rows = _read_csv(path, opener)
+    assert rows[0] == list(CSV_FIELDS)
+    assert rows[1:] == [_expected_row(r) for r in RECORDS]
+
+
+@pytest.mark.parametrize('filename, opener', [('out.jsonl', open), ('out.jsonl.gz', gzip.open)])
+def test_jsonl_round_trip(tmp_path, filename, opener):
+    path = str(tmp_path / filename)
+    export_hackathons(_records(), path)
+    assert _read_jsonl(path, opener) == RECORDS
+
+
+def test_dicts_are_exported_like_records(tmp_path):
+    path = str(tmp_path / 'out.csv')
+    export_hackathons(iter(RECORDS), path)
+    assert _read_csv(path)[1:] == [_expected_row(r) for r in RECORDS]
+
+
+def test_format_and_compression_overrides(tmp_path):
+    path = str(tmp_path / 'out.txt')
+    export_hackathons(_records(), path, fmt='jsonl', compress=True)
+    assert _read_jsonl(path, gzip.open) == RECORDS
+
+
+def test_parquet_round_trip(tmp_path):
+    pq = pytest.importorskip('pyarrow.parquet')
+    prized = dict(RECORDS[1], prizes='$5,000', **prize_fields('$5,000'))
+    path = str(tmp_path / 'out.parquet')
+    export_hackathons([prized] + _records(), path)
+
+    rows = pq.read_table(path).to_pylist()
+    assert [row['title'] for row in rows] == [prized['title']] + [r['title'] for r in RECORDS]
+    assert rows[0]['prize_usd'] == 5000.0 and rows[0]['prize_currency'] == 'USD'
+    assert rows[1]['prize_usd'] is None
+    assert [row['themes'] for row in rows[1:]] == [r['themes'] for r in RECORDS]
+
+
+def test_shards(tmp_path):
+    path = str(tmp_path / 'out.jsonl.gz')
+    files = export_hackathons(_records(), path, shard_size=3, workers=2)
+
+    assert files == [str(tmp_path / f"out-0000{n}.jsonl.gz") for n in (1, 2, 3)]
+    assert [len(_read_jsonl(f, gzip.open)) for f in files] == [3, 3, 1]
+    assert [r for f in files for r in _read_jsonl(f, gzip.open)] == RECORDS
+
+
+def test_shard_filename():
+    assert shard_filename('exports/hackathons.csv.gz', 3) == 'exports/hackathons-00003.csv.gz'
+    assert shard_filename('hackathons', 12) == 'hackathons-00012'
+
+
+def test_unknown_format(tmp_path):
+    with pytest.raises(ValueError):
+        export_hackathons(_records(), str(tmp_path / 'out.csv'), fmt='xml')
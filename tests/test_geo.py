@@ -0,0 +1,46 @@
+import json
+
+import pytest
+
+from geo import RESOLVER_VERSION, LocationNormalizer, _resolve
+
+
+@pytest.mark.parametrize('location, expected', [
+    # Two-letter state codes that are also country codes
+    ('San Francisco, CA', {'country_code': 'US', 'region_code': 'CA', 'city': 'San Francisco'}),
+    ('Boston, MA', {'country_code': 'US', 'region_code': 'MA', 'city': 'Boston'}),
+    ('Atlanta, GA', {'country_code': 'US', 'region_code': 'GA', 'city': 'Atlanta'}),
+    ('Denver, CO', {'country_code': 'US', 'region_code': 'CO', 'city': 'Denver'}),
+    ('Chicago, IL', {'country_code': 'US', 'region_code': 'IL', 'city': 'Chicago'}),
+    ('Pittsburgh, PA', {'country_code': 'US', 'region_code': 'PA', 'city': 'Pittsburgh'}),
+    # Cities that are states of their own
+    ('Berlin, Germany', {'country_code': 'DE', 'region_code': 'BE', 'city': 'Berlin'}),
+    ('Hamburg, Germany', {'country_code': 'DE', 'region_code': 'HH', 'city': 'Hamburg'}),
+    ('San Francisco, California, United States',
+     {'country_code': 'US', 'region_code': 'CA', 'city': 'San Francisco'}),
+    ('London, England, United Kingdom', {'country_code': 'GB', 'region_code': 'ENG', 'city': 'London'}),
+    ('Toronto, ON, Canada', {'country_code': 'CA', 'region_code': 'ON', 'city': 'Toronto'}),
+    ('Austin, Texas', {'country_code': 'US', 'region_code': 'TX', 'city': 'Austin'}),
+    ('Texas', {'country_code': 'US', 'region_code': 'TX'}),
+    ('Bangalore, India', {'country_code': 'IN', 'city': 'Bangalore'}),
+    ('Paris, FR', {'country_code': 'FR', 'city': 'Paris'}),
+    ('CA', {'country_code': 'CA'}),
+    ('USA', {'country_code': 'US'}),
+    ('Online', {'country_code': 'ONLINE'}),
+    ('In-Person', {}),
+])
+def test_resolve(location, expected):
+    assert _resolve(location) == expected
+
+
+def test_cache_from_other_resolver_version_is_ignored(tmp_path):
+    cache_file = tmp_path / 'locations.json'
+    cache_file.write_text(json.dumps({'Boston, MA': {'country_code': 'MA'}}))
+
+    normalizer = LocationNormalizer(str(cache_file))
+    assert normalizer.resolve('Boston, MA')['country_code'] == 'US'
+    normalizer.save()
+
+    saved = json.loads(cache_file.read_text())
+    assert saved['version'] == RESOLVER_VERSION
+    assert LocationNormalizer(str(cache_file)).cache == saved['locations']
@@ -0,0 +1,75 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from history import SnapshotStore
+from models import Hackathon
+
+
+A = 'https://example.com/a/'
+B = 'https://example.com/b/'
+
+
+def _at(day, hour=12):
+    return datetime(2025, 1, day, hour, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SnapshotStore(str(tmp_path / 'history.db'))
+    yield store
+    store.close()
+
+
+def _state(store, when):
+    return {h.detail_url: h.to_dict() for h in store.state_as_of(when)}
+
+
+def test_removed_record_is_readded(store):
+    a = {'title': 'A', 'detail_url': A, 'status': 'Open'}
+    b = {'title': 'B', 'detail_url': B, 'status': 'Open'}
+    store.record([a, b], taken_at=_at(1))
+    store.record([Hackathon.from_dict(a)], taken_at=_at(2))
+    store.record([a, dict(b, status='Ended')], taken_at=_at(3))
+
+    assert set(_state(store, '2025-01-01')) == {A, B}
+    assert set(_state(store, '2025-01-02')) == {A}
+    assert _state(store, '2025-01-03')[B] == dict(b, status='Ended')
+
+    events = store.history(B)
+    assert [e['taken_at'][:10] for e in events] == ['2025-01-01', '2025-01-02', '2025-01-03']
+    assert events[1]['changes'] == {'title': None, 'detail_url': None, 'status': None}
+    assert events[2]['changes'] == dict(b, status='Ended')
+
+
+def test_dropped_field(store):
+    store.record([{'title': 'A', 'detail_url': A, 'prizes': '$1,000'}], taken_at=_at(1))
+    store.record([{'title': 'A', 'detail_url': A}], taken_at=_at(2))
+
+    assert _state(store, '2025-01-01')[A]['prizes'] == '$1,000'
+    assert 'prizes' not in _state(store, '2025-01-02')[A]
+    assert store.history(A)[-1]['changes'] == {'prizes': None}
+
+
+def test_only_changes_are_written(store):
+    records = [{'title': 'A', 'detail_url': A, 'status': 'Open'}, {'title': 'No URL'}]
+    store.record(records, taken_at=_at(1))
+    store.record(records, taken_at=_at(2))
+    store.record([dict(records[0], status='Ended')], taken_at=_at(3))
+
+    assert [s['changed_fields'] for s in store.snapshots()] == [3, 0, 2]
+    assert [s['record_count'] for s in store.snapshots()] == [1, 1, 1]
+
+
+def test_bare_date_as_of_covers_the_whole_day(store):
+    store.record([{'title': 'A', 'detail_url': A, 'status': 'Open'}], taken_at=_at(1, 8))
+    store.record([{'title': 'A', 'detail_url': A, 'status': 'Ended'}], taken_at=_at(1, 23))
+
+    assert store.state_as_of('2024-12-31') == []
+    assert _state(store, '2025-01-01T12:00')[A]['status'] == 'Open'
+    assert _state(store, '2025-01-01')[A]['status'] == 'Ended'
+
+
+def test_empty_crawl_is_not_recorded(store):
+    assert store.record([], taken_at=_at(1)) is None
+    assert store.snapshots() == []
@@ -0,0 +1,38 @@
+import asyncio
+
+from aiohttp import web
+
+from image_cache import ImageCache
+
+
+DELAY = 0.3
+
+
+async def _images(request):
+    if request.path == '/missing.png':
+        return web.Response(status=404)
+    await asyncio.sleep(DELAY)
+    return web.Response(body=request.path.encode(), content_type='image/png')
+
+
+def test_download_counts_only_stored_images(tmp_path):
+    # Five slow images through one connection take longer than the timeout in
+    # total; only each request's own time counts against it
+    cache = ImageCache(str(tmp_path), per_host=1, timeout=DELAY * 2.5)
+
+    async def run():
+        app = web.Application()
+        app.router.add_get('/{path:.*}', _images)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        await site.start()
+        base = f"http://127.0.0.1:{runner.addresses[0][1]}"
+        try:
+            urls = [f"{base}/{n}.png" for n in range(5)] + [f"{base}/missing.png"]
+            return await cache.download(urls)
+        finally:
+            await runner.cleanup()
+
+    assert asyncio.run(run()) == 5
+    assert len(cache.index) == 5
@@ -0,0 +1,71 @@
+import asyncio
+import time
+
+from aiohttp import web
+
+from link_checker import LinkChecker
+
+
+DELAY = 0.5
+
+
+async def _serve(handler, check):
+    """Run `check(base_url)` against a local server answering every path with `handler`"""
+    app = web.Application()
+    app.router.add_get('/{path:.*}', handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    try:
+        return await check(f"http://127.0.0.1:{port}")
+    finally:
+        await runner.cleanup()
+
+
+async def _slow(request):
+    await asyncio.sleep(DELAY)
+    return web.Response(text='ok')
+
+
+def test_queued_links_do_not_time_out():
+    # One connection to the host and six slow pages: the last link waits far
+    # longer than the timeout, but only its own request counts against it
+    checker = LinkChecker(per_host=1, timeout=DELAY * 2.5, cache_file=None)
+    urls = [f"/page/{n}" for n in range(6)]
+
+    async def check(base):
+        started = time.perf_counter()
+        results = await checker.check_urls(base + url for url in urls)
+        return results, time.perf_counter() - started
+
+    results, elapsed = asyncio.run(_serve(_slow, check))
+
+    assert len(results) == 6
+    assert all(r['status'] == 200 and r['error'] is None for r in results.values())
+    assert all(r['latency_ms'] < DELAY * 2 * 1000 for r in results.values())
+    assert elapsed >= DELAY * 6
+
+
+def test_failures_are_rechecked():
+    async def flaky(request):
+        if request.path == '/down':
+            return web.Response(status=503)
+        return web.Response(text='ok')
+
+    checker = LinkChecker(ttl=3600, error_ttl=0, cache_file=None)
+
+    async def check(base):
+        return base, await checker.check_urls([base + '/up', base + '/down'])
+
+    base, results = asyncio.run(_serve(flaky, check))
+    now = time.time()
+
+    assert results[base + '/down']['status'] == 503
+    assert checker._is_fresh(base + '/up', now)
+    assert not checker._is_fresh(base + '/down', now)
+
+    checker.cache['http://127.0.0.1:9/gone'] = {'status': None, 'error': 'ClientConnectorError',
+                                                'checked_at': now}
+    assert not checker._is_fresh('http://127.0.0.1:9/gone', now)
@@ -0,0 +1,49 @@
+import pickle
+
+from analyze_data import filter_hackathons, get_statistics
+from models import Hackathon, as_record, is_online
+
+
+RECORD = {
+    'title': 'City Hack', 'status': 'Ended', 'themes': ['social', 'ai'],
+    'location': 'Berlin, Germany', 'website': None, 'prize_usd': 5000.0, 'slack': 'city-hack',
+}
+
+
+def test_round_trip_keeps_nulls_and_extra_keys():
+    h = Hackathon.from_dict(RECORD)
+    assert h.to_dict() == RECORD
+    assert pickle.loads(pickle.dumps(h)).to_dict() == RECORD
+
+
+def test_null_fields_are_absent_from_dict_accessors():
+    h = Hackathon.from_dict(RECORD)
+    assert h.website is None
+    assert 'website' not in h
+    assert h.get('website', 'none') == 'none'
+
+    h['website'] = 'https://example.com'
+    assert h.to_dict()['website'] == 'https://example.com'
+    h['organizer'] = None
+    assert h.to_dict()['organizer'] is None
+
+
+def test_themes_are_tuples_of_shared_strings():
+    a = Hackathon.from_dict(RECORD)
+    b = Hackathon.from_dict(dict(RECORD, themes=[''.join(['so', 'cial'])]))
+    assert a.themes == ('social', 'ai')
+    assert a.themes[0] is b.themes[0]
+
+
+def test_hot_paths_accept_dicts_and_records():
+    records = [Hackathon.from_dict(RECORD), dict(RECORD, status='Open', location='Online')]
+    assert as_record(records[0]) is records[0]
+    assert [is_online(h) for h in records] == [False, True]
+
+    matched = filter_hackathons(records, theme='ai', online=True)
+    assert matched == [records[1]]
+
+    stats = get_statistics(records)
+    assert stats['status'] == {'Ended': 1, 'Open': 1}
+    assert stats['themes'] == {'social': 2, 'ai': 2}
+    assert stats['with_website'] == 0
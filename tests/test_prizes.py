@@ -0,0 +1,38 @@
+import pytest
+
+from prizes import parse_prize
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('Rs. 50,000', (50000.0, 'INR')),
+    ('1st prize: Rs.25000', (25000.0, 'INR')),
+    ('Rs 2 lakh', (200000.0, 'INR')),
+    ('5000 Rs', (5000.0, 'INR')),
+    ('₹1,00,000', (100000.0, 'INR')),
+    ('$10k', (10000.0, 'USD')),
+    ('US$ 2,500', (2500.0, 'USD')),
+    ('€5 000', (5000.0, 'EUR')),
+    ('€5.000', (5000.0, 'EUR')),
+    ('10.000 EUR', (10000.0, 'EUR')),
+    ('Pool: €1.250.000.', (1250000.0, 'EUR')),
+    ('€5.000,50', (5000.5, 'EUR')),
+    ('$1.5k', (1500.0, 'USD')),
+    ('4000.00 USD', (4000.0, 'USD')),
+    ('Prize pool 10,000 USD', (10000.0, 'USD')),
+    ('A$500 and $300', (500.0, 'AUD')),
+])
+def test_parse_prize(text, expected):
+    assert parse_prize(text) == expected
+
+
+@pytest.mark.parametrize('text', [
+    'Winners 100',
+    'WINNERS 100',
+    'Partners 5k',
+    'Top 3 winners 2 prizes',
+    '30 Rsvp',
+    'rs 500',
+    None,
+])
+def test_words_ending_in_rs_are_not_rupees(text):
+    assert parse_prize(text) is None
@@ -0,0 +1,53 @@
+import json
+import shutil
+
+import result_cache
+from result_cache import ResultCache
+from visualize_data import _read_manifest, cached_visualizations
+
+
+def _hackathon(n):
+    return {'title': f"Hack {n}", 'status': 'Ended', 'themes': ['ai'], 'location': 'Online',
+            'dates': 'Mar 01, 2024'}
+
+
+def _dataset(path, size):
+    path.write_text(json.dumps([_hackathon(n) for n in range(size)]), encoding='utf-8')
+    return str(path)
+
+
+def test_reference_data_is_part_of_the_key(tmp_path, monkeypatch):
+    dataset = _dataset(tmp_path / 'a.json', 2)
+    rates = tmp_path / 'fx_rates.json'
+    shutil.copyfile(result_cache.FX_RATES_FILE, rates)
+    monkeypatch.setattr(result_cache, 'FX_RATES_FILE', str(rates))
+
+    cache = ResultCache(str(tmp_path / 'cache.db'))
+    cache.put('stats', dataset, {'total': 2})
+    assert cache.get('stats', dataset) == {'total': 2}
+    cache.close()
+
+    rates.write_text(json.dumps({'rates': {'USD': 1.0}}), encoding='utf-8')
+    cache = ResultCache(str(tmp_path / 'cache.db'))
+    assert cache.get('stats', dataset) is None
+    cache.close()
+
+
+def test_charts_of_another_dataset_are_not_reused(tmp_path):
+    a = _dataset(tmp_path / 'a.json', 2)
+    b = _dataset(tmp_path / 'b.json', 3)
+    output_dir = str(tmp_path / 'charts')
+    cache = ResultCache(str(tmp_path / 'cache.db'))
+
+    def shown_total():
+        with open(f"{output_dir}/dashboard_data.json", encoding='utf-8') as f:
+            return json.load(f)['total']
+
+    # A -> B -> A into the same directory: the last run must redraw A
+    for dataset, total in ((a, 2), (b, 3), (a, 2)):
+        insights = cached_visualizations(dataset, output_dir, cache, profile='html')
+        assert insights['total_hackathons'] == total
+        assert shown_total() == total
+        assert _read_manifest(output_dir) == {'dataset': cache.dataset_hash(dataset),
+                                              'profile': 'html'}
+    cache.close()
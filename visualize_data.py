@@ -1,72 +1,196 @@
 import json
-import matplotlib.pyplot as plt
-import seaborn as sns
-import pandas as pd
+import os
+import shutil
 from collections import Counter
 from datetime import datetime
 import re
 import warnings
 
+from analyze_data import iter_hackathons
+from geo import country_name, record_location
+from models import as_record
+from prizes import prize_distribution, prize_usd
+from result_cache import ResultCache, file_digest
+
 warnings.filterwarnings('ignore')
 
-# Set style for better-looking charts
-plt.style.use('seaborn-v0_8-darkgrid')
-sns.set_palette("husl")
+# matplotlib and seaborn are slow to import; they are loaded by
+# _setup_plotting() the first time a visualizer is created
+plt = None
+sns = None
+
+# Only the fields the charts use are kept; records are decoded whole, then pruned
+CHART_FIELDS = ('title', 'status', 'location_type', 'dates', 'location', 'themes',
+                'prizes', 'prize_usd', 'country_code', 'region_code', 'city')
+
+
+MONTH_ORDER = ['Jan', 'Feb', 'March', 'April', 'May', 'June',
+               'July', 'Aug', 'Sept', 'Oct', 'Nov', 'Dec']
+
+# How charts are written. 'html' skips matplotlib entirely and writes a
+# static dashboard that reads a small pre-aggregated data file.
+RENDER_PROFILES = {
+    'full': {'format': 'png', 'dpi': 300, 'bbox_inches': 'tight'},
+    'draft': {'format': 'png', 'dpi': 72, 'bbox_inches': None},
+    'svg': {'format': 'svg', 'dpi': 72, 'bbox_inches': 'tight'},
+    'html': None,
+}
+
+DASHBOARD_TEMPLATE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'dashboard.html')
+
+# Written into the output directory: which dataset and profile its charts show
+CHARTS_MANIFEST = '.charts_manifest.json'
+
+
+def _year_month(dates_str):
+    """Year and month number (1-12) mentioned in a dates string, None when absent"""
+    year_match = re.search(r'20\d{2}', dates_str)
+    year = int(year_match.group()) if year_match else None
+    for month_num, month_name in enumerate(MONTH_ORDER, 1):
+        if month_name in dates_str:
+            return year, month_num
+    return year, None
+
+
+def _format_usd(amount):
+    """Short dollar label for big-number panels, e.g. $1.2M or $45k"""
+    if amount >= 1_000_000:
+        return f"${amount / 1_000_000:.1f}M"
+    if amount >= 1_000:
+        return f"${amount / 1_000:.0f}k"
+    return f"${amount:.0f}"
+
+
+def _setup_plotting():
+    """Import the plotting stack and apply the chart style once"""
+    global plt, sns
+    if plt is not None:
+        return
+
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    # Set style for better-looking charts
+    plt.style.use('seaborn-v0_8-darkgrid')
+    sns.set_palette("husl")
+
+
+def aggregate_hackathons(hackathons):
+    """
+    Every count the charts need, from a single pass over the records
+
+    Records are consumed one at a time, so a streamed iter_hackathons() is
+    never held in memory.
+    """
+    agg = {
+        'total': 0,
+        'themes': Counter(),
+        'theme_total': 0,
+        'theme_pairs': Counter(),
+        'years': Counter(),
+        'months': Counter(),
+        'online': 0,
+        'in_person': 0,
+        'countries': Counter(),
+        'cities': Counter(),
+        'prize_values': [],
+    }
+
+    for h in hackathons:
+        h = as_record(h)
+        agg['total'] += 1
+
+        themes = h.themes or ()
+        agg['themes'].update(themes)
+        agg['theme_total'] += len(themes)
+        for i in range(len(themes)):
+            for j in range(i + 1, len(themes)):
+                agg['theme_pairs'][tuple(sorted([themes[i], themes[j]]))] += 1
+
+        year, month = _year_month(h.dates or '')
+        if year:
+            agg['years'][year] += 1
+        if month:
+            agg['months'][month] += 1
+
+        place = record_location(h)
+        if place.get('country_code') == 'ONLINE':
+            agg['online'] += 1
+        elif (h.location or '').strip():
+            agg['in_person'] += 1
+            # Aliases such as "USA" and "United States" share one code
+            if place.get('country_code'):
+                agg['countries'][country_name(place['country_code'])] += 1
+            if place.get('city'):
+                agg['cities'][place['city']] += 1
+
+        usd = prize_usd(h)
+        if usd:
+            agg['prize_values'].append(usd)
+
+    return agg
 
 
 class HackathonVisualizer:
     """Generate insightful visualizations from hackathon data"""
 
-    def __init__(self, json_file='remote_hackathons.json'):
-        """Load and prepare data"""
-        with open(json_file, 'r', encoding='utf-8') as f:
-            self.hackathons = json.load(f)
-        self.df = self._prepare_dataframe()
-
-    def _prepare_dataframe(self):
-        """Convert hackathons to pandas DataFrame"""
-        data = []
-        for h in self.hackathons:
-            row = {
-                'title': h.get('title', ''),
-                'status': h.get('status', 'Unknown'),
-                'location_type': h.get('location_type', 'Unknown'),
-                'dates': h.get('dates', ''),
-                'location': h.get('location', ''),
-                'themes': h.get('themes', []),
-                'num_themes': len(h.get('themes', [])),
-            }
+    def __init__(self, json_file='remote_hackathons.json', profile='full'):
+        """
+        Load and prepare data
 
-            # Extract year from dates
-            dates_str = h.get('dates', '')
-            year_match = re.search(r'20\d{2}', dates_str)
-            if year_match:
-                row['year'] = int(year_match.group())
-            else:
-                row['year'] = None
-
-            # Extract month
-            months = {
-                'Jan': 1, 'Feb': 2, 'March': 3, 'April': 4, 'May': 5, 'June': 6,
-                'July': 7, 'Aug': 8, 'Sept': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
-            }
-            for month_name, month_num in months.items():
-                if month_name in dates_str:
-                    row['month'] = month_num
-                    row['month_name'] = month_name
-                    break
-            else:
-                row['month'] = None
-                row['month_name'] = 'Unknown'
+        Args:
+            profile: One of RENDER_PROFILES: 'full' (300 dpi PNG), 'draft'
+                (72 dpi PNG, no tight bounding box), 'svg', or 'html'
+                (static dashboard over pre-aggregated JSON, no matplotlib)
+        """
+        if profile not in RENDER_PROFILES:
+            raise ValueError(f"Unknown render profile {profile!r}, expected one of {list(RENDER_PROFILES)}")
+        self.json_file = json_file
+        self.profile = profile
+        self.aggregates = aggregate_hackathons(iter_hackathons(json_file, fields=CHART_FIELDS))
+        self.total = self.aggregates['total']
+        if RENDER_PROFILES[profile] is not None:
+            _setup_plotting()
+
+    def _yearly_counts(self):
+        return sorted(self.aggregates['years'].items())
+
+    def _monthly_counts(self):
+        months = self.aggregates['months']
+        return [(MONTH_ORDER[month - 1], months[month]) for month in range(1, 13) if month in months]
+
+    def _chart_name(self, name):
+        return f"{name}.{RENDER_PROFILES[self.profile]['format']}"
+
+    def _savefig(self, output_dir, name):
+        settings = RENDER_PROFILES[self.profile]
+        plt.savefig(f'{output_dir}/{self._chart_name(name)}', format=settings['format'],
+                    dpi=settings['dpi'], bbox_inches=settings['bbox_inches'])
 
-            data.append(row)
+    def generate_all_visualizations(self, output_dir='charts'):
+        """
+        Generate all visualizations and return insights
+
+        A manifest naming the dataset and profile is written next to the
+        charts once they are all saved, so cached_visualizations can tell
+        whose charts are in the directory.
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        manifest = os.path.join(output_dir, CHARTS_MANIFEST)
+        # The charts are about to be overwritten and match no dataset until done
+        if os.path.exists(manifest):
+            os.remove(manifest)
+        insights = self._render(output_dir)
+        with open(manifest, 'w', encoding='utf-8') as f:
+            json.dump({'dataset': file_digest(self.json_file), 'profile': self.profile}, f)
+        return insights
 
-        return pd.DataFrame(data)
+    def _render(self, output_dir):
+        if self.profile == 'html':
+            return self.generate_html_dashboard(output_dir)
 
-    def generate_all_visualizations(self, output_dir='charts'):
-        """Generate all visualizations and return insights"""
         insights = {
-            'total_hackathons': len(self.hackathons),
+            'total_hackathons': self.total,
             'charts_generated': []
         }
 
@@ -75,44 +199,39 @@ class HackathonVisualizer:
         # 1. Theme Popularity
         print("  1. Theme popularity chart...")
         insights['top_themes'] = self._plot_theme_popularity(output_dir)
-        insights['charts_generated'].append('01_theme_popularity.png')
+        insights['charts_generated'].append(self._chart_name('01_theme_popularity'))
 
         # 2. Yearly Trends
         print("  2. Yearly trends chart...")
         insights['yearly_trends'] = self._plot_yearly_trends(output_dir)
-        insights['charts_generated'].append('02_yearly_trends.png')
+        insights['charts_generated'].append(self._chart_name('02_yearly_trends'))
 
         # 3. Monthly Distribution
         print("  3. Monthly distribution chart...")
         insights['peak_months'] = self._plot_monthly_distribution(output_dir)
-        insights['charts_generated'].append('03_monthly_distribution.png')
+        insights['charts_generated'].append(self._chart_name('03_monthly_distribution'))
 
         # 4. Geographic Distribution
         print("  4. Geographic distribution chart...")
         insights['geographic_insights'] = self._plot_geographic_distribution(output_dir)
-        insights['charts_generated'].append('04_geographic_distribution.png')
+        insights['charts_generated'].append(self._chart_name('04_geographic_distribution'))
 
         # 5. Theme Combinations
         print("  5. Theme combinations chart...")
         insights['theme_combinations'] = self._plot_theme_combinations(output_dir)
-        insights['charts_generated'].append('05_theme_combinations.png')
+        insights['charts_generated'].append(self._chart_name('05_theme_combinations'))
 
         # 6. Comprehensive Dashboard
         print("  6. Comprehensive dashboard...")
         self._plot_dashboard(output_dir)
-        insights['charts_generated'].append('06_dashboard.png')
+        insights['charts_generated'].append(self._chart_name('06_dashboard'))
 
         print(f"\nAll visualizations saved to '{output_dir}/' directory")
         return insights
 
     def _plot_theme_popularity(self, output_dir):
         """Plot theme popularity"""
-        theme_counter = Counter()
-        for h in self.hackathons:
-            for theme in h.get('themes', []):
-                theme_counter[theme] += 1
-
-        top_themes = theme_counter.most_common(15)
+        top_themes = self.aggregates['themes'].most_common(15)
         themes, counts = zip(*top_themes)
 
         fig, ax = plt.subplots(figsize=(12, 6))
@@ -128,18 +247,17 @@ class HackathonVisualizer:
             ax.text(count + 0.3, i, str(count), va='center', fontweight='bold')
 
         plt.tight_layout()
-        plt.savefig(f'{output_dir}/01_theme_popularity.png', dpi=300, bbox_inches='tight')
+        self._savefig(output_dir, '01_theme_popularity')
         plt.close()
 
         return dict(top_themes[:5])
 
     def _plot_yearly_trends(self, output_dir):
         """Plot yearly trends"""
-        yearly_data = self.df[self.df['year'].notna()].groupby('year').size()
+        yearly_data = self._yearly_counts()
 
         fig, ax = plt.subplots(figsize=(12, 6))
-        years = yearly_data.index
-        counts = yearly_data.values
+        years, counts = zip(*yearly_data)
 
         ax.plot(years, counts, marker='o', linewidth=2.5, markersize=10, color='#2E86AB')
         ax.fill_between(years, counts, alpha=0.3, color='#2E86AB')
@@ -154,74 +272,52 @@ class HackathonVisualizer:
             ax.text(year, count + 1, str(count), ha='center', fontweight='bold')
 
         plt.tight_layout()
-        plt.savefig(f'{output_dir}/02_yearly_trends.png', dpi=300, bbox_inches='tight')
+        self._savefig(output_dir, '02_yearly_trends')
         plt.close()
 
-        peak_year = int(yearly_data.idxmax())
+        peak_year, peak_count = max(yearly_data, key=lambda item: item[1])
         return {
             'peak_year': peak_year,
-            'peak_count': int(yearly_data.max()),
+            'peak_count': peak_count,
             'trend': 'growing' if counts[-1] > counts[0] else 'declining'
         }
 
     def _plot_monthly_distribution(self, output_dir):
         """Plot monthly distribution"""
-        monthly_data = self.df[self.df['month'].notna()].groupby('month_name').size()
-
-        # Order by month
-        month_order = ['Jan', 'Feb', 'March', 'April', 'May', 'June',
-                       'July', 'Aug', 'Sept', 'Oct', 'Nov', 'Dec']
-        monthly_data = monthly_data.reindex([m for m in month_order if m in monthly_data.index])
+        # Ordered by month
+        monthly_data = self._monthly_counts()
+        month_names, month_counts = zip(*monthly_data)
 
         fig, ax = plt.subplots(figsize=(12, 6))
-        bars = ax.bar(range(len(monthly_data)), monthly_data.values,
+        bars = ax.bar(range(len(monthly_data)), month_counts,
                       color=sns.color_palette("coolwarm", len(monthly_data)))
         ax.set_xticks(range(len(monthly_data)))
-        ax.set_xticklabels(monthly_data.index, rotation=45, ha='right')
+        ax.set_xticklabels(month_names, rotation=45, ha='right')
         ax.set_xlabel('Month', fontsize=12, fontweight='bold')
         ax.set_ylabel('Number of Hackathons', fontsize=12, fontweight='bold')
         ax.set_title('Hackathon Distribution by Month', fontsize=14, fontweight='bold', pad=20)
 
         # Add value labels
-        for i, (bar, count) in enumerate(zip(bars, monthly_data.values)):
+        for i, (bar, count) in enumerate(zip(bars, month_counts)):
             ax.text(i, count + 0.3, str(count), ha='center', fontweight='bold')
 
         plt.tight_layout()
-        plt.savefig(f'{output_dir}/03_monthly_distribution.png', dpi=300, bbox_inches='tight')
+        self._savefig(output_dir, '03_monthly_distribution')
         plt.close()
 
-        peak_month = monthly_data.idxmax()
+        peak_month, peak_count = max(monthly_data, key=lambda item: item[1])
         return {
             'peak_month': peak_month,
-            'peak_count': int(monthly_data.max()),
-            'slowest_month': monthly_data.idxmin()
+            'peak_count': peak_count,
+            'slowest_month': min(monthly_data, key=lambda item: item[1])[0]
         }
 
     def _plot_geographic_distribution(self, output_dir):
         """Plot geographic distribution and online vs in-person split"""
-        # Analyze locations
-        online_count = 0
-        in_person_count = 0
-        countries = Counter()
-        cities = Counter()
-
-        for h in self.hackathons:
-            location = h.get('location', '').strip()
-
-            if location.lower() == 'online':
-                online_count += 1
-            elif location.lower() == 'in-person' or location:
-                in_person_count += 1
-                # Extract country/city info
-                if location.lower() != 'in-person':
-                    parts = [p.strip() for p in location.split(',')]
-                    if len(parts) >= 2:
-                        country = parts[-1]
-                        city = parts[0]
-                        countries[country] += 1
-                        cities[city] += 1
-                    elif len(parts) == 1:
-                        countries[parts[0]] += 1
+        online_count = self.aggregates['online']
+        in_person_count = self.aggregates['in_person']
+        countries = self.aggregates['countries']
+        cities = self.aggregates['cities']
 
         fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(14, 10))
 
@@ -272,11 +368,11 @@ class HackathonVisualizer:
         stats_text = f"""
         GLOBAL REACH STATISTICS
 
-        Total Hackathons: {len(self.hackathons)}
+        Total Hackathons: {self.total}
 
         Format Split:
-        • Online: {online_count} ({online_count/len(self.hackathons)*100:.1f}%)
-        • In-Person: {in_person_count} ({in_person_count/len(self.hackathons)*100:.1f}%)
+        • Online: {online_count} ({online_count/self.total*100:.1f}%)
+        • In-Person: {in_person_count} ({in_person_count/self.total*100:.1f}%)
 
         Geographic Coverage:
         • Countries: {len(countries)}
@@ -289,13 +385,13 @@ class HackathonVisualizer:
                 fontfamily='monospace', bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.3))
 
         plt.tight_layout()
-        plt.savefig(f'{output_dir}/04_geographic_distribution.png', dpi=300, bbox_inches='tight')
+        self._savefig(output_dir, '04_geographic_distribution')
         plt.close()
 
         return {
             'online_count': online_count,
             'in_person_count': in_person_count,
-            'online_percentage': round(online_count/len(self.hackathons)*100, 1),
+            'online_percentage': round(online_count/self.total*100, 1),
             'countries': len(countries),
             'cities': len(cities),
             'top_country': countries.most_common(1)[0] if countries else ('Unknown', 0)
@@ -303,17 +399,8 @@ class HackathonVisualizer:
 
     def _plot_theme_combinations(self, output_dir):
         """Plot theme combinations"""
-        # Find most common theme pairs
-        theme_pairs = Counter()
-        for h in self.hackathons:
-            themes = h.get('themes', [])
-            if len(themes) >= 2:
-                for i in range(len(themes)):
-                    for j in range(i + 1, len(themes)):
-                        pair = tuple(sorted([themes[i], themes[j]]))
-                        theme_pairs[pair] += 1
-
-        top_pairs = theme_pairs.most_common(10)
+        # Most common theme pairs
+        top_pairs = self.aggregates['theme_pairs'].most_common(10)
 
         if not top_pairs:
             # No pairs found, skip
@@ -336,19 +423,19 @@ class HackathonVisualizer:
             ax.text(count + 0.1, i, str(count), va='center', fontweight='bold')
 
         plt.tight_layout()
-        plt.savefig(f'{output_dir}/05_theme_combinations.png', dpi=300, bbox_inches='tight')
+        self._savefig(output_dir, '05_theme_combinations')
         plt.close()
 
         return {str(pair): count for pair, count in top_pairs[:3]}
 
     def _plot_dashboard(self, output_dir):
         """Create a comprehensive dashboard"""
-        fig = plt.figure(figsize=(16, 10))
-        gs = fig.add_gridspec(3, 3, hspace=0.3, wspace=0.3)
+        fig = plt.figure(figsize=(18, 10))
+        gs = fig.add_gridspec(3, 4, hspace=0.3, wspace=0.3)
 
         # 1. Total Hackathons (Big Number)
         ax1 = fig.add_subplot(gs[0, 0])
-        ax1.text(0.5, 0.5, str(len(self.hackathons)),
+        ax1.text(0.5, 0.5, str(self.total),
                 ha='center', va='center', fontsize=60, fontweight='bold', color='#2E86AB')
         ax1.text(0.5, 0.2, 'Total Hackathons',
                 ha='center', va='center', fontsize=14, color='gray')
@@ -356,10 +443,7 @@ class HackathonVisualizer:
 
         # 2. Unique Themes
         ax2 = fig.add_subplot(gs[0, 1])
-        all_themes = set()
-        for h in self.hackathons:
-            all_themes.update(h.get('themes', []))
-        ax2.text(0.5, 0.5, str(len(all_themes)),
+        ax2.text(0.5, 0.5, str(len(self.aggregates['themes'])),
                 ha='center', va='center', fontsize=60, fontweight='bold', color='#A23B72')
         ax2.text(0.5, 0.2, 'Unique Themes',
                 ha='center', va='center', fontsize=14, color='gray')
@@ -367,20 +451,25 @@ class HackathonVisualizer:
 
         # 3. Average Themes per Hackathon
         ax3 = fig.add_subplot(gs[0, 2])
-        avg_themes = self.df['num_themes'].mean()
+        avg_themes = self.aggregates['theme_total'] / self.total
         ax3.text(0.5, 0.5, f"{avg_themes:.1f}",
                 ha='center', va='center', fontsize=60, fontweight='bold', color='#F18F01')
         ax3.text(0.5, 0.2, 'Avg Themes/Hackathon',
                 ha='center', va='center', fontsize=14, color='gray')
         ax3.axis('off')
 
-        # 4. Top 10 Themes
+        # 4. Total Prize Pool
+        prizes = prize_distribution(self.aggregates['prize_values'])
+        ax7 = fig.add_subplot(gs[0, 3])
+        ax7.text(0.5, 0.5, _format_usd(prizes['total_usd']),
+                ha='center', va='center', fontsize=44, fontweight='bold', color='#3B8B5A')
+        ax7.text(0.5, 0.2, f"Prize Money ({prizes['count']} events)",
+                ha='center', va='center', fontsize=14, color='gray')
+        ax7.axis('off')
+
+        # 5. Top 10 Themes
         ax4 = fig.add_subplot(gs[1, :])
-        theme_counter = Counter()
-        for h in self.hackathons:
-            for theme in h.get('themes', []):
-                theme_counter[theme] += 1
-        top_10_themes = theme_counter.most_common(10)
+        top_10_themes = self.aggregates['themes'].most_common(10)
         themes, counts = zip(*top_10_themes)
         bars = ax4.bar(range(len(themes)), counts, color=sns.color_palette("viridis", len(themes)))
         ax4.set_xticks(range(len(themes)))
@@ -390,27 +479,21 @@ class HackathonVisualizer:
         for i, (bar, count) in enumerate(zip(bars, counts)):
             ax4.text(i, count + 0.3, str(count), ha='center', fontsize=9, fontweight='bold')
 
-        # 5. Yearly Trends
+        # 6. Yearly Trends
         ax5 = fig.add_subplot(gs[2, :2])
-        yearly_data = self.df[self.df['year'].notna()].groupby('year').size()
-        ax5.plot(yearly_data.index, yearly_data.values, marker='o',
+        years, year_counts = zip(*self._yearly_counts())
+        ax5.plot(years, year_counts, marker='o',
                 linewidth=2.5, markersize=8, color='#2E86AB')
-        ax5.fill_between(yearly_data.index, yearly_data.values, alpha=0.3, color='#2E86AB')
+        ax5.fill_between(years, year_counts, alpha=0.3, color='#2E86AB')
         ax5.set_xlabel('Year', fontweight='bold')
         ax5.set_ylabel('Count', fontweight='bold')
         ax5.set_title('Yearly Trends', fontweight='bold', fontsize=12)
         ax5.grid(True, alpha=0.3)
 
-        # 6. Online vs In-Person Split
+        # 7. Online vs In-Person Split
         ax6 = fig.add_subplot(gs[2, 2])
-        online_count = 0
-        in_person_count = 0
-        for h in self.hackathons:
-            location = h.get('location', '').strip().lower()
-            if location == 'online':
-                online_count += 1
-            elif location:
-                in_person_count += 1
+        online_count = self.aggregates['online']
+        in_person_count = self.aggregates['in_person']
 
         if online_count + in_person_count > 0:
             colors = ['#2E86AB', '#A23B72']
@@ -424,11 +507,106 @@ class HackathonVisualizer:
             )
         ax6.set_title('Format Distribution', fontweight='bold', fontsize=12)
 
+        # 8. Prize Distribution
+        ax8 = fig.add_subplot(gs[2, 3])
+        buckets = prizes['buckets']
+        ax8.bar(range(len(buckets)), list(buckets.values()),
+                color=sns.color_palette("crest", len(buckets)))
+        ax8.set_xticks(range(len(buckets)))
+        # Escape '$' so matplotlib does not read the labels as mathtext
+        ax8.set_xticklabels([label.replace('$', r'\$') for label in buckets],
+                            rotation=45, ha='right', fontsize=8)
+        ax8.set_ylabel('Count', fontweight='bold')
+        ax8.set_title('Prize Distribution (USD)', fontweight='bold', fontsize=12)
+
         fig.suptitle('Hackathon Data Dashboard', fontsize=18, fontweight='bold', y=0.98)
-        plt.savefig(f'{output_dir}/06_dashboard.png', dpi=300, bbox_inches='tight')
+        self._savefig(output_dir, '06_dashboard')
         plt.close()
 
-    def generate_insights_report(self, insights):
+    def dashboard_aggregates(self):
+        """Every number shown on the HTML dashboard, as JSON-serialisable data"""
+        agg = self.aggregates
+        total = self.total
+        return {
+            'generated_at': datetime.now().isoformat(timespec='seconds'),
+            'total': total,
+            'unique_themes': len(agg['themes']),
+            'avg_themes': round(agg['theme_total'] / total, 1) if total else 0,
+            'prizes': prize_distribution(agg['prize_values']),
+            'themes': agg['themes'].most_common(15),
+            'theme_pairs': [(f"{a} + {b}", count) for (a, b), count in agg['theme_pairs'].most_common(10)],
+            'years': self._yearly_counts(),
+            'months': self._monthly_counts(),
+            'format': {'online': agg['online'], 'in_person': agg['in_person']},
+            'countries': agg['countries'].most_common(10),
+            'cities': agg['cities'].most_common(10),
+            'country_count': len(agg['countries']),
+            'city_count': len(agg['cities']),
+        }
+
+    @staticmethod
+    def _insights_from_aggregates(data):
+        """The insights generate_all_visualizations returns, from dashboard_aggregates"""
+        insights = {
+            'total_hackathons': data['total'],
+            'top_themes': dict(data['themes'][:5]),
+        }
+        if data['years']:
+            peak_year, peak_count = max(data['years'], key=lambda item: item[1])
+            insights['yearly_trends'] = {
+                'peak_year': peak_year,
+                'peak_count': peak_count,
+                'trend': 'growing' if data['years'][-1][1] > data['years'][0][1] else 'declining'
+            }
+        if data['months']:
+            insights['peak_months'] = {
+                'peak_month': max(data['months'], key=lambda item: item[1])[0],
+                'peak_count': max(count for _, count in data['months']),
+                'slowest_month': min(data['months'], key=lambda item: item[1])[0]
+            }
+        online, in_person = data['format']['online'], data['format']['in_person']
+        insights['geographic_insights'] = {
+            'online_count': online,
+            'in_person_count': in_person,
+            'online_percentage': round(online / data['total'] * 100, 1) if data['total'] else 0,
+            'countries': data['country_count'],
+            'cities': data['city_count'],
+            'top_country': tuple(data['countries'][0]) if data['countries'] else ('Unknown', 0)
+        }
+        insights['theme_combinations'] = {
+            str(tuple(label.split(' + '))): count for label, count in data['theme_pairs'][:3]
+        }
+        return insights
+
+    def generate_html_dashboard(self, output_dir='charts'):
+        """
+        Write the static HTML dashboard and the aggregates it displays
+
+        dashboard.html is a fixed page; each refresh only rewrites the few
+        KB of dashboard_data.json / dashboard_data.js it reads. The .js copy
+        lets the page work when opened straight from disk.
+        """
+        print("Generating HTML dashboard...")
+        os.makedirs(output_dir, exist_ok=True)
+        data = self.dashboard_aggregates()
+        payload = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+
+        with open(os.path.join(output_dir, 'dashboard_data.json'), 'w', encoding='utf-8') as f:
+            f.write(payload)
+        with open(os.path.join(output_dir, 'dashboard_data.js'), 'w', encoding='utf-8') as f:
+            f.write(f"window.DASHBOARD_DATA = {payload};\n")
+
+        page = os.path.join(output_dir, 'dashboard.html')
+        if not os.path.exists(page) or os.path.getmtime(page) < os.path.getmtime(DASHBOARD_TEMPLATE):
+            shutil.copyfile(DASHBOARD_TEMPLATE, page)
+
+        insights = self._insights_from_aggregates(data)
+        insights['charts_generated'] = ['dashboard.html', 'dashboard_data.json', 'dashboard_data.js']
+        print(f"\nDashboard saved to '{output_dir}/dashboard.html' ({len(payload)} bytes of data)")
+        return insights
+
+    @staticmethod
+    def generate_insights_report(insights):
         """Generate a text report of insights"""
         report = []
         report.append("=" * 70)
@@ -473,7 +651,7 @@ class HackathonVisualizer:
 
         report.append("💡 KEY INSIGHTS")
         report.append("-" * 70)
-        report.append(self._generate_key_insights(insights))
+        report.append(HackathonVisualizer._generate_key_insights(insights))
         report.append("")
 
         report.append("📁 Generated Charts:")
@@ -485,7 +663,8 @@ class HackathonVisualizer:
 
         return "\n".join(report)
 
-    def _generate_key_insights(self, insights):
+    @staticmethod
+    def _generate_key_insights(insights):
         """Generate key insights based on data"""
         insights_text = []
 
@@ -515,6 +694,41 @@ class HackathonVisualizer:
         return "\n".join(insights_text)
 
 
+def _read_manifest(output_dir):
+    try:
+        with open(os.path.join(output_dir, CHARTS_MANIFEST), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def cached_visualizations(json_file='remote_hackathons.json', output_dir='charts', cache=None,
+                          profile='full'):
+    """
+    Insights from generate_all_visualizations, reusing the last run's charts
+
+    With a ResultCache the dataset is neither loaded nor re-plotted while
+    the file is unchanged, the chart manifest says the charts in
+    `output_dir` were drawn from this dataset with this profile, and every
+    chart from the cached run is still on disk.
+    """
+    if cache is not None:
+        insights = cache.get('generate_all_visualizations', json_file,
+                             output_dir=output_dir, profile=profile)
+        expected = {'dataset': cache.dataset_hash(json_file), 'profile': profile}
+        if (insights and _read_manifest(output_dir) == expected
+                and all(os.path.exists(os.path.join(output_dir, chart))
+                        for chart in insights['charts_generated'])):
+            print(f"Dataset unchanged, reusing charts in '{output_dir}/'")
+            return insights
+
+    insights = HackathonVisualizer(json_file, profile).generate_all_visualizations(output_dir)
+    if cache is not None:
+        cache.put('generate_all_visualizations', json_file, insights,
+                  output_dir=output_dir, profile=profile)
+    return insights
+
+
 def main():
     """Main function"""
     print("=" * 70)
@@ -522,15 +736,12 @@ def main():
     print("=" * 70)
     print()
 
-    # Create visualizer
-    viz = HackathonVisualizer('remote_hackathons.json')
-
-    # Generate all visualizations
-    insights = viz.generate_all_visualizations('charts')
+    # Generate all visualizations (skipped while the dataset is unchanged)
+    insights = cached_visualizations('remote_hackathons.json', 'charts', ResultCache())
 
     # Generate and print insights report
     print()
-    report = viz.generate_insights_report(insights)
+    report = HackathonVisualizer.generate_insights_report(insights)
     print(report)
 
     # Save report to file